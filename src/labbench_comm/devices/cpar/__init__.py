@@ -35,6 +35,13 @@ from .definitions import (
 
 from .waveform import WaveformInstruction
 from .instruction_codec import InstructionCodec
+from .profile_compiler import CompiledProfile, ProfileCompiler
+from .waveform_simulator import (
+    SimulatedWaveform,
+    SimulationBatch,
+    Trigger,
+    WaveformSimulator,
+)
 
 # ----------------------------------------------------------------------
 # Functions
@@ -53,6 +60,7 @@ from .functions import (
 # ----------------------------------------------------------------------
 
 from .messages import (
+    CPARplusStatus,
     StatusMessage,
     EventMessage,
 )
@@ -78,6 +86,12 @@ __all__ = [
     # Waveform
     "WaveformInstruction",
     "InstructionCodec",
+    "CompiledProfile",
+    "ProfileCompiler",
+    "SimulatedWaveform",
+    "SimulationBatch",
+    "Trigger",
+    "WaveformSimulator",
 
     # Functions
     "SetWaveformProgram",
@@ -87,6 +101,7 @@ __all__ = [
     "ClearWaveformPrograms",
 
     # Messages
+    "CPARplusStatus",
     "StatusMessage",
     "EventMessage",
 ]
@@ -10,7 +10,9 @@ from labbench_comm.protocols.device import Device
 from labbench_comm.protocols.device_function import DeviceFunction
 from labbench_comm.protocols.functions.device_identification import DeviceIdentification
 from labbench_comm.protocols.functions.ping import Ping
+from labbench_comm.protocols.scheduler import Priority
 from labbench_comm.devices.cpar.messages import (
+    CPARplusStatus,
     StatusMessage,
     EventMessage,
 )
@@ -18,10 +20,7 @@ from labbench_comm.devices.cpar.definitions import (
     DeviceState,
     EcpError,
 )
-from labbench_comm.devices.cpar.stimulation_data import (
-    StimulationSample,
-    StimulationData
-)
+from labbench_comm.devices.cpar.stimulation_data import StimulationData
 from labbench_comm.devices.cpar.instruction_codec import InstructionCodec
 from labbench_comm.protocols.manufacturer import Manufacturer
 
@@ -43,6 +42,8 @@ class CPARplusCentral(Device):
 
         # --- Runtime state ---
         self.state: Optional[DeviceState] = None
+        # Latest status message, decoded
+        self.status: Optional[CPARplusStatus] = None
 
         self.actual_pressure_01 = 0.0
         self.target_pressure_01 = 0.0
@@ -88,21 +89,25 @@ class CPARplusCentral(Device):
         if message is None:
             return
 
-        self.actual_pressure_01 = message.actual_pressure_01
-        self.target_pressure_01 = message.target_pressure_01
-        self.final_pressure_01 = message.final_pressure_01
+        # Decoded once; everything below reads plain attributes
+        status = message.status
+        self.status = status
+
+        self.actual_pressure_01 = status.actual_pressure_01
+        self.target_pressure_01 = status.target_pressure_01
+        self.final_pressure_01 = status.final_pressure_01
 
-        self.actual_pressure_02 = message.actual_pressure_02
-        self.target_pressure_02 = message.target_pressure_02
-        self.final_pressure_02 = message.final_pressure_02
+        self.actual_pressure_02 = status.actual_pressure_02
+        self.target_pressure_02 = status.target_pressure_02
+        self.final_pressure_02 = status.final_pressure_02
 
-        self.response_connected = message.vas_connected
-        self.vas_is_low = message.vas_is_low
-        self.vas_score = message.vas_score
-        self.final_vas_score = message.final_vas_score
+        self.response_connected = status.vas_connected
+        self.vas_is_low = status.vas_is_low
+        self.vas_score = status.vas_score
+        self.final_vas_score = status.final_vas_score
 
         previous_state = self.state
-        self.state = message.system_state
+        self.state = status.system_state
 
         # --- state transition tracking ---
         if (
@@ -124,16 +129,16 @@ class CPARplusCentral(Device):
         # -----------------------------
         if (self.state == DeviceState.STATE_STIMULATING):
             if (self._current_stimulation_data is not None):
-                self._current_stimulation_data.add_sample(StimulationSample(
-                    actual_pressure_01=message.actual_pressure_01,
-                    target_pressure_01=message.target_pressure_01,
-                    final_pressure_01=message.final_pressure_01,
-                    actual_pressure_02=message.actual_pressure_02,
-                    target_pressure_02=message.target_pressure_02,
-                    final_pressure_02=message.final_pressure_02,
-                    vas_score=message.vas_score,
-                    final_vas_score=message.final_vas_score,
-                ))  
+                self._current_stimulation_data.add_values(
+                    status.actual_pressure_01,
+                    status.target_pressure_01,
+                    status.final_pressure_01,
+                    status.actual_pressure_02,
+                    status.target_pressure_02,
+                    status.final_pressure_02,
+                    status.vas_score,
+                    status.final_vas_score,
+                )
 
         for cb in self.status_received:
             cb(self, message)
@@ -220,7 +225,7 @@ class CPARplusCentral(Device):
         try:
             while not self._ping_stop_event.is_set():
                 try:
-                    await self.ping()
+                    await self.ping(Priority.BACKGROUND)
                 except Exception as exc:
                     self._logger.warning("Background ping failed: %s", exc)
 
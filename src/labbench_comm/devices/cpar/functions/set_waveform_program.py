@@ -91,10 +91,9 @@ class SetWaveformProgram(DeviceFunction):
     # ------------------------------------------------------------------
 
     def serialize_instructions(self) -> bytes:
-        encoded = bytearray()
-        for instr in self.instructions[: self.number_of_instructions]:
-            encoded.extend(InstructionCodec.encode(instr))
-        return bytes(encoded)
+        return InstructionCodec.encode_many(
+            self.instructions[: self.number_of_instructions]
+        )
 
     # ------------------------------------------------------------------
     # Lifecycle hooks
@@ -110,9 +109,7 @@ class SetWaveformProgram(DeviceFunction):
 
         self.request.insert_byte(0, self.channel)
         self.request.insert_byte(1, self.repeat)
-
-        for i, b in enumerate(encoded):
-            self.request.insert_byte(i + 2, b)
+        self.request.insert_bytes(2, encoded)
 
     def on_slave_received(self) -> None:
         if self.request is None:
@@ -121,18 +118,10 @@ class SetWaveformProgram(DeviceFunction):
         self.channel = self.request.get_byte(0)
         self.repeat = self.request.get_byte(1)
 
-        self.instructions.clear()
-
-        offset = 2
         count = (self.request.length - 2) // InstructionCodec.INSTRUCTIONS_LENGTH
-
-        for _ in range(count):
-            chunk = bytes(
-                self.request.get_byte(offset + i)
-                for i in range(InstructionCodec.INSTRUCTIONS_LENGTH)
-            )
-            self.instructions.append(InstructionCodec.decode(chunk))
-            offset += InstructionCodec.INSTRUCTIONS_LENGTH
+        self.instructions[:] = InstructionCodec.decode_many(
+            self.request.get_bytes(2, count * InstructionCodec.INSTRUCTIONS_LENGTH)
+        )
 
     # ------------------------------------------------------------------
     # Representation
@@ -1,5 +1,6 @@
 from labbench_comm.protocols.device_function import DeviceFunction
 from labbench_comm.protocols.function_dispatcher import FunctionDispatcher
+from labbench_comm.protocols.layout import Field, Layout
 
 from labbench_comm.devices.cpar.definitions import (
     StopCriterion,
@@ -8,6 +9,14 @@ from labbench_comm.devices.cpar.definitions import (
 
 
 class StartStimulation(DeviceFunction):
+    REQUEST_LAYOUT = Layout(
+        Field("criterion", 0, enum=StopCriterion, settable=True),
+        Field("outlet01", 1, enum=DeviceChannelID, settable=True),
+        Field("outlet02", 2, enum=DeviceChannelID, settable=True),
+        Field("override_rating", 3, "bool", settable=True),
+        Field("external_trigger", 4, "bool", settable=True),
+    )
+
     @property
     def code(self) -> int:
         return 0x11
@@ -32,50 +41,6 @@ class StartStimulation(DeviceFunction):
     def dispatch(self, listener):
         return listener.accept(self)
 
-    # ------------------------------------------------------------------
-    # Request fields
-    # ------------------------------------------------------------------
-
-    @property
-    def criterion(self) -> StopCriterion:
-        return StopCriterion(self.request.get_byte(0))
-
-    @criterion.setter
-    def criterion(self, value: StopCriterion) -> None:
-        self.request.insert_byte(0, int(value))
-
-    @property
-    def outlet01(self) -> DeviceChannelID:
-        return DeviceChannelID(self.request.get_byte(1))
-
-    @outlet01.setter
-    def outlet01(self, value: DeviceChannelID) -> None:
-        self.request.insert_byte(1, int(value))
-
-    @property
-    def outlet02(self) -> DeviceChannelID:
-        return DeviceChannelID(self.request.get_byte(2))
-
-    @outlet02.setter
-    def outlet02(self, value: DeviceChannelID) -> None:
-        self.request.insert_byte(2, int(value))
-
-    @property
-    def override_rating(self) -> bool:
-        return self.request.get_bool(3)
-
-    @override_rating.setter
-    def override_rating(self, value: bool) -> None:
-        self.request.insert_bool(3, value)
-
-    @property
-    def external_trigger(self) -> bool:
-        return self.request.get_bool(4)
-
-    @external_trigger.setter
-    def external_trigger(self, value: bool) -> None:
-        self.request.insert_bool(4, value)
-
     # ------------------------------------------------------------------
     # Representation
     # ------------------------------------------------------------------
@@ -1,8 +1,11 @@
 from labbench_comm.protocols.device_function import DeviceFunction
 from labbench_comm.protocols.function_dispatcher import FunctionDispatcher
+from labbench_comm.protocols.scheduler import Priority
 
 
 class StopStimulation(DeviceFunction):
+    PRIORITY = Priority.CRITICAL
+
     @property
     def code(self) -> int:
         return 0x13
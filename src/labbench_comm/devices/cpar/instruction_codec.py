@@ -1,11 +1,21 @@
 from __future__ import annotations
 
-from typing import Final
+from typing import Final, List, Sequence
 
 from .definitions import WaveformInstructionType
 from .waveform import WaveformInstruction
 
 
+def _numpy():
+    # NumPy is optional here: without it the batch codec falls back to
+    # encode() / decode() per instruction
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
 class InstructionCodec:
     # ------------------------------------------------------------------
     # Constants
@@ -22,6 +32,12 @@ class InstructionCodec:
     _OPERAND_MASK: Final[int] = 0x3FFFFFFF0000
     _CYCLE_MASK: Final[int] = 0x00000000FFFF
 
+    # Below this many instructions the per-instruction codec is faster
+    # than setting up the NumPy arrays
+    _BATCH_THRESHOLD: Final[int] = 16
+
+    _OPERANDS = tuple(WaveformInstructionType(i) for i in range(4))
+
     # ------------------------------------------------------------------
     # Encoding helpers
     # ------------------------------------------------------------------
@@ -149,3 +165,112 @@ class InstructionCodec:
             instr.time = cls._binary_to_time(binary & cls._CYCLE_MASK)
 
         return instr
+
+    # ------------------------------------------------------------------
+    # Batch encode / decode
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def encode_many(cls, instructions: Sequence[WaveformInstruction]) -> bytes:
+        """
+        Encode a program into one buffer of INSTRUCTIONS_LENGTH bytes per
+        instruction; the result equals joining encode() of each.
+        """
+        np = _numpy()
+        if np is None or len(instructions) < cls._BATCH_THRESHOLD:
+            return b"".join([cls.encode(instr) for instr in instructions])
+
+        count = len(instructions)
+        opcode = np.fromiter(
+            (int(instr.operand) for instr in instructions), np.uint64, count
+        )
+        argument = np.fromiter(
+            (instr.argument for instr in instructions), np.float64, count
+        )
+        time = np.fromiter(
+            (instr.time for instr in instructions), np.float64, count
+        )
+
+        step = opcode == WaveformInstructionType.STEP
+        ramp = (opcode == WaveformInstructionType.INC) | (
+            opcode == WaveformInstructionType.DEC
+        )
+
+        invalid = (step & (argument > cls.MAX_PRESSURE)) | (time > cls.MAX_TIME)
+        if invalid.any():
+            # Raises the same error encode() gives for the first of them
+            cls.encode(instructions[int(np.flatnonzero(invalid)[0])])
+
+        # Same operations, in the same order, as _pressure_to_binary and
+        # _time_to_binary, so the results are bit-identical
+        pressure = np.where(ramp, argument / cls.UPDATE_RATE, argument)
+        pressure = np.clip(pressure, 0.0, cls.MAX_PRESSURE)
+        operand = (pressure / cls.MAX_PRESSURE * cls._MAX_OPERAND_VALUE).astype(np.uint64)
+        operand[~(step | ramp)] = 0
+        cycles = (cls.UPDATE_RATE * np.maximum(time, 0.0)).astype(np.uint64)
+
+        data = (opcode << np.uint64(46)) | (operand << np.uint64(16)) | cycles
+        raw = data.astype("<u8").view(np.uint8).reshape(count, 8)
+        return raw[:, : cls.INSTRUCTIONS_LENGTH].tobytes()
+
+    @classmethod
+    def decode_many(cls, data: bytes | bytearray | memoryview) -> List[WaveformInstruction]:
+        """
+        Decode a buffer of back-to-back encoded instructions.
+        """
+        if data is None:
+            raise ValueError("data must not be None")
+
+        size = cls.INSTRUCTIONS_LENGTH
+        if len(data) % size:
+            raise ValueError(f"Decode expects a multiple of {size} bytes")
+
+        np = _numpy()
+        if np is None or len(data) // size < cls._BATCH_THRESHOLD:
+            data = bytes(data)
+            return [cls.decode(data[i : i + size]) for i in range(0, len(data), size)]
+
+        opcode, operand, cycles = cls._decode_fields(np, data)
+        operand = operand.astype(np.float64)
+        cycles = cycles.astype(np.float64)
+
+        # As _binary_to_pressure and _binary_to_time
+        pressure = np.minimum(
+            cls.MAX_PRESSURE * (operand / cls._MAX_OPERAND_VALUE), cls.MAX_PRESSURE
+        )
+        argument = np.where(
+            opcode == WaveformInstructionType.STEP,
+            pressure,
+            np.where(
+                opcode == WaveformInstructionType.TRIG,
+                np.minimum(operand / cls.UPDATE_RATE, cls.MAX_TIME),
+                pressure * cls.UPDATE_RATE,
+            ),
+        )
+        time = np.minimum(cycles / cls.UPDATE_RATE, cls.MAX_TIME)
+
+        operands = cls._OPERANDS
+        return [
+            WaveformInstruction(operands[op], arg, t)
+            for op, arg, t in zip(opcode.tolist(), argument.tolist(), time.tolist())
+        ]
+
+    @classmethod
+    def _decode_fields(cls, np, data):
+        """
+        Opcode, operand and cycle count of each encoded instruction in
+        ``data``, as uint64 arrays (shared with the waveform simulator).
+        """
+        size = cls.INSTRUCTIONS_LENGTH
+        if len(data) % size:
+            raise ValueError(f"Decode expects a multiple of {size} bytes")
+
+        count = len(data) // size
+        raw = np.zeros((count, 8), dtype=np.uint8)
+        raw[:, :size] = np.frombuffer(data, dtype=np.uint8).reshape(count, size)
+        binary = raw.view("<u8").reshape(count)
+
+        opcode = (binary >> np.uint64(46)) & np.uint64(0x3)
+        operand = (binary & np.uint64(cls._OPERAND_MASK)) >> np.uint64(16)
+        cycles = binary & np.uint64(cls._CYCLE_MASK)
+        return opcode, operand, cycles
@@ -1,7 +1,8 @@
 from .event_message import EventMessage
-from .status_message import StatusMessage
+from .status_message import CPARplusStatus, StatusMessage
 
 __all__ = [
+    "CPARplusStatus",
     "EventMessage",
     "StatusMessage",
 ]
@@ -1,4 +1,5 @@
 from labbench_comm.protocols.device_message import DeviceMessage
+from labbench_comm.protocols.layout import Field, Layout
 from labbench_comm.protocols.message_dispatcher import MessageDispatcher
 from labbench_comm.protocols.packet import Packet
 from labbench_comm.protocols.exceptions import InvalidMessageError
@@ -6,6 +7,12 @@ from labbench_comm.devices.cpar.definitions import EventID
 
 
 class EventMessage(DeviceMessage):
+    HANDLER_NAME = "on_event_message"
+
+    LAYOUT = Layout(
+        Field("event", 0, enum=EventID, settable=True),
+    )
+
     @property
     def code(self) -> int:
         return 0x81
@@ -25,20 +32,9 @@ class EventMessage(DeviceMessage):
     # ------------------------------------------------------------------
 
     def create_dispatcher(self) -> MessageDispatcher:
-        return MessageDispatcher(self.code, lambda p: EventMessage(p))
+        return MessageDispatcher(self.code, EventMessage)
 
     def dispatch(self, listener) -> None:
-        if hasattr(listener, "on_event_message"):
-            listener.on_event_message(self)
-
-    # ------------------------------------------------------------------
-    # Properties
-    # ------------------------------------------------------------------
-
-    @property
-    def event(self) -> EventID:
-        return EventID(self.packet.get_byte(0))
-
-    @event.setter
-    def event(self, value: EventID) -> None:
-        self.packet.insert_byte(0, int(value))
+        handler = getattr(listener, self.HANDLER_NAME, None)
+        if handler is not None:
+            handler(self)
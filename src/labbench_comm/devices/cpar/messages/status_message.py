@@ -1,4 +1,9 @@
+from __future__ import annotations
+
+from typing import Optional
+
 from labbench_comm.protocols.device_message import DeviceMessage
+from labbench_comm.protocols.layout import Field, Layout
 from labbench_comm.protocols.message_dispatcher import MessageDispatcher
 from labbench_comm.protocols.packet import Packet
 from labbench_comm.protocols.exceptions import InvalidMessageError
@@ -9,9 +14,59 @@ from labbench_comm.devices.cpar.definitions import (
 )
 
 from labbench_comm.devices.cpar.codec import CPARplusCodec
+from labbench_comm.devices.cpar.instruction_codec import InstructionCodec
+
+
+def _pressure(name: str, offset: int) -> Field:
+    return Field(
+        name,
+        offset,
+        "uint16",
+        scale=InstructionCodec.MAX_PRESSURE,
+        divisor=4095,
+        binary=f"{name}_binary",
+        settable=True,
+    )
 
 
 class StatusMessage(DeviceMessage):
+    HANDLER_NAME = "on_status_message"
+
+    LAYOUT = Layout(
+        # 1. System state and status flags
+        Field("system_state_binary", 0, settable=True),
+        Field("system_status_binary", 1, settable=True),
+        # 2. Waveform program
+        Field("update_counter", 2, "uint16", settable=True),
+        Field("stop_condition", 4, enum=StopCondition, settable=True),
+        # 3. Pain rating
+        Field(
+            "vas_score", 5,
+            scale=CPARplusCodec.MAX_SCORE, divisor=255,
+            binary="vas_score_binary", settable=True,
+        ),
+        Field(
+            "final_vas_score", 6,
+            scale=CPARplusCodec.MAX_SCORE, divisor=255,
+            binary="final_vas_score_binary", settable=True,
+        ),
+        # 4. Supply pressure
+        Field(
+            "supply_pressure", 7, "uint16",
+            scale=CPARplusCodec.MAX_SUPPLY_PRESSURE, divisor=4095,
+            binary="supply_pressure_binary", settable=True,
+        ),
+        # 5. Stimulation pressures
+        _pressure("actual_pressure_01", 9),
+        _pressure("actual_pressure_02", 11),
+        _pressure("target_pressure_01", 13),
+        _pressure("target_pressure_02", 15),
+        _pressure("final_pressure_01", 17),
+        _pressure("final_pressure_02", 19),
+        # 6. Stop button
+        Field("stop_pressed", 21, "bool", settable=True),
+    )
+
     @property
     def code(self) -> int:
         return 0x80
@@ -26,238 +81,156 @@ class StatusMessage(DeviceMessage):
         else:
             super().__init__(length=22)
 
+        self._status: Optional[CPARplusStatus] = None
+
+    @property
+    def status(self) -> CPARplusStatus:
+        """
+        All fields, decoded once into a CPARplusStatus.
+
+        The status is cached with the record it was built from, so it is
+        rebuilt only after a generated setter has changed the packet.
+        """
+        record = self.record
+        status = self._status
+        if status is None or status.record is not record:
+            status = self._status = CPARplusStatus(record)
+        return status
+
     # ------------------------------------------------------------------
     # Dispatcher
     # ------------------------------------------------------------------
 
     def create_dispatcher(self) -> MessageDispatcher:
-        return MessageDispatcher(self.code, lambda p: StatusMessage(p))
+        return MessageDispatcher(self.code, StatusMessage)
 
     def dispatch(self, listener) -> None:
-        if hasattr(listener, "on_status_message"):
-            listener.on_status_message(self)
+        handler = getattr(listener, self.HANDLER_NAME, None)
+        if handler is not None:
+            handler(self)
 
     # ------------------------------------------------------------------
-    # 1. System State
+    # Derived fields (raw values are generated from LAYOUT)
     # ------------------------------------------------------------------
 
     @property
     def system_state(self) -> DeviceState:
-        return DeviceState(self.packet.get_byte(0) + 1)
-
-    @property
-    def system_state_binary(self) -> int:
-        return self.packet.get_byte(0)
-
-    @system_state_binary.setter
-    def system_state_binary(self, value: int) -> None:
-        self.packet.insert_byte(0, value)
-
-    # ------------------------------------------------------------------
-    # 2. System Status Flags (byte 1)
-    # ------------------------------------------------------------------
+        return DeviceState(self.system_state_binary + 1)
 
     @property
     def vas_connected(self) -> bool:
-        return (self.packet.get_byte(1) & 0x01) != 0
+        return (self.system_status_binary & 0x01) != 0
 
     @property
     def vas_is_low(self) -> bool:
-        return (self.packet.get_byte(1) & 0x02) != 0
+        return (self.system_status_binary & 0x02) != 0
 
     @property
     def power_on(self) -> bool:
-        return (self.packet.get_byte(1) & 0x04) != 0
+        return (self.system_status_binary & 0x04) != 0
 
     @property
     def compressor_running(self) -> bool:
-        return (self.packet.get_byte(1) & 0x08) != 0
+        return (self.system_status_binary & 0x08) != 0
 
     @property
     def start_possible(self) -> bool:
-        return (self.packet.get_byte(1) & 0x10) != 0
+        return (self.system_status_binary & 0x10) != 0
 
     @property
     def supply_pressure_low(self) -> bool:
-        return (self.packet.get_byte(1) & 0x20) != 0
-
-    @property
-    def system_status_binary(self) -> int:
-        return self.packet.get_byte(1)
-
-    @system_status_binary.setter
-    def system_status_binary(self, value: int) -> None:
-        self.packet.insert_byte(1, value)
+        return (self.system_status_binary & 0x20) != 0
+
+    @classmethod
+    def derive_columns(cls, columns: dict) -> None:
+        state = columns["system_state_binary"].astype("i2") + 1
+        flags = columns["system_status_binary"]
+
+        columns["system_state"] = state
+        columns["vas_connected"] = (flags & 0x01) != 0
+        columns["vas_is_low"] = (flags & 0x02) != 0
+        columns["power_on"] = (flags & 0x04) != 0
+        columns["compressor_running"] = (flags & 0x08) != 0
+        columns["start_possible"] = (flags & 0x10) != 0
+        columns["supply_pressure_low"] = (flags & 0x20) != 0
+
+
+_DEVICE_STATES = {state.value - 1: state for state in DeviceState}
+_STOP_CONDITIONS = {condition.value: condition for condition in StopCondition}
+
+
+# The status flags of system_status_binary
+_STATUS_FLAGS = (
+    ("vas_connected", 0x01),
+    ("vas_is_low", 0x02),
+    ("power_on", 0x04),
+    ("compressor_running", 0x08),
+    ("start_possible", 0x10),
+    ("supply_pressure_low", 0x20),
+)
 
-    # ------------------------------------------------------------------
-    # 3. Waveform Program
-    # ------------------------------------------------------------------
+# CPARplusStatus attribute for each StatusMessage.LAYOUT record name; the
+# stop condition keeps its raw code and is converted on access
+_STATUS_FIELDS = tuple(
+    "stop_condition_binary" if name == "stop_condition" else name
+    for name in StatusMessage.LAYOUT.names
+)
 
-    @property
-    def update_counter(self) -> int:
-        return self.packet.get_uint16(2)
 
-    @update_counter.setter
-    def update_counter(self, value: int) -> None:
-        self.packet.insert_uint16(2, value)
+def _make_status_init():
+    # Generated from the layout (as Layout does for its records) so that
+    # building a status is a single unpack in whatever order the layout has
+    targets = "".join(f"self.{name}, " for name in _STATUS_FIELDS)
+    flags = "".join(
+        f"    self.{name} = (flags & {mask:#04x}) != 0\n" for name, mask in _STATUS_FLAGS
+    )
+    source = (
+        "def __init__(self, record):\n"
+        "    self.record = record\n"
+        f"    {targets}= record\n"
+        "    state = _states.get(self.system_state_binary)\n"
+        "    if state is None:\n"
+        "        state = _DeviceState(self.system_state_binary + 1)\n"
+        "    self.system_state = state\n"
+        "    flags = self.system_status_binary\n"
+        f"{flags}"
+    )
+    namespace = {"_states": _DEVICE_STATES, "_DeviceState": DeviceState}
+    exec(source, namespace)
+    return namespace["__init__"]
+
+
+class CPARplusStatus:
+    """
+    A decoded status message.
+
+    Holds every field of the StatusMessage layout as a plain attribute,
+    scaled values and their ``*_binary`` raw values alike, plus the
+    device state and status flags derived from them. Its slots and
+    constructor are generated from the layout's field names, so it is built
+    with a single unpack of the layout record and reading it costs one slot
+    lookup per field.
+    """
+
+    __slots__ = ("record", "system_state") + _STATUS_FIELDS + tuple(
+        name for name, _ in _STATUS_FLAGS
+    )
+
+    __init__ = _make_status_init()
 
     @property
     def stop_condition(self) -> StopCondition:
-        return StopCondition(self.packet.get_byte(4))
-
-    @stop_condition.setter
-    def stop_condition(self, value: StopCondition) -> None:
-        self.packet.insert_byte(4, int(value))
-
-    # ------------------------------------------------------------------
-    # 4. Pain Rating
-    # ------------------------------------------------------------------
-
-    @property
-    def vas_score(self) -> float:
-        return CPARplusCodec.binary_to_score(self.packet.get_byte(5))
-
-    @property
-    def vas_score_binary(self) -> int:
-        return self.packet.get_byte(5)
-
-    @vas_score_binary.setter
-    def vas_score_binary(self, value: int) -> None:
-        self.packet.insert_byte(5, value)
-
-    @property
-    def final_vas_score(self) -> float:
-        return CPARplusCodec.binary_to_score(self.packet.get_byte(6))
-
-    @property
-    def final_vas_score_binary(self) -> int:
-        return self.packet.get_byte(6)
-
-    @final_vas_score_binary.setter
-    def final_vas_score_binary(self, value: int) -> None:
-        self.packet.insert_byte(6, value)
-
-    # ------------------------------------------------------------------
-    # 5. Supply Pressure
-    # ------------------------------------------------------------------
-
-    @property
-    def supply_pressure(self) -> float:
-        return CPARplusCodec.binary_to_pressure(
-            self.supply_pressure_binary,
-            CPARplusCodec.PressureType.SUPPLY_PRESSURE,
-        )
-
-    @property
-    def supply_pressure_binary(self) -> int:
-        return self.packet.get_uint16(7)
-
-    @supply_pressure_binary.setter
-    def supply_pressure_binary(self, value: int) -> None:
-        self.packet.insert_uint16(7, value)
-
-    # ------------------------------------------------------------------
-    # 6. Stimulation Pressures
-    # ------------------------------------------------------------------
-
-    @property
-    def actual_pressure_01(self) -> float:
-        return CPARplusCodec.binary_to_pressure(
-            self.actual_pressure_01_binary,
-            CPARplusCodec.PressureType.STIMULATING_PRESSURE,
-        )
-
-    @property
-    def actual_pressure_01_binary(self) -> int:
-        return self.packet.get_uint16(9)
-
-    @actual_pressure_01_binary.setter
-    def actual_pressure_01_binary(self, value: int) -> None:
-        self.packet.insert_uint16(9, value)
-
-    @property
-    def actual_pressure_02(self) -> float:
-        return CPARplusCodec.binary_to_pressure(
-            self.actual_pressure_02_binary,
-            CPARplusCodec.PressureType.STIMULATING_PRESSURE,
+        # Converted on access, as StatusMessage does, so an unknown code
+        # only fails the code that reads it
+        condition = _STOP_CONDITIONS.get(self.stop_condition_binary)
+        if condition is None:
+            condition = StopCondition(self.stop_condition_binary)
+        return condition
+
+    def __repr__(self) -> str:
+        return (
+            f"CPARplusStatus(system_state={self.system_state.name}, "
+            f"actual_pressure_01={self.actual_pressure_01:.1f}, "
+            f"actual_pressure_02={self.actual_pressure_02:.1f}, "
+            f"vas_score={self.vas_score:.1f})"
         )
-
-    @property
-    def actual_pressure_02_binary(self) -> int:
-        return self.packet.get_uint16(11)
-
-    @actual_pressure_02_binary.setter
-    def actual_pressure_02_binary(self, value: int) -> None:
-        self.packet.insert_uint16(11, value)
-
-    @property
-    def target_pressure_01(self) -> float:
-        return CPARplusCodec.binary_to_pressure(
-            self.target_pressure_01_binary,
-            CPARplusCodec.PressureType.STIMULATING_PRESSURE,
-        )
-
-    @property
-    def target_pressure_01_binary(self) -> int:
-        return self.packet.get_uint16(13)
-
-    @target_pressure_01_binary.setter
-    def target_pressure_01_binary(self, value: int) -> None:
-        self.packet.insert_uint16(13, value)
-
-    @property
-    def target_pressure_02(self) -> float:
-        return CPARplusCodec.binary_to_pressure(
-            self.target_pressure_02_binary,
-            CPARplusCodec.PressureType.STIMULATING_PRESSURE,
-        )
-
-    @property
-    def target_pressure_02_binary(self) -> int:
-        return self.packet.get_uint16(15)
-
-    @target_pressure_02_binary.setter
-    def target_pressure_02_binary(self, value: int) -> None:
-        self.packet.insert_uint16(15, value)
-
-    @property
-    def final_pressure_01(self) -> float:
-        return CPARplusCodec.binary_to_pressure(
-            self.final_pressure_01_binary,
-            CPARplusCodec.PressureType.STIMULATING_PRESSURE,
-        )
-
-    @property
-    def final_pressure_01_binary(self) -> int:
-        return self.packet.get_uint16(17)
-
-    @final_pressure_01_binary.setter
-    def final_pressure_01_binary(self, value: int) -> None:
-        self.packet.insert_uint16(17, value)
-
-    @property
-    def final_pressure_02(self) -> float:
-        return CPARplusCodec.binary_to_pressure(
-            self.final_pressure_02_binary,
-            CPARplusCodec.PressureType.STIMULATING_PRESSURE,
-        )
-
-    @property
-    def final_pressure_02_binary(self) -> int:
-        return self.packet.get_uint16(19)
-
-    @final_pressure_02_binary.setter
-    def final_pressure_02_binary(self, value: int) -> None:
-        self.packet.insert_uint16(19, value)
-
-    # ------------------------------------------------------------------
-    # Stop button
-    # ------------------------------------------------------------------
-
-    @property
-    def stop_pressed(self) -> bool:
-        return self.packet.get_byte(21) != 0
-
-    @stop_pressed.setter
-    def stop_pressed(self, value: bool) -> None:
-        self.packet.insert_byte(21, 1 if value else 0)
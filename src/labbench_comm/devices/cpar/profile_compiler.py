@@ -0,0 +1,268 @@
+"""
+Pressure-profile compiler for CPAR waveform programs.
+
+A waveform program is at most 256 instructions, executed at
+``InstructionCodec.UPDATE_RATE`` (100 Hz). :class:`ProfileCompiler` turns a
+sampled target pressure curve into such a program::
+
+    compiler = ProfileCompiler(tolerance=0.5)
+    profile = compiler.compile(pressures, sample_rate=20.0)
+    print(len(profile), profile.max_error)
+    await device.execute(profile.create_function(channel=0))
+
+The curve is resampled onto the device ticks and clipped to
+``MAX_PRESSURE``. It is then split greedily into segments: at every point
+the compiler takes whichever of a ramp continuing from the current pressure
+(INC/DEC) or a constant STEP reaches furthest within the tolerance. A jump
+is a STEP, after which the next ramp continues from the stepped pressure.
+
+The result is not minimal: a program with fewer instructions may exist
+within the same tolerance. Each choice between a ramp and a STEP looks no
+further than the segment itself, and a shorter segment, or another level
+or slope within the tolerance, can let the following segments reach
+further. The ramp anchor depends on every earlier choice, so an exact
+search is not attempted.
+
+Each reach is computed vectorized, as the intersection of the feasible
+slope (or level) intervals of all following ticks, so the Python loop runs
+once per instruction rather than once per sample.
+
+The program is then run through the WaveformSimulator, as the device
+would execute it after encoding, and the achieved error is reported. Ramp
+slopes are truncated by the instruction encoding, which can add up to about
+1e-7 kPa per tick to the error of a long ramp.
+
+NumPy is an optional dependency (``pip install labbench_comm[numpy]``).
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, List, Sequence, Tuple
+
+from .definitions import WaveformInstructionType
+from .functions.set_waveform_program import SetWaveformProgram
+from .instruction_codec import InstructionCodec
+from .waveform import WaveformInstruction
+from .waveform_simulator import WaveformSimulator
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "Profile compilation requires NumPy; install it with "
+            "`pip install labbench_comm[numpy]`"
+        ) from exc
+    return numpy
+
+
+@dataclass
+class CompiledProfile:
+    """
+    A compiled waveform program and how well it reproduces its target.
+
+    ``target`` and ``pressure`` are the target and the pressure the
+    program produces, one value per device tick; the errors are in kPa.
+    """
+
+    instructions: List[WaveformInstruction]
+    max_error: float
+    rms_error: float
+    target: Any = field(repr=False)
+    pressure: Any = field(repr=False)
+
+    def __len__(self) -> int:
+        return len(self.instructions)
+
+    @property
+    def duration(self) -> float:
+        """
+        Program duration in seconds.
+        """
+        return len(self.target) / InstructionCodec.UPDATE_RATE
+
+    def create_function(self, channel: int = 0, repeat: int = 1) -> SetWaveformProgram:
+        function = SetWaveformProgram()
+        function.channel = channel
+        function.repeat = repeat
+        function.instructions = list(self.instructions)
+        return function
+
+
+class ProfileCompiler:
+    """
+    Compile sampled pressure curves into waveform programs.
+
+    ``tolerance`` is the maximum deviation from the target in kPa that a
+    segment may have. A profile that the greedy segmentation splits into
+    more than ``max_instructions`` is rejected with a ValueError, even if
+    a shorter program would fit; a larger tolerance helps.
+    """
+
+    RATE = InstructionCodec.UPDATE_RATE
+    MAX_TICKS = int(InstructionCodec.MAX_TIME * InstructionCodec.UPDATE_RATE)
+
+    # First window of ticks examined per segment, grown by this factor
+    # until the segment ends within it
+    _WINDOW = 64
+    _GROWTH = 4
+
+    def __init__(
+        self,
+        tolerance: float = 0.5,
+        max_instructions: int = SetWaveformProgram.MAX_NO_OF_INSTRUCTIONS,
+    ) -> None:
+        if tolerance <= 0:
+            raise ValueError("tolerance must be positive")
+        if max_instructions < 1:
+            raise ValueError("max_instructions must be at least 1")
+
+        self.tolerance = tolerance
+        self.max_instructions = max_instructions
+        self._np = _require_numpy()
+        self._simulator = WaveformSimulator()
+
+    def compile(
+        self,
+        pressures: Sequence[float],
+        sample_rate: float = InstructionCodec.UPDATE_RATE,
+    ) -> CompiledProfile:
+        """
+        Compile target pressures (kPa) sampled at ``sample_rate`` Hz.
+
+        Each sample is held until the next, so n samples last
+        n / sample_rate seconds.
+        """
+        if sample_rate <= 0:
+            raise ValueError("sample_rate must be positive")
+
+        target = self._resample(pressures, sample_rate)
+        instructions = self._segment(target)
+        pressure = self._simulator.simulate(instructions).pressure
+
+        error = self._np.abs(pressure - target)
+        return CompiledProfile(
+            instructions=instructions,
+            max_error=float(error.max()),
+            rms_error=float(self._np.sqrt(self._np.mean(error * error))),
+            target=target,
+            pressure=pressure,
+        )
+
+    # ------------------------------------------------------------------
+    # Resampling
+    # ------------------------------------------------------------------
+
+    def _resample(self, pressures: Sequence[float], sample_rate: float):
+        np = self._np
+        samples = np.asarray(pressures, dtype=np.float64)
+        if samples.ndim != 1 or len(samples) == 0:
+            raise ValueError("pressures must be a non-empty sequence")
+
+        if sample_rate != self.RATE:
+            ticks = max(1, round(len(samples) * self.RATE / sample_rate))
+            samples = np.interp(
+                np.arange(ticks) / self.RATE,
+                np.arange(len(samples)) / sample_rate,
+                samples,
+            )
+
+        return np.clip(samples, 0.0, InstructionCodec.MAX_PRESSURE)
+
+    # ------------------------------------------------------------------
+    # Segmentation
+    # ------------------------------------------------------------------
+
+    def _segment(self, target) -> List[WaveformInstruction]:
+        instructions: List[WaveformInstruction] = []
+        position = 0
+        # Device pressure before the tick at position
+        pressure = 0.0
+
+        while position < len(target):
+            if len(instructions) == self.max_instructions:
+                raise ValueError(
+                    f"Profile compiles to more than {self.max_instructions} "
+                    f"instructions at a tolerance of {self.tolerance} kPa"
+                )
+
+            limit = min(len(target), position + self.MAX_TICKS)
+            ramp_end, slope = self._reach(target, position, limit, pressure)
+            step_end, level = self._reach(target, position, limit, None)
+
+            if step_end >= ramp_end:
+                instruction = WaveformInstruction.step(
+                    min(max(level, 0.0), InstructionCodec.MAX_PRESSURE),
+                    self._duration(step_end - position),
+                )
+                pressure = self._encoded(instruction).argument
+                position = step_end
+            else:
+                ticks = ramp_end - position
+                rate = slope * self.RATE
+                if rate >= 0:
+                    instruction = WaveformInstruction.increment(rate, self._duration(ticks))
+                else:
+                    instruction = WaveformInstruction.decrement(-rate, self._duration(ticks))
+                pressure = self._ramp_end(self._encoded(instruction), pressure, ticks)
+                position = ramp_end
+
+            instructions.append(instruction)
+
+        return instructions
+
+    def _reach(self, target, start: int, limit: int, anchor) -> Tuple[int, float]:
+        """
+        Furthest end of a segment from ``start``, and its parameter.
+
+        With an ``anchor`` pressure the segment is a ramp from it, and the
+        parameter is the slope per tick; without, it is a constant level.
+        Every tick constrains the parameter to an interval; the segment
+        ends where the running intersection of those intervals is empty.
+        """
+        np = self._np
+        tolerance = self.tolerance
+        window = self._WINDOW
+
+        while True:
+            stop = min(start + window, limit)
+            values = target[start:stop]
+            lower = values - tolerance
+            upper = values + tolerance
+            if anchor is not None:
+                distance = np.arange(1, stop - start + 1, dtype=np.float64)
+                lower = (lower - anchor) / distance
+                upper = (upper - anchor) / distance
+
+            lower = np.maximum.accumulate(lower)
+            upper = np.minimum.accumulate(upper)
+            empty = np.flatnonzero(lower > upper)
+
+            if empty.size or stop == limit:
+                # The first tick alone is always feasible
+                length = int(empty[0]) if empty.size else stop - start
+                return start + length, float(lower[length - 1] + upper[length - 1]) / 2.0
+
+            window *= self._GROWTH
+
+    def _duration(self, ticks: int) -> float:
+        # The encoder truncates time * UPDATE_RATE; make sure that gives
+        # back ticks rather than ticks - 1
+        duration = ticks / self.RATE
+        while int(duration * self.RATE) < ticks:
+            duration = math.nextafter(duration, math.inf)
+        return duration
+
+    @staticmethod
+    def _encoded(instruction: WaveformInstruction) -> WaveformInstruction:
+        # What the device receives
+        return InstructionCodec.decode(InstructionCodec.encode(instruction))
+
+    def _ramp_end(self, instruction: WaveformInstruction, pressure: float, ticks: int) -> float:
+        step = instruction.argument / self.RATE
+        if instruction.operand is WaveformInstructionType.DEC:
+            step = -step
+        return min(max(pressure + step * ticks, 0.0), InstructionCodec.MAX_PRESSURE)
@@ -1,5 +1,10 @@
-from dataclasses import dataclass
-from typing import List
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import MutableSequence
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 
 @dataclass(slots=True)
@@ -16,20 +21,153 @@ class StimulationSample:
     final_vas_score: float
 
 
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "NumPy export requires NumPy; install it with "
+            "`pip install labbench_comm[numpy]`"
+        ) from exc
+    return numpy
+
+
 class StimulationData:
     """
     Collected data from a single stimulation cycle.
+
+    Samples are stored column-wise, one preallocated ``array('d')`` per
+    channel (8 bytes per value), grown by doubling. Appends only write
+    into spare capacity, so a column can be exported without copying:
+    column() returns a memoryview and to_numpy() wraps the buffers with
+    np.frombuffer, both O(1). Such views show the samples present when
+    they were taken. The list-returning accessors (actual_pressure_01,
+    vas_scores, ...) and as_dict() copy, as before. samples is a list-like
+    view of the columns; changes made through it write through.
     """
 
-    def __init__(self) -> None:
-        self.samples: List[StimulationSample] = []
+    # Status messages, and so samples, arrive at 20 Hz
+    SAMPLE_RATE = 20.0
+
+    CHANNELS = tuple(f.name for f in fields(StimulationSample))
+
+    DEFAULT_CAPACITY = 1024
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self._capacity = max(1, capacity)
+        self._length = 0
+        self._columns: List[array] = [
+            self._allocate(self._capacity) for _ in self.CHANNELS
+        ]
+
+    # ------------------------------------------------------------------
+    # Appending
+    # ------------------------------------------------------------------
 
     def add_sample(self, sample: StimulationSample) -> None:
-        self.samples.append(sample)
+        self.add_values(
+            sample.actual_pressure_01,
+            sample.target_pressure_01,
+            sample.final_pressure_01,
+            sample.actual_pressure_02,
+            sample.target_pressure_02,
+            sample.final_pressure_02,
+            sample.vas_score,
+            sample.final_vas_score,
+        )
+
+    def add_values(self, *values: float) -> None:
+        """
+        Append one sample given as values in CHANNELS order.
+        """
+        if len(values) != len(self._columns):
+            raise ValueError(
+                f"Expected {len(self._columns)} values, got {len(values)}"
+            )
+
+        index = self._length
+        if index == self._capacity:
+            self._grow(2 * self._capacity)
+
+        for column, value in zip(self._columns, values):
+            column[index] = value
+        self._length = index + 1
 
     def __len__(self) -> int:
-        return len(self.samples)
-    
+        return self._length
+
+    # ------------------------------------------------------------------
+    # Samples
+    # ------------------------------------------------------------------
+
+    @property
+    def samples(self) -> StimulationSamples:
+        """
+        The samples as a list-like StimulationSamples view.
+        """
+        return StimulationSamples(self)
+
+    @samples.setter
+    def samples(self, samples: Iterable[StimulationSample]) -> None:
+        self._replace(list(samples))
+
+    def __getitem__(self, index: int) -> StimulationSample:
+        index = self._position(index)
+        return StimulationSample(*(column[index] for column in self._columns))
+
+    def __iter__(self) -> Iterator[StimulationSample]:
+        views = [self.column(name) for name in self.CHANNELS]
+        for values in zip(*views):
+            yield StimulationSample(*values)
+
+    def between(
+        self,
+        start: Optional[float] = None,
+        stop: Optional[float] = None,
+    ) -> StimulationData:
+        """
+        The samples with start <= time < stop (seconds), as a new
+        StimulationData.
+        """
+        first = 0 if start is None else self._index_at(start)
+        last = self._length if stop is None else self._index_at(stop)
+        last = max(first, last)
+
+        data = StimulationData(capacity=last - first)
+        for target, column in zip(data._columns, self._columns):
+            target[: last - first] = column[first:last]
+        data._length = last - first
+        return data
+
+    # ------------------------------------------------------------------
+    # Columns
+    # ------------------------------------------------------------------
+
+    def column(self, name: str) -> memoryview:
+        """
+        Zero-copy view of one channel (format 'd').
+        """
+        try:
+            index = self.CHANNELS.index(name)
+        except ValueError:
+            raise KeyError(name) from None
+        return memoryview(self._columns[index])[: self._length]
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        All channels as float64 NumPy arrays, plus "time".
+
+        The channel arrays share memory with this object (no copy); they
+        are read-only.
+        """
+        np = _require_numpy()
+        columns: Dict[str, Any] = {"time": self._time_array(np)}
+        for name, column in zip(self.CHANNELS, self._columns):
+            view = np.frombuffer(column, dtype=np.float64, count=self._length)
+            view.flags.writeable = False
+            columns[name] = view
+        return columns
+
     # ------------------------------------------------------------------
     # Time axis
     # ------------------------------------------------------------------
@@ -40,44 +178,44 @@ class StimulationData:
         Time axis in seconds for each sample, derived from sample index
         using the protocol update rate.
         """
-        dt = 1.0 / 20
-        return [i * dt for i in range(len(self.samples))]
-        
-   # ------------------------------------------------------------------
+        dt = 1.0 / self.SAMPLE_RATE
+        return [i * dt for i in range(self._length)]
+
+    # ------------------------------------------------------------------
     # Vectorized / list-based accessors
     # ------------------------------------------------------------------
 
     @property
     def actual_pressure_01(self) -> List[float]:
-        return [s.actual_pressure_01 for s in self.samples]
+        return self._list(0)
 
     @property
     def target_pressure_01(self) -> List[float]:
-        return [s.target_pressure_01 for s in self.samples]
+        return self._list(1)
 
     @property
     def final_pressure_01(self) -> List[float]:
-        return [s.final_pressure_01 for s in self.samples]
+        return self._list(2)
 
     @property
     def actual_pressure_02(self) -> List[float]:
-        return [s.actual_pressure_02 for s in self.samples]
+        return self._list(3)
 
     @property
     def target_pressure_02(self) -> List[float]:
-        return [s.target_pressure_02 for s in self.samples]
+        return self._list(4)
 
     @property
     def final_pressure_02(self) -> List[float]:
-        return [s.final_pressure_02 for s in self.samples]
+        return self._list(5)
 
     @property
     def vas_scores(self) -> List[float]:
-        return [s.vas_score for s in self.samples]
+        return self._list(6)
 
     @property
     def final_vas_scores(self) -> List[float]:
-        return [s.final_vas_score for s in self.samples]
+        return self._list(7)
 
     # ------------------------------------------------------------------
     # Convenience helpers
@@ -85,11 +223,12 @@ class StimulationData:
 
     @property
     def has_data(self) -> bool:
-        return bool(self.samples)
+        return self._length > 0
 
     def as_dict(self) -> dict[str, List[float]]:
         """
-        Return all data as a dict of lists (useful for pandas / JSON).
+        Return all data as a dict of lists (useful for JSON); for pandas
+        or NumPy, to_numpy() avoids the copies.
         """
         return {
             "time": self.time,
@@ -101,4 +240,125 @@ class StimulationData:
             "final_pressure_02": self.final_pressure_02,
             "vas_score": self.vas_scores,
             "final_vas_score": self.final_vas_scores,
-        }    
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _allocate(capacity: int) -> array:
+        return array("d", bytes(8 * capacity))
+
+    def _grow(self, capacity: int) -> None:
+        # New buffers rather than array.extend(): views handed out by
+        # column() / to_numpy() keep the old ones alive and unchanged
+        length = self._length
+        columns = []
+        for column in self._columns:
+            grown = self._allocate(capacity)
+            grown[:length] = column[:length]
+            columns.append(grown)
+        self._columns = columns
+        self._capacity = capacity
+
+    def _set(self, index: int, sample: StimulationSample) -> None:
+        index = self._position(index)
+        try:
+            for column in self._columns:
+                # Fails if a column is exported
+                column.append(0.0)
+                column.pop()
+        except BufferError:
+            # Keep exported views unchanged
+            self._grow(self._capacity)
+
+        values = (getattr(sample, name) for name in self.CHANNELS)
+        for column, value in zip(self._columns, values):
+            column[index] = value
+
+    def _replace(self, samples: List[StimulationSample]) -> None:
+        # Fresh buffers: views handed out keep showing the old samples
+        self._capacity = max(1, len(samples), self._capacity)
+        self._columns = [self._allocate(self._capacity) for _ in self.CHANNELS]
+        self._length = 0
+        for sample in samples:
+            self.add_sample(sample)
+
+    def _position(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("sample index out of range")
+        return index
+
+    def _list(self, index: int) -> List[float]:
+        return memoryview(self._columns[index])[: self._length].tolist()
+
+    def _index_at(self, seconds: float) -> int:
+        # First sample at or after ``seconds``, tolerating rounding
+        index = math.ceil(seconds * self.SAMPLE_RATE - 1e-9)
+        return min(max(index, 0), self._length)
+
+    def _time_array(self, np):
+        return np.arange(self._length, dtype=np.float64) / self.SAMPLE_RATE
+
+
+class StimulationSamples(MutableSequence):
+    """
+    List-like view of the samples of a StimulationData.
+
+    Items are built from the columns when read. append() adds a sample
+    like add_sample(); item assignment writes the columns in place, and
+    other changes (insertion, deletion, slice assignment) rebuild them.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: StimulationData) -> None:
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[StimulationSample]:
+        return iter(self._data)
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[StimulationSample, List[StimulationSample]]:
+        if isinstance(index, slice):
+            return list(self)[index]
+        return self._data[index]
+
+    def __setitem__(self, index, sample) -> None:
+        if isinstance(index, slice):
+            samples = list(self)
+            samples[index] = sample
+            self._data._replace(samples)
+        else:
+            self._data._set(index, sample)
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        samples = list(self)
+        del samples[index]
+        self._data._replace(samples)
+
+    def insert(self, index: int, sample: StimulationSample) -> None:
+        if index >= len(self):
+            self._data.add_sample(sample)
+            return
+        samples = list(self)
+        samples.insert(index, sample)
+        self._data._replace(samples)
+
+    def append(self, sample: StimulationSample) -> None:
+        self._data.add_sample(sample)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (StimulationSamples, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
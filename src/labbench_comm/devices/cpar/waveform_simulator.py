@@ -0,0 +1,360 @@
+"""
+Host-side CPAR waveform simulator.
+
+:class:`WaveformSimulator` executes waveform programs the way the device
+steps them at ``InstructionCodec.UPDATE_RATE`` (100 Hz), so protocols can be
+previewed, plotted and validated (e.g. in CI) without hardware::
+
+    simulator = WaveformSimulator()
+    waveform = simulator.simulate(program)        # a SetWaveformProgram
+    plot(waveform.time, waveform.pressure)
+
+    batch = simulator.simulate_many(candidates)   # thousands at once
+    peaks = np.nanmax(batch.pressure, axis=1)
+
+Programs are simulated as encoded, from the 30-bit operand the device
+receives, with a fixed-point pressure accumulator starting at 0:
+
+- STEP sets the pressure and holds it for its duration;
+- INC and DEC add or subtract their operand on every tick, clamped to
+  0 .. ``MAX_PRESSURE``;
+- TRIG takes no time; it is placed on the timeline as a trigger starting
+  ``time`` seconds after its position, lasting the ``argument`` it was
+  encoded with.
+
+A program with ``repeat`` runs its instructions that many times, the
+pressure carrying over between runs.
+
+Everything is vectorized across programs and instructions. The pressure
+before each instruction is an inclusive scan of clamp functions
+(a composition of ``x -> clamp(x + d, lo, hi)`` is again of that form),
+and the ticks are rendered in one pass per chunk of programs.
+
+NumPy is an optional dependency (``pip install labbench_comm[numpy]``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .definitions import WaveformInstructionType
+from .functions.set_waveform_program import SetWaveformProgram
+from .instruction_codec import InstructionCodec
+from .waveform import WaveformInstruction
+
+Program = Union[
+    SetWaveformProgram,
+    Sequence[WaveformInstruction],
+    bytes,
+    bytearray,
+    memoryview,
+]
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "Waveform simulation requires NumPy; install it with "
+            "`pip install labbench_comm[numpy]`"
+        ) from exc
+    return numpy
+
+
+class Trigger(NamedTuple):
+    """
+    A trigger output, in seconds from the start of the program.
+    """
+
+    time: float
+    duration: float
+
+
+@dataclass
+class SimulatedWaveform:
+    """
+    Pressure of one program, one value in kPa per device tick.
+    """
+
+    pressure: Any = field(repr=False)
+    triggers: List[Trigger] = field(default_factory=list)
+    channel: int = 0
+
+    @property
+    def time(self):
+        """
+        Start time of each tick in seconds.
+        """
+        np = _require_numpy()
+        return np.arange(len(self.pressure)) / InstructionCodec.UPDATE_RATE
+
+    @property
+    def duration(self) -> float:
+        return len(self.pressure) / InstructionCodec.UPDATE_RATE
+
+
+@dataclass
+class SimulationBatch:
+    """
+    Pressures of many programs.
+
+    ``pressure`` has one row per program and one column per tick of the
+    longest program; rows of shorter programs are padded with NaN after
+    their ``lengths`` ticks.
+    """
+
+    pressure: Any = field(repr=False)
+    lengths: Any
+    triggers: List[List[Trigger]] = field(repr=False)
+    channels: List[int] = field(repr=False)
+
+    def __len__(self) -> int:
+        return len(self.channels)
+
+    def __getitem__(self, index: int) -> SimulatedWaveform:
+        return SimulatedWaveform(
+            pressure=self.pressure[index, : self.lengths[index]],
+            triggers=self.triggers[index],
+            channel=self.channels[index],
+        )
+
+
+class WaveformSimulator:
+    """
+    Simulate waveform programs.
+
+    A program is a SetWaveformProgram (its channel, repeat and the first
+    MAX_NO_OF_INSTRUCTIONS instructions, as sent), a sequence of
+    WaveformInstructions, or an encoded program buffer.
+    """
+
+    RATE = InstructionCodec.UPDATE_RATE
+
+    _MAX_OPERAND = InstructionCodec._MAX_OPERAND_VALUE
+
+    # Ticks rendered per pass; bounds the temporary arrays (about 60 bytes
+    # per tick) for large batches
+    _CHUNK_TICKS = 1 << 22
+
+    # Opcode of the padding after the end of a program
+    _PADDING = 4
+
+    def __init__(self) -> None:
+        self._np = _require_numpy()
+
+    def simulate(
+        self,
+        program: Program,
+        repeat: Optional[int] = None,
+    ) -> SimulatedWaveform:
+        """
+        Simulate one program; ``repeat`` overrides the program's own.
+        """
+        return self.simulate_many([program], repeat)[0]
+
+    def simulate_many(
+        self,
+        programs: Sequence[Program],
+        repeat: Optional[int] = None,
+    ) -> SimulationBatch:
+        """
+        Simulate many programs at once; ``repeat`` overrides their own.
+        """
+        np = self._np
+        buffers, repeats, channels = self._normalize(programs, repeat)
+
+        opcode, operand, cycles, counts = self._fields(buffers, repeats)
+        # TRIG takes no time; its cycles are the trigger offset
+        trigger = opcode == WaveformInstructionType.TRIG
+        ticks = np.where(trigger, 0, cycles)
+        lengths = ticks.sum(axis=1)
+        before = self._pressure_before(opcode, operand, ticks)
+
+        width = int(lengths.max()) if len(lengths) else 0
+        pressure = np.full((len(buffers), width), np.nan)
+        self._render(pressure, opcode, operand, ticks, before, lengths)
+
+        return SimulationBatch(
+            pressure=pressure,
+            lengths=lengths,
+            triggers=self._triggers(trigger, operand, cycles, ticks, counts),
+            channels=channels,
+        )
+
+    # ------------------------------------------------------------------
+    # Programs
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _normalize(
+        programs: Sequence[Program],
+        repeat: Optional[int],
+    ) -> Tuple[List[bytes], List[int], List[int]]:
+        buffers: List[bytes] = []
+        repeats: List[int] = []
+        channels: List[int] = []
+
+        for program in programs:
+            if isinstance(program, SetWaveformProgram):
+                buffers.append(program.serialize_instructions())
+                repeats.append(program.repeat)
+                channels.append(program.channel)
+                continue
+
+            if isinstance(program, (bytes, bytearray, memoryview)):
+                buffers.append(bytes(program))
+            else:
+                buffers.append(InstructionCodec.encode_many(program))
+            repeats.append(1)
+            channels.append(0)
+
+        if repeat is not None:
+            if repeat < 1:
+                raise ValueError("repeat must be at least 1")
+            repeats = [repeat] * len(buffers)
+
+        return buffers, repeats, channels
+
+    def _fields(self, buffers: List[bytes], repeats: List[int]):
+        # Decode all programs at once, then lay them out one row per
+        # program (repeats unrolled), padded with identity instructions
+        np = self._np
+        size = InstructionCodec.INSTRUCTIONS_LENGTH
+
+        opcode, operand, cycles = InstructionCodec._decode_fields(
+            np, b"".join(buffers)
+        )
+        sizes = np.array([len(b) // size for b in buffers], dtype=np.int64)
+        counts = sizes * np.array(repeats, dtype=np.int64)
+        offsets = np.cumsum(sizes) - sizes
+
+        rows = len(buffers)
+        width = int(counts.max()) if rows else 0
+        source = np.concatenate(
+            [offsets[i] + np.tile(np.arange(sizes[i]), repeats[i]) for i in range(rows)]
+        ) if rows else np.zeros(0, dtype=np.int64)
+        row = np.repeat(np.arange(rows), counts)
+        column = np.arange(len(row)) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        def layout(values, fill):
+            matrix = np.full((rows, width), fill, dtype=np.int64)
+            matrix[row, column] = values[source].astype(np.int64)
+            return matrix
+
+        return (
+            layout(opcode, self._PADDING),
+            layout(operand, 0),
+            layout(cycles, 0),
+            counts,
+        )
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+
+    def _pressure_before(self, opcode, operand, ticks):
+        """
+        Accumulator value before each instruction.
+
+        Each instruction maps the accumulator x to clamp(x + d, lo, hi):
+        STEP to its operand (lo = hi), INC/DEC to the clamped end of the
+        ramp, TRIG and padding to x. These compose in closed form, so the
+        value before every instruction is an inclusive scan (Hillis-Steele,
+        log2(width) passes) evaluated at 0.
+        """
+        np = self._np
+        limit = self._MAX_OPERAND
+
+        step = opcode == WaveformInstructionType.STEP
+        sign = self._sign(opcode)
+
+        delta = np.clip(sign * operand * ticks, -(limit + 1), limit + 1)
+        lower = np.where(step, operand, 0)
+        upper = np.where(step, operand, limit)
+        delta = np.where(step, 0, delta)
+
+        shift = 1
+        width = opcode.shape[1]
+        while shift < width:
+            # Compose each function with the one ``shift`` positions earlier
+            inner_delta = delta[:, :-shift]
+            inner_lower = lower[:, :-shift]
+            inner_upper = upper[:, :-shift]
+            outer_delta = delta[:, shift:]
+            outer_lower = lower[:, shift:]
+            outer_upper = upper[:, shift:]
+
+            composed_lower = np.clip(inner_lower + outer_delta, outer_lower, outer_upper)
+            composed_upper = np.clip(inner_upper + outer_delta, outer_lower, outer_upper)
+            composed_delta = np.clip(inner_delta + outer_delta, -(limit + 1), limit + 1)
+
+            delta = np.concatenate([delta[:, :shift], composed_delta], axis=1)
+            lower = np.concatenate([lower[:, :shift], composed_lower], axis=1)
+            upper = np.concatenate([upper[:, :shift], composed_upper], axis=1)
+            shift *= 2
+
+        after = np.clip(delta, lower, upper)
+        before = np.zeros_like(after)
+        before[:, 1:] = after[:, :-1]
+        return before
+
+    def _render(self, out, opcode, operand, ticks, before, lengths) -> None:
+        np = self._np
+        limit = self._MAX_OPERAND
+
+        # Level held (STEP) or ramped from, and the change per tick
+        step = opcode == WaveformInstructionType.STEP
+        base = np.where(step, operand, before)
+        slope = self._sign(opcode) * operand
+
+        first = 0
+        while first < len(lengths):
+            last = first + 1
+            total = int(lengths[first])
+            while last < len(lengths) and total + lengths[last] <= self._CHUNK_TICKS:
+                total += int(lengths[last])
+                last += 1
+
+            chunk = ticks[first:last].ravel()
+            starts = np.cumsum(chunk) - chunk
+            # Ramps move on every tick, including their first
+            k = np.arange(total) - np.repeat(starts - 1, chunk)
+
+            value = np.repeat(slope[first:last].ravel(), chunk)
+            value *= k
+            value += np.repeat(base[first:last].ravel(), chunk)
+            np.clip(value, 0, limit, out=value)
+
+            pressure = value / limit
+            pressure *= InstructionCodec.MAX_PRESSURE
+            np.minimum(pressure, InstructionCodec.MAX_PRESSURE, out=pressure)
+
+            offset = 0
+            for row in range(first, last):
+                length = int(lengths[row])
+                out[row, :length] = pressure[offset : offset + length]
+                offset += length
+
+            first = last
+
+    def _triggers(self, trigger, operand, cycles, ticks, counts) -> List[List[Trigger]]:
+        np = self._np
+        start = np.cumsum(ticks, axis=1) - ticks
+        rows, columns = np.nonzero(trigger)
+
+        triggers: List[List[Trigger]] = [[] for _ in range(len(counts))]
+        times = (start[rows, columns] + cycles[rows, columns]) / self.RATE
+        durations = np.minimum(operand[rows, columns] / self.RATE, InstructionCodec.MAX_TIME)
+        for row, time, duration in zip(rows.tolist(), times.tolist(), durations.tolist()):
+            triggers[row].append(Trigger(time, duration))
+        return triggers
+
+    def _sign(self, opcode):
+        np = self._np
+        return np.where(
+            opcode == WaveformInstructionType.INC,
+            1,
+            np.where(opcode == WaveformInstructionType.DEC, -1, 0),
+        )
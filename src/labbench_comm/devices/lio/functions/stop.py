@@ -1,7 +1,10 @@
 from labbench_comm.devices.lio.functions.base import _LIOFunction
+from labbench_comm.protocols.scheduler import Priority
 
 
 class Stop(_LIOFunction):
+    PRIORITY = Priority.CRITICAL
+
     @property
     def code(self) -> int:
         return 0x20
@@ -1,34 +1,26 @@
 from labbench_comm.devices.lio.definitions import saturate
-from labbench_comm.devices.lio.messages.base import _LIOMessage
+from labbench_comm.devices.lio.messages.base import (
+    _LIOMessage,
+    _derive_signal_columns,
+)
+from labbench_comm.protocols.layout import Field, Layout
 
 
 class AnalogInputMessage(_LIOMessage):
     MESSAGE_LENGTH = 13
 
+    LAYOUT = Layout(
+        Field("pin", 0),
+        Field("signal", 1, "uint16"),
+        Field("a", 3, "int32", divisor=4096.0),
+        Field("b", 7, "int32", divisor=4096.0),
+        Field("range", 11, "uint16"),
+    )
+
     @property
     def code(self) -> int:
         return 0x94
 
-    @property
-    def pin(self) -> int:
-        return self.packet.get_byte(0)
-
-    @property
-    def signal(self) -> float:
-        return self.packet.get_uint16(1)
-
-    @property
-    def a(self) -> float:
-        return self.packet.get_int32(3) / 4096.0
-
-    @property
-    def b(self) -> float:
-        return self.packet.get_int32(7) / 4096.0
-
-    @property
-    def range(self) -> float:
-        return self.packet.get_uint16(11)
-
     @property
     def value(self) -> float:
         if self.range == 0:
@@ -38,3 +30,7 @@ class AnalogInputMessage(_LIOMessage):
     @property
     def voltage(self) -> float:
         return self.a * self.signal / 1023.0 + self.b
+
+    @classmethod
+    def derive_columns(cls, columns: dict) -> None:
+        _derive_signal_columns(columns)
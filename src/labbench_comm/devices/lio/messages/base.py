@@ -33,9 +33,42 @@ def _handler_name(message_name: str) -> str:
     return f"on_{snake}_message"
 
 
+def _derive_signal_columns(columns: dict) -> None:
+    # Vectorized value/voltage, as computed by the message properties
+    import numpy as np
+
+    signal = columns["signal"]
+    scale = columns["range"]
+    ratio = np.divide(
+        signal, scale,
+        out=np.zeros(signal.shape, dtype=np.float64),
+        where=scale != 0,
+    )
+    columns["value"] = np.clip(ratio, 0.0, 1.0)
+    columns["voltage"] = columns["a"] * signal / 1023.0 + columns["b"]
+
+
+def _derive_time_columns(columns: dict) -> None:
+    # Vectorized int(count / divisor), 0 where the divisor is 0
+    import numpy as np
+
+    divisor = columns["_time_divisor"]
+    time = np.divide(
+        columns["_time_count"], divisor,
+        out=np.zeros(divisor.shape, dtype=np.float64),
+        where=divisor != 0,
+    )
+    columns["time"] = time.astype(np.int64)
+
+
 class _LIOMessage(DeviceMessage):
     MESSAGE_LENGTH = 0
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "HANDLER_NAME" not in cls.__dict__:
+            cls.HANDLER_NAME = _handler_name(cls.__name__)
+
     def __init__(self, packet: Packet | None = None) -> None:
         checked = _checked_message_packet(
             self.__class__.__name__,
@@ -49,9 +82,9 @@ class _LIOMessage(DeviceMessage):
             super().__init__(length=self.MESSAGE_LENGTH)
 
     def create_dispatcher(self) -> MessageDispatcher:
-        return MessageDispatcher(self.code, lambda p: self.__class__(p))
+        return MessageDispatcher(self.code, type(self))
 
     def dispatch(self, listener) -> None:
-        handler_name = _handler_name(self.__class__.__name__)
-        if hasattr(listener, handler_name):
-            getattr(listener, handler_name)(self)
+        handler = getattr(listener, self.HANDLER_NAME, None)
+        if handler is not None:
+            handler(self)
@@ -1,18 +1,15 @@
 from labbench_comm.devices.lio.definitions import EventID
 from labbench_comm.devices.lio.messages.base import _LIOMessage
+from labbench_comm.protocols.layout import Field, Layout
 
 
 class EventMessage(_LIOMessage):
     MESSAGE_LENGTH = 1
 
+    LAYOUT = Layout(
+        Field("event", 0, enum=EventID, settable=True),
+    )
+
     @property
     def code(self) -> int:
         return 0x81
-
-    @property
-    def event(self) -> EventID:
-        return EventID(self.packet.get_byte(0))
-
-    @event.setter
-    def event(self, value: EventID) -> None:
-        self.packet.insert_byte(0, int(value))
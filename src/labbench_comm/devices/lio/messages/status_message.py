@@ -5,39 +5,22 @@ from labbench_comm.devices.lio.definitions import (
     SystemError,
 )
 from labbench_comm.devices.lio.messages.base import _LIOMessage
+from labbench_comm.protocols.layout import Field, Layout
 
 
 class StatusMessage(_LIOMessage):
     MESSAGE_LENGTH = 7
 
+    LAYOUT = Layout(
+        Field("state", 0, enum=DeviceState),
+        Field("port01", 1, enum=ResponseDevice),
+        Field("port01_subclass", 2, enum=ResponseSubClass),
+        Field("port02", 3, enum=ResponseDevice),
+        Field("port02_subclass", 4, enum=ResponseSubClass),
+        Field("power", 5, "bool"),
+        Field("error", 6, enum=SystemError),
+    )
+
     @property
     def code(self) -> int:
         return 0x80
-
-    @property
-    def state(self) -> DeviceState:
-        return DeviceState(self.packet.get_byte(0))
-
-    @property
-    def port01(self) -> ResponseDevice:
-        return ResponseDevice(self.packet.get_byte(1))
-
-    @property
-    def port01_subclass(self) -> ResponseSubClass:
-        return ResponseSubClass(self.packet.get_byte(2))
-
-    @property
-    def port02(self) -> ResponseDevice:
-        return ResponseDevice(self.packet.get_byte(3))
-
-    @property
-    def port02_subclass(self) -> ResponseSubClass:
-        return ResponseSubClass(self.packet.get_byte(4))
-
-    @property
-    def power(self) -> bool:
-        return self.packet.get_byte(5) != 0
-
-    @property
-    def error(self) -> SystemError:
-        return SystemError(self.packet.get_byte(6))
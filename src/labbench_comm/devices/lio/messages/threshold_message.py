@@ -4,48 +4,31 @@ from labbench_comm.devices.lio.definitions import (
     ResponseSubClass,
     saturate,
 )
-from labbench_comm.devices.lio.messages.base import _LIOMessage
+from labbench_comm.devices.lio.messages.base import (
+    _LIOMessage,
+    _derive_signal_columns,
+)
+from labbench_comm.protocols.layout import Field, Layout
 
 
 class ThresholdMessage(_LIOMessage):
     MESSAGE_LENGTH = 19
 
+    LAYOUT = Layout(
+        Field("port", 0, enum=ResponsePort),
+        Field("device", 1, enum=ResponseDevice),
+        Field("sub_class", 2, enum=ResponseSubClass),
+        Field("signal", 3, "uint16"),
+        Field("a", 5, "int32", divisor=4096.0),
+        Field("b", 9, "int32", divisor=4096.0),
+        Field("range", 13, "uint16"),
+        Field("response_time", 15, "uint32"),
+    )
+
     @property
     def code(self) -> int:
         return 0x95
 
-    @property
-    def port(self) -> ResponsePort:
-        return ResponsePort(self.packet.get_byte(0))
-
-    @property
-    def device(self) -> ResponseDevice:
-        return ResponseDevice(self.packet.get_byte(1))
-
-    @property
-    def sub_class(self) -> ResponseSubClass:
-        return ResponseSubClass(self.packet.get_byte(2))
-
-    @property
-    def signal(self) -> float:
-        return self.packet.get_uint16(3)
-
-    @property
-    def a(self) -> float:
-        return self.packet.get_int32(5) / 4096.0
-
-    @property
-    def b(self) -> float:
-        return self.packet.get_int32(9) / 4096.0
-
-    @property
-    def range(self) -> float:
-        return self.packet.get_uint16(13)
-
-    @property
-    def response_time(self) -> int:
-        return self.packet.get_uint32(15)
-
     @property
     def value(self) -> float:
         if self.range == 0:
@@ -55,3 +38,7 @@ class ThresholdMessage(_LIOMessage):
     @property
     def voltage(self) -> float:
         return self.a * self.signal / 1023.0 + self.b
+
+    @classmethod
+    def derive_columns(cls, columns: dict) -> None:
+        _derive_signal_columns(columns)
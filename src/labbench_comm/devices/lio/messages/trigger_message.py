@@ -3,35 +3,36 @@ from labbench_comm.devices.lio.definitions import (
     ResponsePort,
     ResponseSubClass,
 )
-from labbench_comm.devices.lio.messages.base import _LIOMessage
+from labbench_comm.devices.lio.messages.base import (
+    _LIOMessage,
+    _derive_time_columns,
+)
+from labbench_comm.protocols.layout import Field, Layout
 
 
 class TriggerMessage(_LIOMessage):
     MESSAGE_LENGTH = 9
 
+    LAYOUT = Layout(
+        Field("port", 0, enum=ResponsePort),
+        Field("device", 1, enum=ResponseDevice),
+        Field("sub_class", 2, enum=ResponseSubClass),
+        Field("trigger_code", 3),
+        Field("_time_divisor", 4),
+        Field("_time_count", 5, "uint32"),
+    )
+
     @property
     def code(self) -> int:
         return 0x93
 
-    @property
-    def port(self) -> ResponsePort:
-        return ResponsePort(self.packet.get_byte(0))
-
-    @property
-    def device(self) -> ResponseDevice:
-        return ResponseDevice(self.packet.get_byte(1))
-
-    @property
-    def sub_class(self) -> ResponseSubClass:
-        return ResponseSubClass(self.packet.get_byte(2))
-
-    @property
-    def trigger_code(self) -> int:
-        return self.packet.get_byte(3)
-
     @property
     def time(self) -> int:
-        divisor = self.packet.get_byte(4)
+        divisor = self._time_divisor
         if divisor == 0:
             return 0
-        return int(self.packet.get_uint32(5) / divisor)
+        return int(self._time_count / divisor)
+
+    @classmethod
+    def derive_columns(cls, columns: dict) -> None:
+        _derive_time_columns(columns)
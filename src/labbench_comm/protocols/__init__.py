@@ -13,8 +13,9 @@ This package contains:
 # Framing / transport helpers
 # ----------------------------------------------------------------------
 
-from .frame import Frame
+from .frame import Frame, FrameEncoder
 from .destuffer import Destuffer
+from .packet_receiver import PacketReceiver
 
 # ----------------------------------------------------------------------
 # Packet
@@ -32,6 +33,20 @@ from .packet import (
 
 from .device_function import DeviceFunction
 from .device_message import DeviceMessage
+from .layout import Field, Layout
+from .batch import BatchCollector, BatchDecoder
+from .timeouts import TimeoutPolicy
+from .scheduler import Priority, WaitStatistics
+from .subscription import DropPolicy, Subscription
+from .metrics import BusMetrics, FunctionMetrics, LatencyHistogram
+from .link import LinkBudget, LinkDirection, LinkMonitor, LinkUtilization
+from .tracing import (
+    BinaryFileSink,
+    RingBufferSink,
+    TraceEvent,
+    TraceRecord,
+    read_trace,
+)
 
 # ----------------------------------------------------------------------
 # Dispatchers
@@ -52,6 +67,7 @@ from .exceptions import (
     PeripheralNotRespondingError,
     FunctionNotAcknowledgedError,
     IncompatibleDeviceError,
+    SubscriptionClosedError,
 )
 
 # ----------------------------------------------------------------------
@@ -67,7 +83,9 @@ from .error_codes import ErrorCode
 __all__ = [
     # Framing
     "Frame",
+    "FrameEncoder",
     "Destuffer",
+    "PacketReceiver",
 
     # Packet
     "Packet",
@@ -77,6 +95,27 @@ __all__ = [
     # Base types
     "DeviceFunction",
     "DeviceMessage",
+    "Field",
+    "Layout",
+    "BatchCollector",
+    "BatchDecoder",
+    "TimeoutPolicy",
+    "Priority",
+    "WaitStatistics",
+    "DropPolicy",
+    "Subscription",
+    "BusMetrics",
+    "FunctionMetrics",
+    "LatencyHistogram",
+    "LinkBudget",
+    "LinkDirection",
+    "LinkMonitor",
+    "LinkUtilization",
+    "TraceEvent",
+    "TraceRecord",
+    "RingBufferSink",
+    "BinaryFileSink",
+    "read_trace",
 
     # Dispatchers
     "FunctionDispatcher",
@@ -90,6 +129,7 @@ __all__ = [
     "PeripheralNotRespondingError",
     "FunctionNotAcknowledgedError",
     "IncompatibleDeviceError",
+    "SubscriptionClosedError",
 
     # Error codes
     "ErrorCode",
@@ -0,0 +1,241 @@
+"""
+Columnar batch decoding of fixed-layout messages.
+
+A :class:`BatchDecoder` turns a run of payloads of one message type into a
+NumPy structured array with a single ``np.frombuffer`` call, using a dtype
+derived from the message ``LAYOUT`` (so it matches the wire layout byte for
+byte). :meth:`BatchDecoder.columns` then computes the scaled and derived
+values vectorized, with the same arithmetic as the message properties.
+
+A :class:`BatchCollector` accumulates payloads without building message
+objects. It is a plain packet callback, so it works offline on recordings
+(``PacketReceiver.on_packet(collector)``) and live on a bus
+(``BusCentral.add_packet_listener(code, collector)``).
+
+NumPy is an optional dependency (``pip install labbench_comm[numpy]``).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Type, Union
+
+from labbench_comm.protocols.device_message import DeviceMessage
+from labbench_comm.protocols.layout import Field, Layout
+from labbench_comm.protocols.packet import Packet
+
+
+_DTYPE_CODES = {
+    "uint8": "u1",
+    "bool": "?",
+    "uint16": "u2",
+    "int16": "i2",
+    "uint32": "u4",
+    "int32": "i4",
+}
+
+BatchInput = Union[bytes, bytearray, memoryview, Iterable[Union[Packet, bytes]]]
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "Batch decoding requires NumPy; install it with "
+            "`pip install labbench_comm[numpy]`"
+        ) from exc
+    return numpy
+
+
+def raw_name(field: Field) -> str:
+    """
+    Column name holding the wire value of ``field``.
+
+    Unscaled fields keep their name; scaled fields use their ``binary``
+    name, or ``<name>_binary`` when none is declared.
+    """
+    if not field.scaled:
+        return field.name
+    return field.binary or f"{field.name}_binary"
+
+
+def layout_dtype(layout: Layout, reverse_endianity: bool = False):
+    """
+    NumPy structured dtype matching ``layout`` on the wire.
+    """
+    np = _require_numpy()
+    order = ">" if reverse_endianity else "<"
+    return np.dtype({
+        "names": [raw_name(f) for f in layout.fields],
+        "formats": [order + _DTYPE_CODES[f.type] for f in layout.fields],
+        "offsets": [f.offset for f in layout.fields],
+        "itemsize": layout.size,
+    })
+
+
+# ----------------------------------------------------------------------
+# BatchDecoder
+# ----------------------------------------------------------------------
+
+class BatchDecoder:
+    """
+    Decode many payloads of one message type at once.
+    """
+
+    def __init__(
+        self,
+        message_type: Type[DeviceMessage],
+        reverse_endianity: bool = False,
+    ) -> None:
+        layout = message_type.LAYOUT
+        if layout is None:
+            raise ValueError(f"{message_type.__name__} does not declare a LAYOUT")
+
+        self._np = _require_numpy()
+        self._message_type = message_type
+        self._layout = layout
+        self._code = message_type().code
+        self._dtype = layout_dtype(layout, reverse_endianity)
+
+    @property
+    def message_type(self) -> Type[DeviceMessage]:
+        return self._message_type
+
+    @property
+    def code(self) -> int:
+        return self._code
+
+    @property
+    def size(self) -> int:
+        """
+        Payload length of one message, in bytes.
+        """
+        return self._layout.size
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    # ------------------------------------------------------------------
+    # Decoding
+    # ------------------------------------------------------------------
+
+    def decode(self, data: BatchInput):
+        """
+        Decode payloads into a structured array of wire values.
+
+        ``data`` is either one buffer of back-to-back payloads, which is
+        wrapped without copying, or an iterable of packets/payloads, which
+        is joined first.
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            data = self._join(data)
+
+        if len(data) % self.size != 0:
+            raise ValueError(
+                f"Buffer length {len(data)} is not a multiple of the "
+                f"{self._message_type.__name__} payload length ({self.size})"
+            )
+
+        return self._np.frombuffer(data, dtype=self._dtype)
+
+    def columns(self, records) -> Dict[str, Any]:
+        """
+        Compute value columns from decoded records.
+
+        Returns every field under its property name (scaled where the
+        layout scales it; enums stay as integer codes), the wire values of
+        scaled fields under their raw names, and the message's derived
+        columns (see ``DeviceMessage.derive_columns``).
+        """
+        columns: Dict[str, Any] = {}
+
+        for field in self._layout.fields:
+            raw = records[raw_name(field)]
+            if field.scaled:
+                value = raw
+                if field.scale is not None:
+                    value = field.scale * value
+                if field.divisor is not None:
+                    value = value / field.divisor
+                columns[field.name] = value
+                columns[raw_name(field)] = raw
+            else:
+                columns[field.name] = raw
+
+        self._message_type.derive_columns(columns)
+        return columns
+
+    def decode_columns(self, data: BatchInput) -> Dict[str, Any]:
+        return self.columns(self.decode(data))
+
+    def _join(self, items: Iterable[Union[Packet, bytes]]) -> bytes:
+        parts = []
+        for item in items:
+            if isinstance(item, Packet):
+                if item.code != self._code:
+                    raise ValueError(
+                        f"Packet code 0x{item.code:02X} does not match "
+                        f"{self._message_type.__name__} (0x{self._code:02X})"
+                    )
+                item = item.payload
+            if len(item) != self.size:
+                raise ValueError(
+                    f"Payload length {len(item)} does not match "
+                    f"{self._message_type.__name__} ({self.size})"
+                )
+            parts.append(item)
+        return b"".join(parts)
+
+
+# ----------------------------------------------------------------------
+# BatchCollector
+# ----------------------------------------------------------------------
+
+class BatchCollector:
+    """
+    Packet callback that buffers payloads of one message type.
+
+    Packets with another code are ignored; packets of the right code but
+    the wrong length are counted in :attr:`rejected`. Payloads are copied
+    into one growing buffer, so views delivered in zero-copy mode may be
+    passed directly.
+    """
+
+    def __init__(
+        self,
+        message_type: Type[DeviceMessage],
+        reverse_endianity: bool = False,
+    ) -> None:
+        self._decoder = BatchDecoder(message_type, reverse_endianity)
+        self._code = self._decoder.code
+        self._size = self._decoder.size
+        self._buffer = bytearray()
+        self.rejected: int = 0
+
+    def __call__(self, packet: Packet) -> None:
+        if packet.code != self._code:
+            return
+        if packet.length != self._size:
+            self.rejected += 1
+            return
+        self._buffer += packet.payload
+
+    def __len__(self) -> int:
+        return len(self._buffer) // self._size
+
+    @property
+    def decoder(self) -> BatchDecoder:
+        return self._decoder
+
+    def drain(self):
+        """
+        Return the buffered messages as a structured array and start over.
+
+        The array wraps the collected buffer without copying.
+        """
+        data, self._buffer = self._buffer, bytearray()
+        return self._decoder.decode(data)
+
+    def drain_columns(self) -> Dict[str, Any]:
+        return self._decoder.columns(self.drain())
@@ -1,19 +1,78 @@
 import asyncio
-from typing import Optional, Any
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 
-from labbench_comm.protocols.frame import Frame
-from labbench_comm.protocols.destuffer import Destuffer
+from labbench_comm.protocols.frame import FrameEncoder
 from labbench_comm.protocols.packet import Packet
+from labbench_comm.protocols.packet_receiver import PacketReceiver
 from labbench_comm.protocols.device_function import DeviceFunction
 from labbench_comm.protocols.device_message import DeviceMessage
+from labbench_comm.protocols.link import LinkBudget, LinkMonitor, LinkUtilization
 from labbench_comm.protocols.message_dispatcher import MessageDispatcher
+from labbench_comm.protocols.metrics import BusMetrics
+from labbench_comm.protocols.scheduler import (
+    Priority,
+    RequestScheduler,
+    WaitStatistics,
+)
+from labbench_comm.protocols.subscription import DropPolicy, Subscription
+from labbench_comm.protocols.timeouts import TimeoutPolicy
+from labbench_comm.protocols.tracing import (
+    MESSAGE_DISPATCHED,
+    PACKET_DECODED,
+    REQUEST_WRITTEN,
+    RESPONSE_MATCHED,
+    TraceSink,
+    monotonic_ns,
+)
 from labbench_comm.protocols.exceptions import (
     PeripheralNotRespondingError,
     FunctionNotAcknowledgedError,
-    PacketFormatError,
 )
 
 
+class _Transaction:
+    """
+    A request that has been (or is being) sent and awaits its response.
+
+    A transaction that timed out or was cancelled stays in the pending
+    queue, no longer live, so that a late response is consumed by it
+    rather than attributed to a later request.
+    """
+
+    __slots__ = (
+        "function", "code", "address", "future", "timer", "live",
+        "holds_slot", "sent_at", "wire_ms", "sent_ns", "timeout",
+    )
+
+    def __init__(
+        self,
+        function: DeviceFunction,
+        code: int,
+        future: asyncio.Future,
+        holds_slot: bool = True,
+        address: int = 0,
+    ) -> None:
+        self.function = function
+        self.code = code
+        self.address = address
+        self.future = future
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.live = True
+        # False for batch requests, whose window slots are held by the batch
+        self.holds_slot = holds_slot
+        # Loop time at which the request was written, and the time its
+        # request and response frames take on the wire (TimeoutPolicy)
+        self.sent_at: Optional[float] = None
+        self.wire_ms = 0.0
+        # perf_counter_ns() at the write, only while metrics are enabled
+        self.sent_ns: Optional[int] = None
+        # Seconds to wait for the response once the timer is armed
+        self.timeout = 0.0
+
+
 class BusCentral:
     """
     Asyncio-based coordinator for device communication.
@@ -23,45 +82,324 @@ class BusCentral:
     - Handle request/response matching
     - Dispatch unsolicited messages
     - Enforce timeouts
+
+    Received frames are destuffed, parsed and checksum-verified in one
+    pass by a PacketReceiver; malformed frames are dropped there without
+    raising.
+
+    With zero_copy=True, received frames are delivered as views into the
+    destuffer's arena. Message packets then wrap those views without
+    copying; they are only materialized if a listener keeps them.
+    Function responses are always detached, as the function owns them.
+
+    By default one function is executed at a time (lock-step). With
+    max_in_flight > 1 up to that many requests are sent before their
+    responses arrive. Responses are matched to pending requests in the
+    order they were sent or, with match_by_code=True (for firmware that
+    may answer out of order), to the oldest pending request with the same
+    function code. Error packets (code 0x00) carry no function code and
+    are attributed to the oldest pending request.
+
+    execute_many() and send_many() write a batch of requests or messages
+    as one transmission; execute_many() keeps at most batch_window
+    requests on the wire ahead of their responses.
+
+    Requests time out after timeout_ms unless a timeout_policy is set, in
+    which case the timeout accounts for the frame lengths at the link baud
+    rate and for the latency learned per function code (see TimeoutPolicy);
+    timeout_ms is then the allowance used until latency has been learned.
+
+    Several devices may share one bus (one serial port), each with its
+    own current_address. Responses, error packets and messages are then
+    routed by packet address, and in-flight slots are granted round-robin
+    across addresses (see RequestScheduler) so a busy device cannot
+    starve the others. With a single device attached, everything is
+    delivered to it regardless of address.
+
+    Requests waiting for a slot are served by priority (see Priority and
+    DeviceFunction.PRIORITY): a critical request is written as soon as
+    the current transaction ends, ahead of queued normal and background
+    requests, or during a batch as soon as the next batch response has
+    been matched. Wait times are available per priority from queue_wait.
+
+    Besides the synchronous message listener, messages can be consumed
+    asynchronously through subscribe(); the reader then only queues the
+    packet, and the message is built in the subscriber's task.
+
+    enable_metrics() turns on per function code latency histograms and
+    error counters and link byte/frame counters (see BusMetrics).
+
+    link_utilization reports the measured load of the serial link in each
+    direction and link_budget() estimates whether a planned load fits (see
+    LinkBudget). With admission_threshold set, background requests are
+    deferred while either direction is above that fraction of the link
+    capacity, for at most admission_max_defer_s so that keep-alive pings
+    still go out in time.
+
+    set_tracer() emits timestamped events from the connection, the
+    destuffer and the bus (see labbench_comm.protocols.tracing).
     """
 
-    def __init__(self, connection) -> None:
-        self._device = None
+    # How often a deferred background request re-checks the link
+    ADMISSION_POLL_S = 0.05
+
+    def __init__(
+        self,
+        connection,
+        zero_copy: bool = False,
+        max_in_flight: int = 1,
+        match_by_code: bool = False,
+        timeout_policy: Optional[TimeoutPolicy] = None,
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        self._devices: list[Any] = []
         self._connection = connection
 
-        self._destuffer = Destuffer()
-        self._destuffer.on_receive(self._handle_incoming_frame)
+        self._destuffer = PacketReceiver(zero_copy=zero_copy)
+        self._destuffer.on_packet(self._handle_incoming_packet)
         self._connection.attach_destuffer(self._destuffer)
 
         self.timeout_ms: int = 500
-        self.message_listener: Optional[Any] = None
+        self.timeout_policy: Optional[TimeoutPolicy] = timeout_policy
+        self._message_listener: Optional[Any] = None
 
         self._dispatchers: dict[int, MessageDispatcher] = {}
+        self._message_types: dict[int, type] = {}
+        # Per listener: message code -> (constructor, bound handler)
+        self._dispatch_tables: dict[int, tuple[Any, dict[int, tuple]]] = {}
+        self._packet_listeners: dict[int, list[Callable[[Packet], None]]] = {}
+        self._exclusive_codes: set[int] = set()
+        self._subscriptions: dict[int, list[Subscription]] = {}
+        # LOSSLESS subscriptions that asked for reading to be paused
+        self._pausing: set[Subscription] = set()
+
+        # Requests in the order they were written to the connection
+        self._max_in_flight = max_in_flight
+        self._match_by_code = match_by_code
+        self._pending: deque[_Transaction] = deque()
+        self._window = RequestScheduler(max_in_flight)
+        self._last_response_at = 0.0
 
-        self._current_function: Optional[DeviceFunction] = None
-        self._current_exception: Optional[Exception] = None
+        # Frames are encoded into one reusable buffer; writes are
+        # serialized so the buffer is never reused while in flight.
+        self._encoder = FrameEncoder()
+        self._write_lock = asyncio.Lock()
 
-        self._completion_event = asyncio.Event()
-        self._lock = asyncio.Lock()
+        # Serializes batches claiming the whole in-flight window, the
+        # number of slots the running batch still holds, and the number it
+        # has lent to critical requests
+        self._batch_lock = asyncio.Lock()
+        self._batch_slots = 0
+        self._lent_slots = 0
+        # Batch requests written ahead of their responses (execute_many)
+        self.batch_window: int = 16
+
+        # Admission control of background requests; None disables it
+        self.admission_threshold: Optional[float] = None
+        self.admission_max_defer_s: float = 0.5
+        self.admission_wait = WaitStatistics()
+
+        # Instrumentation; None (the default) disables it
+        self.tracer: Optional[TraceSink] = None
+        self.metrics: Optional[BusMetrics] = None
+        self._metrics_interval: Optional[float] = None
+        self._metrics_task: Optional[asyncio.Task] = None
+        self._log = logging.getLogger(__name__)
 
     def attach_device(self, device) -> None:
-        self._device = device
+        """
+        Attach a device; devices sharing the bus need distinct addresses.
+        """
+        if device not in self._devices:
+            self._devices.append(device)
         self.message_listener = device
 
+    def detach_device(self, device) -> None:
+        if device in self._devices:
+            self._devices.remove(device)
+        self._dispatch_tables.pop(id(device), None)
+        if self.message_listener is device:
+            self.message_listener = self._devices[-1] if self._devices else None
+
+    @property
+    def message_listener(self) -> Optional[Any]:
+        """
+        Object whose on_<name>_message handlers receive messages.
+
+        Handlers are looked up when the first message arrives after the
+        listener or the registered messages change, not on every message.
+        """
+        return self._message_listener
+
+    @message_listener.setter
+    def message_listener(self, listener: Optional[Any]) -> None:
+        self._message_listener = listener
+        self._dispatch_tables.clear()
+
+    @property
+    def devices(self) -> tuple:
+        return tuple(self._devices)
+
+    @property
+    def shared(self) -> bool:
+        """
+        True if more than one device is attached (address routing).
+        """
+        return len(self._devices) > 1
+
+    @property
+    def max_in_flight(self) -> int:
+        return self._max_in_flight
+
+    @property
+    def match_by_code(self) -> bool:
+        return self._match_by_code
+
+    @property
+    def baudrate(self) -> Optional[int]:
+        """
+        Link speed, from the connection or else the attached device.
+        """
+        baudrate = getattr(self._connection, "baudrate", None)
+        if baudrate is None and self._devices:
+            baudrate = getattr(self._devices[0], "baudrate", None)
+        return baudrate
+
+    @property
+    def queue_wait(self) -> Dict[Priority, WaitStatistics]:
+        """
+        Time requests waited for an in-flight slot, per priority.
+        """
+        return self._window.wait_statistics
+
+    @property
+    def link(self) -> Optional[LinkMonitor]:
+        """
+        Wire byte counters of the connection, if it keeps them.
+        """
+        return getattr(self._connection, "link", None)
+
+    @property
+    def link_utilization(self) -> Optional[LinkUtilization]:
+        """
+        Measured link load, or None if the connection does not measure it.
+        """
+        link = self.link
+        if link is None:
+            return None
+
+        sent, received = link.rates()
+        baudrate = self.baudrate
+        if not baudrate:
+            return LinkUtilization(sent, received, None, None)
+
+        capacity = baudrate / LinkBudget.BITS_PER_BYTE
+        return LinkUtilization(sent, received, sent / capacity, received / capacity)
+
+    def link_budget(self, threshold: float = 0.8) -> LinkBudget:
+        """
+        Empty LinkBudget for the baud rate of this bus.
+        """
+        baudrate = self.baudrate
+        if not baudrate:
+            raise ValueError("Baud rate of the link is unknown")
+        return LinkBudget(baudrate, threshold)
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of requests sent and still awaiting a response.
+        """
+        return sum(1 for t in self._pending if t.live)
+
     # ------------------------------------------------------------------
     # Connection lifecycle
     # ------------------------------------------------------------------
 
     async def open(self) -> None:
         await self._connection.open()
+        self._start_metrics_log()
 
     async def close(self) -> None:
+        await self._stop_metrics_log()
         await self._connection.close()
+        self._fail_pending(RuntimeError("Connection closed"))
+        for subscriptions in list(self._subscriptions.values()):
+            for subscription in list(subscriptions):
+                subscription.close()
 
     @property
     def is_open(self) -> bool:
         return self._connection.is_open
 
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def enable_metrics(self, log_interval_s: Optional[float] = None) -> BusMetrics:
+        """
+        Start collecting metrics and return the collector.
+
+        With log_interval_s, a summary line is logged at INFO level at
+        that interval while the bus is open. Enabling again keeps the
+        collected counters and only changes the interval.
+        """
+        if self.metrics is None:
+            self.metrics = BusMetrics(self._destuffer)
+
+        self._metrics_interval = log_interval_s
+        if self._metrics_task is not None:
+            self._metrics_task.cancel()
+            self._metrics_task = None
+        if self.is_open:
+            self._start_metrics_log()
+        return self.metrics
+
+    def disable_metrics(self) -> None:
+        self.metrics = None
+        self._metrics_interval = None
+        if self._metrics_task is not None:
+            self._metrics_task.cancel()
+            self._metrics_task = None
+
+    def _start_metrics_log(self) -> None:
+        if self._metrics_interval and self._metrics_task is None:
+            self._metrics_task = asyncio.get_running_loop().create_task(
+                self._log_metrics(self._metrics_interval),
+                name="BusCentral.metrics",
+            )
+
+    async def _stop_metrics_log(self) -> None:
+        task, self._metrics_task = self._metrics_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _log_metrics(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            if self.metrics is not None:
+                self._log.info("Bus metrics: %s", self.metrics.summary())
+
+    # ------------------------------------------------------------------
+    # Tracing
+    # ------------------------------------------------------------------
+
+    def set_tracer(self, sink: Optional[TraceSink]) -> None:
+        """
+        Send trace events of the bus, its destuffer and (if supported)
+        its connection to ``sink``; None turns tracing off.
+        """
+        self.tracer = sink
+        self._destuffer.tracer = sink
+        if hasattr(self._connection, "tracer"):
+            self._connection.tracer = sink
+
     # ------------------------------------------------------------------
     # Function execution
     # ------------------------------------------------------------------
@@ -70,46 +408,389 @@ class BusCentral:
         self,
         function: DeviceFunction,
         address: Optional[int] = None,
+        timeout_ms: Optional[int] = None,
+        priority: Optional[Priority] = None,
     ) -> None:
+        """
+        Send a request and wait for its response.
+
+        priority defaults to the function's PRIORITY. Raises
+        PeripheralNotRespondingError on timeout and
+        FunctionNotAcknowledgedError if the device answers with an error.
+        """
         if function is None:
             return
 
+        future = await self.submit(function, address, timeout_ms, priority)
+        await future
+
+    async def submit(
+        self,
+        function: DeviceFunction,
+        address: Optional[int] = None,
+        timeout_ms: Optional[int] = None,
+        priority: Optional[Priority] = None,
+    ) -> asyncio.Future:
+        """
+        Send a request without waiting for its response.
+
+        Waits for a free slot in the in-flight window and for the request
+        to be written, then returns a future that resolves to the function
+        once its response has been received (or fails with the same
+        exceptions as execute). The timeout (default timeout_ms) runs from
+        the moment the request is written.
+        """
+        if not self.is_open:
+            raise RuntimeError("Connection is not open")
+
+        if priority is None:
+            priority = function.PRIORITY
+
+        if priority >= Priority.BACKGROUND and self.admission_threshold is not None:
+            await self._admit()
+        await self._window.acquire(address or 0, priority)
+        transaction: Optional[_Transaction] = None
+        try:
+            function.on_send()
+            packet = function.get_request_packet()
+            packet.address = address or 0
+
+            future = asyncio.get_running_loop().create_future()
+            transaction = _Transaction(
+                function, packet.code, future, address=packet.address
+            )
+            transaction.timeout = self._timeout(transaction, packet, timeout_ms)
+            await self._write_packets((packet,), (transaction,))
+        except BaseException:
+            if transaction is None:
+                self._release_slot()
+            else:
+                self._finish(transaction)
+            raise
+
+        if not self._behind_batch(transaction):
+            self._arm(transaction)
+        future.add_done_callback(lambda f: self._on_future_done(transaction))
+        return future
+
+    async def execute_many(
+        self,
+        functions: Iterable[DeviceFunction],
+        address: Optional[int] = None,
+        timeout_ms: Optional[int] = None,
+        priority: Optional[Priority] = None,
+    ) -> List[Optional[BaseException]]:
+        """
+        Send a batch of requests with few writes and wait for all responses.
+
+        All request frames are prepared up front. The first batch_window
+        of them are written with a single write_bytes call, the rest as
+        responses come in: whenever half of the window has been answered,
+        it is filled up again with one write. The batch claims the whole
+        in-flight window, so
+        other requests wait for it, regardless of max_in_flight. Critical
+        requests are the exception: each matched batch response hands a
+        slot to a waiting critical request, which is written right away.
+        It is then behind at most batch_window - 1 batch requests on the
+        wire, however large the batch. Responses are matched as for
+        submit(). priority defaults to the most urgent PRIORITY among the
+        functions.
+
+        Returns one entry per function: None if it succeeded, otherwise
+        the exception it failed with. Failures are not raised. As the
+        device answers the requests one after another, the timeout of
+        each request runs from the response to (or timeout of) the one
+        before it; so does that of a request written behind the batch.
+        """
+        functions = list(functions)
+        if not functions:
+            return []
+
         if not self.is_open:
             raise RuntimeError("Connection is not open")
 
-        async with self._lock:
-            self._completion_event.clear()
-            self._current_function = function
-            self._current_exception = None
+        if priority is None:
+            priority = min(f.PRIORITY for f in functions)
+
+        if priority >= Priority.BACKGROUND and self.admission_threshold is not None:
+            await self._admit()
+        await self._acquire_window(address or 0, priority)
+        self._batch_slots = self._max_in_flight
+        try:
+            return await self._execute_batch(functions, address, timeout_ms)
+        finally:
+            slots, self._batch_slots = self._batch_slots, 0
+            # Slots still lent are released by their requests as usual
+            self._lent_slots = 0
+            for _ in range(slots):
+                self._window.release()
+
+    async def _admit(self) -> None:
+        """
+        Wait while the link is above admission_threshold, up to
+        admission_max_defer_s.
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadline = start + self.admission_max_defer_s
+        while True:
+            utilization = self.link_utilization
+            if utilization is None or utilization.peak is None:
+                return
+            if utilization.peak <= self.admission_threshold:
+                break
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(self.ADMISSION_POLL_S, remaining))
+
+        self.admission_wait.record((loop.time() - start) * 1000.0)
+
+    async def _acquire_window(self, address: int, priority: Priority) -> None:
+        async with self._batch_lock:
+            acquired = 0
+            try:
+                for _ in range(self._max_in_flight):
+                    await self._window.acquire(address, priority)
+                    acquired += 1
+            except BaseException:
+                for _ in range(acquired):
+                    self._window.release()
+                raise
+
+    async def _execute_batch(
+        self,
+        functions: List[DeviceFunction],
+        address: Optional[int],
+        timeout_ms: Optional[int],
+    ) -> List[Optional[BaseException]]:
+        loop = asyncio.get_running_loop()
+        results: List[Optional[BaseException]] = [None] * len(functions)
+        packets: List[Packet] = []
+        transactions: List[_Transaction] = []
+        indices: List[int] = []
 
+        for index, function in enumerate(functions):
             try:
-                await self._send_request(function, address)
+                function.on_send()
+                packet = function.get_request_packet()
+            except Exception as exc:
+                results[index] = exc
+                continue
 
-                await asyncio.wait_for(
-                    self._completion_event.wait(),
-                    timeout=self.timeout_ms / 1000.0,
+            packet.address = address or 0
+            transaction = _Transaction(
+                function, packet.code, loop.create_future(), False,
+                packet.address,
+            )
+            transaction.timeout = self._timeout(transaction, packet, timeout_ms)
+            packets.append(packet)
+            transactions.append(transaction)
+            indices.append(index)
+
+        if not packets:
+            return results
+
+        window = max(1, self.batch_window)
+        refill = max(1, window // 2)
+        count = len(packets)
+        written = 0
+        stop = min(window, count)
+        try:
+            while True:
+                await self._write_packets(
+                    packets[written:stop], transactions[written:stop]
                 )
+                for transaction in transactions[written:stop]:
+                    transaction.future.add_done_callback(
+                        lambda f, t=transaction: self._on_future_done(t)
+                    )
+                written = stop
+                # Timers are armed one after another as responses arrive
+                self._arm_next()
+                if written == count:
+                    break
 
-            except asyncio.TimeoutError:
-                raise PeripheralNotRespondingError("No response from device")
+                # Refill the window once half of it has been answered
+                answered = written - window + refill
+                await asyncio.wait((transactions[answered - 1].future,))
+                while answered < written and transactions[answered].future.done():
+                    answered += 1
+                stop = min(count, answered + window)
+        except BaseException:
+            for transaction in transactions[written:]:
+                self._finish(transaction)
+            for transaction in transactions[:written]:
+                transaction.future.cancel()
+            raise
 
-            finally:
-                # Ensure clean state even on cancellation
-                self._completion_event.clear()
-                self._current_function = None
+        outcomes = await asyncio.gather(
+            *(t.future for t in transactions), return_exceptions=True
+        )
+        for index, outcome in zip(indices, outcomes):
+            if isinstance(outcome, BaseException):
+                results[index] = outcome
+        return results
+
+    def _timeout(
+        self,
+        transaction: _Transaction,
+        packet: Packet,
+        timeout_ms: Optional[int],
+    ) -> float:
+        """
+        Timeout in seconds for a request about to be written.
+        """
+        if timeout_ms is not None:
+            return timeout_ms / 1000.0
+
+        policy = self.timeout_policy
+        if policy is None:
+            return self.timeout_ms / 1000.0
+
+        response_length = transaction.function.get_response_packet().length
+        wire_bytes = self._encoder.frame_length(packet) + (
+            FrameEncoder.max_frame_length(response_length)
+        )
+        transaction.wire_ms = policy.wire_time_ms(wire_bytes, self.baudrate)
+        return policy.timeout_ms(
+            transaction.code, transaction.wire_ms, self.timeout_ms
+        ) / 1000.0
+
+    def _arm(self, transaction: _Transaction) -> None:
+        # Start the response timeout, unless already started or finished
+        if transaction.live and transaction.timer is None:
+            transaction.timer = asyncio.get_running_loop().call_later(
+                transaction.timeout, self._expire, transaction
+            )
 
-            if self._current_exception is not None:
-                raise self._current_exception
+    def _arm_next(self) -> None:
+        for transaction in self._pending:
+            if transaction.live:
+                self._arm(transaction)
+                return
 
-    async def _send_request(
+    def _behind_batch(self, transaction: _Transaction) -> bool:
+        # True if batch requests written before it still await responses
+        for pending in self._pending:
+            if pending is transaction:
+                return False
+            if pending.live and not pending.holds_slot:
+                return True
+        return False
+
+    def _expire(self, transaction: _Transaction) -> None:
+        transaction.timer = None
+        if self.timeout_policy is not None:
+            self.timeout_policy.timed_out(transaction.code)
+        if self.metrics is not None:
+            self.metrics.timed_out(transaction.code)
+        self._finish(
+            transaction,
+            exception=PeripheralNotRespondingError("No response from device"),
+        )
+
+    def _on_future_done(self, transaction: _Transaction) -> None:
+        # Cancelled by the caller while still pending: keep it queued as
+        # a stale entry so its response is not given to another request
+        if transaction.future.cancelled():
+            self._finish(transaction)
+
+    def _finish(
         self,
-        function: DeviceFunction,
-        address: Optional[int],
+        transaction: _Transaction,
+        exception: Optional[BaseException] = None,
     ) -> None:
-        function.on_send()
-        request_bytes = function.get_request(address or 0)
-        framed = Frame.encode(request_bytes)
-        await self._connection.write_bytes(framed)
+        if not transaction.live:
+            return
+
+        transaction.live = False
+        transaction.function = None
+        if transaction.timer is not None:
+            transaction.timer.cancel()
+            transaction.timer = None
+        if transaction.holds_slot:
+            self._release_slot()
+        elif self._batch_slots and self._window.grant(Priority.CRITICAL):
+            # A critical request does not wait for the rest of the batch
+            self._batch_slots -= 1
+            self._lent_slots += 1
+
+        future = transaction.future
+        if not future.done():
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(None)
+
+        self._arm_next()
+
+    def _release_slot(self) -> None:
+        if not self._lent_slots:
+            self._window.release()
+            return
+
+        # Lent by the running batch: to the next critical request, or
+        # back to the batch rather than to queued normal requests
+        if not self._window.grant(Priority.CRITICAL):
+            self._lent_slots -= 1
+            self._batch_slots += 1
+
+    def _fail_pending(self, exception: BaseException) -> None:
+        pending, self._pending = self._pending, deque()
+        for transaction in pending:
+            self._finish(transaction, exception=exception)
+
+    async def _write_packets(
+        self,
+        packets: Sequence[Packet],
+        transactions: Sequence[_Transaction] = (),
+    ) -> None:
+        async with self._write_lock:
+            if transactions:
+                if not any(t.live for t in self._pending):
+                    # Nothing live is outstanding, so stale entries can no
+                    # longer be confused with the new requests' responses
+                    self._pending.clear()
+                # Queued under the write lock so that the pending order is
+                # the order on the wire
+                self._pending.extend(transactions)
+                sent_at = asyncio.get_running_loop().time()
+                for transaction in transactions:
+                    transaction.sent_at = sent_at
+
+            if len(packets) == 1:
+                frame = self._encoder.encode(packets[0])
+            else:
+                frame = self._encoder.encode_many(packets)
+
+            metrics = self.metrics
+            if metrics is not None:
+                metrics.sent(packets, len(frame))
+                sent_ns = time.perf_counter_ns()
+                for transaction in transactions:
+                    transaction.sent_ns = sent_ns
+            try:
+                await self._connection.write_bytes(frame)
+            except BaseException:
+                for transaction in transactions:
+                    self._pending.remove(transaction)
+                raise
+            finally:
+                try:
+                    frame.release()
+                except BufferError:
+                    pass
+
+            tracer = self.tracer
+            if tracer is not None:
+                now = monotonic_ns()
+                for packet in packets:
+                    tracer.emit(
+                        now, REQUEST_WRITTEN,
+                        packet.code, packet.address, packet.length,
+                    )
 
     # ------------------------------------------------------------------
     # Message sending
@@ -124,18 +805,47 @@ class BusCentral:
             return
 
         message.on_send()
-        framed = Frame.encode(message.get_packet(address))
-        await self._connection.write_bytes(framed)
+        packet = message.packet
+        if address is not None:
+            packet.address = address
+        await self._write_packets((packet,))
+
+    async def send_many(
+        self,
+        messages: Iterable[DeviceMessage],
+        address: Optional[int] = None,
+    ) -> None:
+        """
+        Send several messages in one write.
+        """
+        if not self.is_open:
+            return
+
+        packets = []
+        for message in messages:
+            if message is None:
+                continue
+            message.on_send()
+            packet = message.packet
+            if address is not None:
+                packet.address = address
+            packets.append(packet)
+
+        if packets:
+            await self._write_packets(packets)
 
     # ------------------------------------------------------------------
     # Incoming data handling (called from I/O task)
     # ------------------------------------------------------------------
 
-    def _handle_incoming_frame(self, _: Destuffer, frame: bytes) -> None:
-        try:
-            packet = Packet.from_frame(frame)
-        except PacketFormatError:
-            return
+    def _handle_incoming_packet(self, packet: Packet) -> None:
+        if self.tracer is not None:
+            self.tracer.emit(
+                monotonic_ns(), PACKET_DECODED,
+                packet.code, packet.address, packet.length,
+            )
+        if self.metrics is not None:
+            self.metrics.received(packet)
 
         if packet.code == 0x00:
             self._handle_error_packet(packet)
@@ -146,41 +856,297 @@ class BusCentral:
         else:
             self._dispatch_message(packet)
 
+    def _device_for(self, address: int) -> Optional[Any]:
+        devices = self._devices
+        if len(devices) == 1:
+            return devices[0]
+        for device in devices:
+            if (device.current_address or 0) == address:
+                return device
+        return None
+
+    def _take_pending(
+        self,
+        code: Optional[int],
+        address: int = 0,
+    ) -> Optional[_Transaction]:
+        """
+        Remove and return the pending transaction a response belongs to.
+
+        code is the response's function code, or None for error packets.
+        On a shared bus only requests to the packet's address are
+        considered.
+        """
+        if self.shared:
+            return self._take_pending_from(code, address)
+
+        pending = self._pending
+        if code is None or not self._match_by_code:
+            if code is not None:
+                # Stale entries that cannot have produced this response
+                while pending and not pending[0].live and pending[0].code != code:
+                    pending.popleft()
+            return pending.popleft() if pending else None
+
+        for transaction in pending:
+            if transaction.code == code:
+                pending.remove(transaction)
+                return transaction
+        return None
+
+    def _take_pending_from(
+        self,
+        code: Optional[int],
+        address: int,
+    ) -> Optional[_Transaction]:
+        # Same rules as _take_pending, applied to one address's requests
+        pending = self._pending
+        for transaction in list(pending):
+            if transaction.address != address:
+                continue
+            if code is not None and transaction.code != code:
+                if self._match_by_code:
+                    continue
+                if not transaction.live:
+                    pending.remove(transaction)
+                    continue
+            pending.remove(transaction)
+            return transaction
+        return None
+
     def _handle_function_response(self, packet: Packet) -> None:
-        if self._current_function is None:
+        transaction = self._take_pending(packet.code, packet.address)
+        if transaction is None or not transaction.live:
+            return
+
+        if self.tracer is not None:
+            self._trace_match(transaction, packet)
+
+        if self.timeout_policy is not None:
+            self._observe(transaction)
+
+        function = transaction.function
+        try:
+            function.set_response(packet.detach())
+            function.on_received()
+        except Exception as exc:
+            self._finish(transaction, exception=exc)
             return
 
-        self._current_function.set_response(packet)
-        self._current_function.on_received()
-        self._completion_event.set()
+        metrics = self.metrics
+        if metrics is not None and transaction.sent_ns is not None:
+            metrics.completed(
+                transaction.code, time.perf_counter_ns() - transaction.sent_ns
+            )
+
+        if not transaction.future.done():
+            transaction.future.set_result(function)
+        self._finish(transaction)
 
     def _handle_error_packet(self, packet: Packet) -> None:
+        transaction = self._take_pending(None, packet.address)
+        if transaction is None or not transaction.live:
+            return
+
+        if self.tracer is not None:
+            self._trace_match(transaction, packet)
+
+        if self.timeout_policy is not None:
+            self._observe(transaction)
+
         error_code = packet.get_byte(0)
-        message = self._device.get_error_string(error_code)
-        self._current_exception = FunctionNotAcknowledgedError(message)
-        self._completion_event.set()
+        device = self._device_for(transaction.address)
+        if device is not None:
+            message = device.get_error_string(error_code)
+        else:
+            message = f"Error code 0x{error_code:02X}"
+        if self.metrics is not None:
+            self.metrics.nack(transaction.code, message)
+        self._finish(
+            transaction,
+            exception=FunctionNotAcknowledgedError(message),
+        )
+
+    def _trace_match(self, transaction: _Transaction, packet: Packet) -> None:
+        self.tracer.emit(
+            monotonic_ns(), RESPONSE_MATCHED,
+            transaction.code, transaction.address, packet.length,
+        )
+
+    def _observe(self, transaction: _Transaction) -> None:
+        # Service time: from the write, or from the previous response if
+        # the request was queued behind others in the device
+        now = asyncio.get_running_loop().time()
+        start = max(transaction.sent_at, self._last_response_at)
+        self._last_response_at = now
+        self.timeout_policy.observe(
+            transaction.code, (now - start) * 1000.0, transaction.wire_ms
+        )
 
     # ------------------------------------------------------------------
     # Message dispatch
     # ------------------------------------------------------------------
 
     def _dispatch_message(self, packet: Packet) -> None:
-        dispatcher = self._dispatchers.get(packet.code)
-        if dispatcher is None or self.message_listener is None:
+        listeners = self._packet_listeners.get(packet.code)
+        if listeners:
+            for callback in listeners:
+                callback(packet)
+
+        subscriptions = self._subscriptions.get(packet.code)
+        if subscriptions:
+            for subscription in subscriptions:
+                if subscription.address in (None, packet.address):
+                    subscription.offer(packet)
+
+        if listeners and packet.code in self._exclusive_codes:
+            return
+
+        if len(self._devices) > 1:
+            listener = self._device_for(packet.address)
+        else:
+            listener = self._message_listener
+        if listener is None:
+            return
+
+        entry = self._dispatch_tables.get(id(listener))
+        if entry is None or entry[0] is not listener:
+            entry = self._build_dispatch_table(listener)
+
+        route = entry[1].get(packet.code)
+        if route is None:
+            # Not registered, or the listener has no handler for it
             return
 
-        msg = dispatcher.create(packet)
-        msg.dispatch(self.message_listener)
+        create, handler = route
+        msg = create(packet)
+        msg.on_received()
+        if handler is not None:
+            handler(msg)
+        else:
+            msg.dispatch(listener)
+
+        if self.tracer is not None:
+            self.tracer.emit(
+                monotonic_ns(), MESSAGE_DISPATCHED,
+                packet.code, packet.address, packet.length,
+            )
+
+    def _build_dispatch_table(self, listener: Any) -> tuple[Any, dict[int, tuple]]:
+        table: dict[int, tuple] = {}
+        for code, dispatcher in self._dispatchers.items():
+            name = self._message_types[code].HANDLER_NAME
+            if name is None:
+                # Custom dispatch() logic
+                table[code] = (dispatcher.creator, None)
+                continue
+
+            handler = getattr(listener, name, None)
+            if handler is not None:
+                table[code] = (dispatcher.creator, handler)
+
+        entry = (listener, table)
+        self._dispatch_tables[id(listener)] = entry
+        return entry
 
     def add_message(self, message: DeviceMessage) -> None:
+        """
+        Register a message type for dispatch.
+
+        Registering the same type again is a no-op, so devices of the same
+        kind can share a bus; a different type with the same code raises.
+        """
         if message is None:
             raise ValueError("message must not be None")
 
         code = message.code
-        if code in self._dispatchers:
+        registered = self._message_types.get(code)
+        if registered is type(message):
+            return
+        if registered is not None:
             raise ValueError(f"Message with code {code} already registered")
 
+        self._message_types[code] = type(message)
         self._dispatchers[code] = message.create_dispatcher()
+        self._dispatch_tables.clear()
+
+    def add_packet_listener(
+        self,
+        code: int,
+        callback: Callable[[Packet], None],
+        exclusive: bool = False,
+    ) -> None:
+        """
+        Deliver raw message packets with ``code`` to ``callback``.
+
+        Listeners run before message dispatch and receive the packet
+        without a message object being built. In zero-copy mode the
+        packet is only valid during the call. With ``exclusive``, message
+        dispatch to the message listener is skipped for the code while the
+        listener is registered (subscriptions are still fed).
+        """
+        self._packet_listeners.setdefault(code, []).append(callback)
+        if exclusive:
+            self._exclusive_codes.add(code)
+
+    def remove_packet_listener(
+        self,
+        code: int,
+        callback: Callable[[Packet], None],
+    ) -> None:
+        listeners = self._packet_listeners.get(code, [])
+        if callback in listeners:
+            listeners.remove(callback)
+        if not listeners:
+            self._packet_listeners.pop(code, None)
+            self._exclusive_codes.discard(code)
+
+    # ------------------------------------------------------------------
+    # Subscriptions
+    # ------------------------------------------------------------------
+
+    def subscribe(
+        self,
+        message_type: type,
+        maxsize: int = 64,
+        policy: DropPolicy = DropPolicy.LOSSLESS,
+        address: Optional[int] = None,
+    ) -> Subscription:
+        """
+        Queue received messages of ``message_type`` for async consumption.
+
+        With ``address`` set, only messages from that address are queued.
+        LOSSLESS flow control needs a connection with pause_reading();
+        on other connections the queue grows without bound instead.
+        See Subscription and DropPolicy.
+        """
+        subscription = Subscription(message_type, maxsize, policy, address)
+        subscription._pause = self._pause_reading
+        subscription._resume = self._resume_reading
+        subscription._on_close = self._unsubscribe
+        self._subscriptions.setdefault(subscription.code, []).append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.code, [])
+        if subscription in subscriptions:
+            subscriptions.remove(subscription)
+        if not subscriptions:
+            self._subscriptions.pop(subscription.code, None)
+
+    def _pause_reading(self, subscription: Subscription) -> None:
+        if not self._pausing:
+            pause = getattr(self._connection, "pause_reading", None)
+            if pause is not None:
+                pause()
+        self._pausing.add(subscription)
+
+    def _resume_reading(self, subscription: Subscription) -> None:
+        self._pausing.discard(subscription)
+        if not self._pausing:
+            resume = getattr(self._connection, "resume_reading", None)
+            if resume is not None:
+                resume()
 
     # ------------------------------------------------------------------
     # Async context manager
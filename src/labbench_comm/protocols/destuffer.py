@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from enum import Enum, auto
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Union
 import logging
 
+from labbench_comm.protocols.tracing import FRAME_COMPLETE, monotonic_ns
+
 class Frame:
     """
     Framing constants.
@@ -21,21 +23,51 @@ class _State(Enum):
     WAITING_FOR_ETX = auto()
 
 
+FrameData = Union[bytes, memoryview]
+
+
 class Destuffer:
     """
     Byte-stream destuffer implementing DLE/STX/ETX framing.
 
     Feed bytes incrementally using add_byte() or add_bytes().
     When a full frame is received, registered callbacks are invoked.
+
+    Frames are assembled in a reusable arena. By default each callback
+    receives an immutable bytes copy of the frame. With zero_copy=True
+    callbacks instead receive a memoryview into the arena:
+
+    - If no consumer keeps the frame, the arena is reused for the next
+      one.
+    - A consumer that keeps the frame (the view itself or a slice of it)
+      beyond the callback is detected through the buffer protocol; the
+      arena is then left to that consumer, so its view stays valid, and
+      a fresh one is used for the next frame. Nothing is copied.
     """
 
-    def __init__(self) -> None:
+    DEFAULT_CAPACITY = 256
+
+    def __init__(
+        self,
+        zero_copy: bool = False,
+        capacity: int = DEFAULT_CAPACITY,
+    ) -> None:
         self._state: _State = _State.WAITING_FOR_DLE
-        self._buffer = bytearray()
+        self._arena = bytearray(max(capacity, 1))
+        self._length = 0
+        self._zero_copy = zero_copy
         self._raw = bytearray()  # kept for parity with C# (future use)
-        self._callbacks: List[Callable[[Destuffer, bytes], None]] = []
+        self._callbacks: List[Callable[[Destuffer, FrameData], None]] = []
+        # Bytes passed to add_bytes(), i.e. as received, before destuffing
+        self.bytes_received: int = 0
+        # Optional TraceSink, see labbench_comm.protocols.tracing
+        self.tracer = None
         self.log = logging.getLogger(__name__)
 
+    @property
+    def zero_copy(self) -> bool:
+        return self._zero_copy
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -45,16 +77,55 @@ class Destuffer:
         self._state = _State.WAITING_FOR_DLE
         self._discard()
 
-    def on_receive(self, callback: Callable[[Destuffer, bytes], None]) -> None:
+    def on_receive(self, callback: Callable[[Destuffer, FrameData], None]) -> None:
         """
         Register a callback invoked when a full frame is received.
         """
         self._callbacks.append(callback)
 
     def add_bytes(self, data: bytes) -> None:
-        """Add a sequence of bytes to the destuffer."""
-        for b in data:
-            self.add_byte(b)
+        """
+        Add a sequence of bytes to the destuffer.
+
+        This is the chunk-oriented fast path. DLE boundaries are located
+        with bytes.find() and whole runs of non-DLE bytes are appended at
+        once, so the per-byte state machine only runs on the DLE sequences
+        themselves. State is kept across calls, and the result is identical
+        to feeding the same bytes through add_byte().
+        """
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes(data)
+
+        self.bytes_received += len(data)
+        view = memoryview(data)
+        end = len(data)
+        pos = 0
+        dle = Frame.DLE
+
+        while pos < end:
+            state = self._state
+
+            if state is _State.RECEIVING_DATA:
+                found = data.find(dle, pos)
+                if found < 0:
+                    self._append_run(view[pos:])
+                    break
+                if found > pos:
+                    self._append_run(view[pos:found])
+                self._state = _State.WAITING_FOR_ETX
+                pos = found + 1
+
+            elif state is _State.WAITING_FOR_DLE:
+                found = data.find(dle, pos)
+                if found < 0:
+                    break
+                self._length = 0
+                self._state = _State.WAITING_FOR_STX
+                pos = found + 1
+
+            else:
+                self.add_byte(data[pos])
+                pos += 1
 
     def add_byte(self, data: int) -> None:
         """Add a single byte (0–255)."""
@@ -77,32 +148,37 @@ class Destuffer:
 
     def _handle_waiting_for_dle(self, data: int) -> None:
         if data == Frame.DLE:
-            self._buffer.clear()
+            self._length = 0
             self._state = _State.WAITING_FOR_STX
 
     def _handle_waiting_for_stx(self, data: int) -> None:
         if data == Frame.STX:
             self._state = _State.RECEIVING_DATA
-            self._buffer.clear()
+            self._length = 0
         elif data != Frame.DLE:
             self._state = _State.WAITING_FOR_DLE
             self._discard()
 
     def _handle_receiving_data(self, data: int) -> None:
         if data != Frame.DLE:
-            self._buffer.append(data)
+            self._append(data)
         else:
             self._state = _State.WAITING_FOR_ETX
 
     def _handle_waiting_for_etx(self, data: int) -> None:
         if data == Frame.DLE:
             # Escaped DLE
-            self._buffer.append(Frame.DLE)
+            self._append(Frame.DLE)
             self._state = _State.RECEIVING_DATA
 
         elif data == Frame.ETX:
             # End of frame
             self._state = _State.WAITING_FOR_DLE
+            if self.tracer is not None:
+                self.tracer.emit(
+                    monotonic_ns(), FRAME_COMPLETE,
+                    self._arena[0] if self._length else 0, 0, self._length,
+                )
             self._notify_listeners()
             self._discard()
 
@@ -121,10 +197,58 @@ class Destuffer:
     # ------------------------------------------------------------------
 
     def _discard(self) -> None:
-        self._buffer.clear()
+        self._length = 0
         self._raw.clear()
 
+    def _append(self, value: int) -> None:
+        length = self._length
+        if length == len(self._arena):
+            self._grow(length + 1)
+        self._arena[length] = value
+        self._length = length + 1
+
+    def _append_run(self, run: memoryview) -> None:
+        start = self._length
+        end = start + len(run)
+        if end > len(self._arena):
+            self._grow(end)
+        self._arena[start:end] = run
+        self._length = end
+
+    def _grow(self, required: int) -> None:
+        size = max(required, 2 * len(self._arena))
+        arena = bytearray(size)
+        arena[: self._length] = memoryview(self._arena)[: self._length]
+        self._arena = arena
+
     def _notify_listeners(self) -> None:
-        payload = bytes(self._buffer)
-        for cb in self._callbacks:
-            cb(self, payload)
+        if not self._zero_copy:
+            with memoryview(self._arena) as view:
+                payload = bytes(view[: self._length])
+            for cb in self._callbacks:
+                cb(self, payload)
+            return
+
+        with memoryview(self._arena) as view:
+            frame = view[: self._length]
+        try:
+            for cb in self._callbacks:
+                cb(self, frame)
+        finally:
+            # Dropped, not released: a consumer may have kept it
+            del frame
+            self._reclaim_arena()
+
+    def _reclaim_arena(self) -> None:
+        """
+        Reuse the arena for the next frame unless a consumer kept a view
+        of the last one.
+        """
+        # A bytearray cannot be resized while exported, so a failing
+        # resize tells us that a consumer kept a view of this frame.
+        arena = self._arena
+        try:
+            arena.append(0)
+            arena.pop()
+        except BufferError:
+            self._arena = bytearray(len(arena))
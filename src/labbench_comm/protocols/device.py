@@ -2,7 +2,7 @@ import asyncio
 import time
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Sequence
 
 from labbench_comm.protocols.bus_central import BusCentral
 from labbench_comm.protocols.device_function import DeviceFunction
@@ -10,8 +10,13 @@ from labbench_comm.protocols.device_message import DeviceMessage
 from labbench_comm.protocols.functions.device_identification import DeviceIdentification
 from labbench_comm.protocols.functions.ping import Ping
 from labbench_comm.protocols.error_codes import ErrorCode
-from labbench_comm.protocols.exceptions import IncompatibleDeviceError
+from labbench_comm.protocols.exceptions import (
+    IncompatibleDeviceError,
+    PeripheralNotRespondingError,
+)
 from labbench_comm.protocols.messages.printf_message import PrintfMessage
+from labbench_comm.protocols.scheduler import Priority
+from labbench_comm.protocols.subscription import DropPolicy, Subscription
 
 
 class Device(ABC):
@@ -20,9 +25,14 @@ class Device(ABC):
 
     A Device owns a BusCental and defines:
     - compatibility checks
-    - retry policy
+    - retry policy (requests that time out are sent again, up to retries
+      attempts; with a TimeoutPolicy on the bus each timeout lengthens the
+      next attempt's timeout)
     - common functions (ping, identification)
     - message handling
+
+    Several devices may share one BusCentral if each is given a distinct
+    current_address; the bus then routes packets by address.
     """
 
     def __init__(self, central: BusCentral) -> None:
@@ -54,11 +64,24 @@ class Device(ABC):
     def add_message(self, message: DeviceMessage) -> None:
         self.central.add_message(message)
 
+    def subscribe(
+        self,
+        message_type: type,
+        maxsize: int = 64,
+        policy: DropPolicy = DropPolicy.LOSSLESS,
+    ) -> Subscription:
+        """
+        Consume messages of ``message_type`` from this device with
+        ``async for`` instead of a callback (see BusCentral.subscribe).
+        """
+        address = (self.current_address or 0) if self.central.shared else None
+        return self.central.subscribe(message_type, maxsize, policy, address)
+
     # ------------------------------------------------------------------
     # Ping
     # ------------------------------------------------------------------
 
-    async def ping(self) -> int:
+    async def ping(self, priority: Optional[Priority] = None) -> int:
         """
         Ping the connected device.
 
@@ -66,7 +89,7 @@ class Device(ABC):
         """
         try:
             ping = Ping()
-            await self.execute(ping)
+            await self.execute(ping, priority)
             return int(ping.count)
         except asyncio.CancelledError:
             raise
@@ -86,20 +109,33 @@ class Device(ABC):
     # ------------------------------------------------------------------
 
     async def open(self) -> None:
+        if self not in self.central.devices:
+            # Reopened after close()
+            self.central.attach_device(self)
         if not self.central.is_open:
             await self.central.open()
 
     async def close(self) -> None:
-        if self.central.is_open:
+        # Leave the bus; it is closed when the last attached device leaves
+        self.central.detach_device(self)
+        if self.central.is_open and not self.central.devices:
             await self.central.close()
 
     # ------------------------------------------------------------------
     # Execution
     # ------------------------------------------------------------------
 
-    async def execute(self, function: DeviceFunction) -> None:
+    async def execute(
+        self,
+        function: DeviceFunction,
+        priority: Optional[Priority] = None,
+    ) -> None:
         """
         Execute a DeviceFunction with retry handling.
+
+        Only timeouts are retried; a NACK (FunctionNotAcknowledgedError)
+        or any other error is raised at once. priority defaults to the
+        function's PRIORITY.
         """
         if function is None:
             return
@@ -108,24 +144,79 @@ class Device(ABC):
             raise RuntimeError("Device is not open")
 
         for attempt in range(self.retries):
+            if attempt and self.central.metrics is not None:
+                self.central.metrics.retry(function.code)
             try:
                 start = time.monotonic()
-                await self.central.execute(function, self.current_address)
+                await self.central.execute(
+                    function, self.current_address, priority=priority
+                )
                 function.transmission_time = int(
                     (time.monotonic() - start) * 1000
                 )
                 return
-            except asyncio.CancelledError:
-                raise
-            except Exception:
+            except PeripheralNotRespondingError:
                 if attempt == self.retries - 1:
                     raise
 
+    async def execute_many(
+        self,
+        functions: Sequence[DeviceFunction],
+        priority: Optional[Priority] = None,
+    ) -> List[Optional[BaseException]]:
+        """
+        Execute DeviceFunctions as one batch, with retry handling.
+
+        The requests are written in one transmission. Functions that time
+        out are retried together, up to the retry limit. Returns one entry
+        per function: None on success, otherwise the exception of its last
+        attempt.
+        """
+        functions = list(functions)
+        if not functions:
+            return []
+
+        if not self.central.is_open:
+            raise RuntimeError("Device is not open")
+
+        results: List[Optional[BaseException]] = [None] * len(functions)
+        remaining = list(range(len(functions)))
+
+        for attempt in range(self.retries):
+            if attempt and self.central.metrics is not None:
+                for index in remaining:
+                    self.central.metrics.retry(functions[index].code)
+
+            start = time.monotonic()
+            outcomes = await self.central.execute_many(
+                [functions[i] for i in remaining],
+                self.current_address,
+                priority=priority,
+            )
+            elapsed = int((time.monotonic() - start) * 1000)
+
+            failed = []
+            for index, outcome in zip(remaining, outcomes):
+                results[index] = outcome
+                if outcome is None:
+                    functions[index].transmission_time = elapsed
+                elif isinstance(outcome, PeripheralNotRespondingError):
+                    failed.append(index)
+
+            if not failed:
+                break
+            remaining = failed
+
+        return results
+
     async def send(self, message: DeviceMessage) -> None:
         if message is None:
             return
         await self.central.send(message, self.current_address)
 
+    async def send_many(self, messages: Sequence[DeviceMessage]) -> None:
+        await self.central.send_many(messages, self.current_address)
+
     # ------------------------------------------------------------------
     # Message handlers
     # ------------------------------------------------------------------
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, ClassVar, Optional
 
+from labbench_comm.protocols.layout import Layout
 from labbench_comm.protocols.packet import Packet
+from labbench_comm.protocols.scheduler import Priority
 
 
 # ----------------------------------------------------------------------
@@ -29,8 +31,29 @@ class InvalidSlaveResponseError(DeviceFunctionError):
 class DeviceFunction(ABC):
     """
     Base class for a device function (command/response pair).
+
+    Fixed request or response fields may be declared with
+    ``REQUEST_LAYOUT`` / ``RESPONSE_LAYOUT``; their properties are
+    generated on the class and read the current packet on every access.
+
+    ``PRIORITY`` is the default execution priority of the function on the
+    bus; stop commands are CRITICAL.
     """
 
+    REQUEST_LAYOUT: ClassVar[Optional[Layout]] = None
+    RESPONSE_LAYOUT: ClassVar[Optional[Layout]] = None
+    PRIORITY: ClassVar[Priority] = Priority.NORMAL
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for attr, packet_attr in (
+            ("REQUEST_LAYOUT", "_request"),
+            ("RESPONSE_LAYOUT", "_response"),
+        ):
+            layout = cls.__dict__.get(attr)
+            if layout is not None:
+                layout.install(cls, packet_attr)
+
     def __init__(
         self,
         request_length: int = 0,
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
+from labbench_comm.protocols.layout import Layout
 from labbench_comm.protocols.packet import Packet
 
 
@@ -12,8 +13,26 @@ class DeviceMessage(ABC):
 
     A DeviceMessage represents a one-way message (no request/response pairing),
     typically used for notifications, events, or broadcast messages.
+
+    Subclasses with a fixed payload may declare a ``LAYOUT``; its field
+    properties are generated on the class and served from a record that
+    is decoded once per message with a single ``unpack_from``.
+
+    ``HANDLER_NAME`` names the listener method that receives the message
+    (e.g. ``on_status_message``). BusCentral resolves it once per listener
+    and skips messages the listener has no handler for without building
+    them; messages without a HANDLER_NAME go through :meth:`dispatch`.
     """
 
+    LAYOUT: ClassVar[Optional[Layout]] = None
+    HANDLER_NAME: ClassVar[Optional[str]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        layout = cls.__dict__.get("LAYOUT")
+        if layout is not None:
+            layout.install(cls, "_packet", cached=True)
+
     def __init__(
         self,
         packet: Optional[Packet] = None,
@@ -26,6 +45,8 @@ class DeviceMessage(ABC):
         else:
             self._packet = Packet(self.code, 0)
 
+        self._record: Optional[tuple] = None
+
     # ------------------------------------------------------------------
     # Abstract API
     # ------------------------------------------------------------------
@@ -85,7 +106,19 @@ class DeviceMessage(ABC):
         Called after the message is received and parsed.
 
         Override this method to initialize properties from the packet
-        if doing so lazily would be expensive.
+        if doing so lazily would be expensive. The default decodes the
+        ``LAYOUT`` fields, if any, into :attr:`record`.
+        """
+        if self.LAYOUT is not None:
+            self._record = self.LAYOUT.decode(self._packet)
+
+    @classmethod
+    def derive_columns(cls, columns: dict) -> None:
+        """
+        Add derived columns to a batch decode (see protocols.batch).
+
+        ``columns`` maps field names to NumPy arrays. Override to add the
+        vectorized equivalents of derived properties.
         """
         pass
 
@@ -106,3 +139,16 @@ class DeviceMessage(ABC):
         Underlying packet for this message.
         """
         return self._packet
+
+    @property
+    def record(self) -> Optional[tuple]:
+        """
+        Decoded ``LAYOUT`` fields, or None if the message has no layout.
+
+        The record is decoded on first use and kept until a generated
+        setter changes the packet; writes made directly on :attr:`packet`
+        are not tracked.
+        """
+        if self._record is None and self.LAYOUT is not None:
+            self._record = self.LAYOUT.decode(self._packet)
+        return self._record
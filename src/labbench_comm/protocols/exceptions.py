@@ -31,6 +31,10 @@ class SerialConnectionError(SerialError):
 class SerialClosedError(SerialError):
     """Operation attempted on a closed serial connection."""
 
+
+class SubscriptionClosedError(LabBenchCommError):
+    """Message requested from a closed, drained subscription."""
+
 # ----------------------------------------------------------------------
 # Device / protocol exceptions
 # ----------------------------------------------------------------------
@@ -1,5 +1,12 @@
 from __future__ import annotations
 
+import struct
+from typing import Sequence
+
+from labbench_comm.protocols.packet import ChecksumAlgorithmType, Packet
+from labbench_comm.utils.additive_checksum import AdditiveChecksum
+from labbench_comm.utils.crc8_ccitt import Crc8
+
 
 class Frame:
     """
@@ -23,22 +30,218 @@ class Frame:
         if packet is None:
             raise ValueError("packet must not be None")
 
-        buffer = bytearray()
+        return b"".join((
+            _START,
+            bytes(packet).replace(_DLE_BYTE, _ESCAPED_DLE),
+            _END,
+        ))
+
+
+_DLE_BYTE = bytes([Frame.DLE])
+_ESCAPED_DLE = bytes([Frame.DLE, Frame.DLE])
+_START = bytes([Frame.DLE, Frame.STX])
+_END = bytes([Frame.DLE, Frame.ETX])
+
+_LENGTH_FORMATS = {
+    0x00: struct.Struct("<B"),
+    0x01: struct.Struct("<H"),
+    0x02: struct.Struct("<I"),
+}
+
+
+class FrameEncoder:
+    """
+    Single-pass outbound encoder.
+
+    Writes a Packet as a complete frame into one reusable buffer: start
+    sequence, header, payload, checksum and end sequence, DLE-stuffed as
+    they are written. The checksum is computed along the way. The output
+    is byte-identical to Frame.encode(packet.to_bytes()).
+
+    encode() returns a memoryview of the internal buffer that is valid
+    until the next call. Release it once written; if it is still
+    exported at the next call, a new buffer is allocated instead of
+    overwriting the old one.
+    """
+
+    DEFAULT_CAPACITY = 256
+    _MAX_HEADER_LENGTH = 7
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self._buffer = bytearray(capacity)
+        self._header = bytearray(self._MAX_HEADER_LENGTH)
+
+    def encode(self, packet: Packet) -> memoryview:
+        data = packet._data
+        if not isinstance(data, bytearray):
+            data = bytes(data)
+
+        header_length = self._write_header(packet)
+        required = 2 * (header_length + len(data) + 1) + 4
+        buffer = self._acquire(required)
+
+        pos = self._write_frame(buffer, 0, packet, data, header_length)
+        return memoryview(buffer)[:pos]
+
+    def encode_many(self, packets: Sequence[Packet]) -> memoryview:
+        """
+        Encode several packets back to back into the buffer.
+
+        The result is the concatenation of the individual frames, suitable
+        for a single write. Same lifetime rules as encode().
+        """
+        payloads = []
+        required = 0
+        for packet in packets:
+            data = packet._data
+            if not isinstance(data, bytearray):
+                data = bytes(data)
+            payloads.append(data)
+            required += self.max_frame_length(len(data))
+
+        buffer = self._acquire(required)
+        pos = 0
+        for packet, data in zip(packets, payloads):
+            header_length = self._write_header(packet)
+            pos = self._write_frame(buffer, pos, packet, data, header_length)
+
+        return memoryview(buffer)[:pos]
+
+    def frame_length(self, packet: Packet) -> int:
+        """
+        Length of the frame encode() would produce, without encoding it.
+
+        A checksum byte is counted as if it needed stuffing, so the result
+        may exceed the actual length by one.
+        """
+        header_length = self._write_header(packet)
+        data = packet._data
+        if not isinstance(data, bytearray):
+            data = bytes(data)
+
+        length = 4 + header_length + self._header.count(Frame.DLE, 0, header_length)
+        length += len(data) + data.count(Frame.DLE)
+        if packet.extended and packet.checksum_algorithm != ChecksumAlgorithmType.NONE:
+            length += 2
+        return length
+
+    @classmethod
+    def max_frame_length(cls, payload_length: int) -> int:
+        """
+        Upper bound on the frame length of a payload of the given length.
+        """
+        return 2 * (cls._MAX_HEADER_LENGTH + payload_length + 1) + 4
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _write_frame(
+        self,
+        buffer: bytearray,
+        pos: int,
+        packet: Packet,
+        data: bytes | bytearray,
+        header_length: int,
+    ) -> int:
+        # The header must already be in self._header
+        buffer[pos] = Frame.DLE
+        buffer[pos + 1] = Frame.STX
+        pos += 2
 
-        # Start of text
-        buffer.append(Frame.DLE)
-        buffer.append(Frame.STX)
+        header = memoryview(self._header)[:header_length]
+        pos = self._stuff(buffer, pos, self._header, header, header_length)
+        pos = self._stuff(buffer, pos, data, memoryview(data), len(data))
 
-        # Data with DLE stuffing
-        for b in packet:
-            if b == Frame.DLE:
-                buffer.append(Frame.DLE)
-                buffer.append(Frame.DLE)
+        algorithm = packet.checksum_algorithm
+        if packet.extended and algorithm != ChecksumAlgorithmType.NONE:
+            if algorithm == ChecksumAlgorithmType.CRC8CCITT:
+                checksum = Crc8()
             else:
-                buffer.append(b)
+                checksum = AdditiveChecksum()
+            checksum.update(header).update(data)
+            value = checksum.digest()
+            packet._checksum = value
+
+            buffer[pos] = value
+            pos += 1
+            if value == Frame.DLE:
+                buffer[pos] = Frame.DLE
+                pos += 1
+
+        header.release()
+
+        buffer[pos] = Frame.DLE
+        buffer[pos + 1] = Frame.ETX
+        return pos + 2
+
+    def _write_header(self, packet: Packet) -> int:
+        header = self._header
+        header[0] = packet.code
+
+        if not packet.extended:
+            header[1] = packet.length
+            return 2
+
+        encoding = int(packet.length_encoding)
+        header[1] = (
+            0x80
+            | encoding
+            | int(packet.checksum_algorithm)
+            | (0x10 if packet.address_enabled else 0x00)
+        )
+
+        length_format = _LENGTH_FORMATS[encoding]
+        length_format.pack_into(header, 2, packet.length)
+        pos = 2 + length_format.size
+
+        if packet.address_enabled:
+            header[pos] = packet.address
+            pos += 1
+
+        return pos
+
+    def _acquire(self, required: int) -> bytearray:
+        buffer = self._buffer
+        try:
+            # Fails if the previous frame is still exported
+            buffer.append(0)
+            buffer.pop()
+        except BufferError:
+            buffer = None
+
+        if buffer is None:
+            # Same size: a consumer keeping frames must not grow the buffer
+            size = max(required, len(self._buffer))
+            buffer = self._buffer = bytearray(size)
+        elif len(buffer) < required:
+            size = max(required, 2 * len(buffer))
+            buffer = self._buffer = bytearray(size)
+
+        return buffer
+
+    @staticmethod
+    def _stuff(
+        buffer: bytearray,
+        pos: int,
+        source: bytes | bytearray,
+        view: memoryview,
+        length: int,
+    ) -> int:
+        start = 0
+        while start < length:
+            found = source.find(Frame.DLE, start, length)
+            stop = length if found < 0 else found + 1
+
+            end = pos + stop - start
+            buffer[pos:end] = view[start:stop]
+            pos = end
+
+            if found < 0:
+                break
 
-        # End of text
-        buffer.append(Frame.DLE)
-        buffer.append(Frame.ETX)
+            buffer[pos] = Frame.DLE
+            pos += 1
+            start = stop
 
-        return bytes(buffer)
+        return pos
@@ -0,0 +1,391 @@
+"""
+Declarative packet layouts.
+
+A :class:`Layout` describes the fixed part of a message or function payload
+as a list of :class:`Field` entries (name, offset, type, optional scaling
+and enum). The layout is compiled once, at class creation, into a pair of
+precompiled :class:`struct.Struct` codecs (wire order and byte-reversed)
+that decode every field with a single ``unpack_from`` into a slotted,
+tuple-based record.
+
+Classes declare their layout as a class attribute and get the matching
+properties generated for them::
+
+    class SignalMessage(_LIOMessage):
+        LAYOUT = Layout(
+            Field("port", 0, enum=ResponsePort),
+            Field("signal", 3, "uint16"),
+            Field("a", 5, "int32", divisor=4096.0),
+            ...
+        )
+
+Properties that are already defined on the class are left untouched, so
+derived values (``value``, ``voltage``, ...) stay handwritten and read the
+generated ones.
+"""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from enum import Enum
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from labbench_comm.protocols.packet import Packet
+
+
+# Field type -> (struct format, Packet getter, Packet setter)
+_TYPES: Dict[str, Tuple[str, str, str]] = {
+    "uint8": ("B", "get_byte", "insert_byte"),
+    "bool": ("?", "get_bool", "insert_bool"),
+    "uint16": ("H", "get_uint16", "insert_uint16"),
+    "int16": ("h", "get_int16", "insert_int16"),
+    "uint32": ("I", "get_uint32", "insert_uint32"),
+    "int32": ("i", "get_int32", "insert_int32"),
+}
+
+
+# ----------------------------------------------------------------------
+# Field
+# ----------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class Field:
+    """
+    A single fixed-offset field in a packet payload.
+
+    The decoded value is ``raw * scale / divisor`` when scaling is given,
+    which is bit-identical to the handwritten ``MAX * value / 4095`` style
+    conversions used throughout the device codecs. ``enum`` is applied by
+    the generated property rather than at decode time, so an unknown code
+    only fails the property that reads it.
+
+    For scaled fields, ``binary`` names an additional property exposing
+    the raw value. ``settable`` generates a setter on the raw property
+    (``binary`` when given, otherwise ``name``); scaled values are never
+    written directly.
+    """
+
+    name: str
+    offset: int
+    type: str = "uint8"
+    scale: Optional[float] = None
+    divisor: Optional[float] = None
+    enum: Optional[Type[Enum]] = None
+    settable: bool = False
+    binary: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.type not in _TYPES:
+            raise ValueError(f"Unknown field type: {self.type!r}")
+        if self.offset < 0:
+            raise ValueError(f"Field {self.name} has a negative offset")
+        if self.binary is not None and not self.scaled:
+            raise ValueError(f"Field {self.name} has a binary name but no scaling")
+        if self.scaled and self.enum is not None:
+            raise ValueError(f"Field {self.name} cannot be both scaled and an enum")
+        if self.scaled and self.settable and self.binary is None:
+            raise ValueError(
+                f"Scaled field {self.name} must be set through a binary property"
+            )
+
+    @property
+    def scaled(self) -> bool:
+        return self.scale is not None or self.divisor is not None
+
+    @property
+    def size(self) -> int:
+        return struct.calcsize("<" + _TYPES[self.type][0])
+
+    def convert(self, raw: Any) -> Any:
+        """
+        Apply scaling to a raw value (enum conversion is not applied).
+        """
+        if self.scale is not None:
+            raw = self.scale * raw
+        if self.divisor is not None:
+            raw = raw / self.divisor
+        return raw
+
+
+# ----------------------------------------------------------------------
+# Records
+# ----------------------------------------------------------------------
+
+def _record_repr(self) -> str:
+    values = ", ".join(f"{n}={v!r}" for n, v in zip(self._fields, self))
+    return f"{type(self).__name__}({values})"
+
+
+def _make_record_type(name: str, names: Sequence[str]) -> type:
+    # A namedtuple would reject the underscore-prefixed names used for
+    # hidden fields, so the record type is assembled by hand.
+    namespace: Dict[str, Any] = {
+        "__slots__": (),
+        "_fields": tuple(names),
+        "__repr__": _record_repr,
+    }
+    for index, field_name in enumerate(names):
+        namespace[field_name] = property(itemgetter(index))
+    return type(name, (tuple,), namespace)
+
+
+def _make_builder(
+    fields: Sequence[Field],
+    record_type: type,
+) -> Callable[[tuple], tuple]:
+    # Generated once per layout (as namedtuple and dataclasses do) so that
+    # scaling costs one arithmetic expression per field instead of a call.
+    namespace: Dict[str, Any] = {"_new": tuple.__new__, "_record": record_type}
+    items: List[str] = []
+
+    for index, field in enumerate(fields):
+        expr = f"f{index}"
+        if field.scale is not None:
+            namespace[f"s{index}"] = field.scale
+            expr = f"s{index} * {expr}"
+        if field.divisor is not None:
+            namespace[f"d{index}"] = field.divisor
+            expr = f"{expr} / d{index}"
+        items.append(expr)
+        if field.binary is not None:
+            items.append(f"f{index}")
+
+    if all(not f.scaled for f in fields):
+        source = "def build(raw):\n    return _new(_record, raw)\n"
+    else:
+        unpacked = ", ".join(f"f{i}" for i in range(len(fields)))
+        source = (
+            "def build(raw):\n"
+            f"    {unpacked}, = raw\n"
+            f"    return _new(_record, ({', '.join(items)},))\n"
+        )
+
+    exec(source, namespace)
+    return namespace["build"]
+
+
+# ----------------------------------------------------------------------
+# Layout
+# ----------------------------------------------------------------------
+
+class Layout:
+    """
+    Compiled, fixed-offset payload layout.
+
+    :meth:`decode` unpacks all fields of a packet in one call and returns a
+    record whose attributes are the field names (scaled values) plus the
+    ``binary`` names of scaled fields (raw values).
+    """
+
+    def __init__(self, *fields: Field, size: Optional[int] = None) -> None:
+        if not fields:
+            raise ValueError("A layout needs at least one field")
+
+        ordered = sorted(fields, key=lambda f: f.offset)
+        fmt: List[str] = []
+        position = 0
+
+        for field in ordered:
+            if field.offset < position:
+                raise ValueError(f"Field {field.name} overlaps a previous field")
+            if field.offset > position:
+                fmt.append(f"{field.offset - position}x")
+            fmt.append(_TYPES[field.type][0])
+            position = field.offset + field.size
+
+        if size is not None:
+            if size < position:
+                raise ValueError(f"Layout size {size} is smaller than its fields")
+            if size > position:
+                fmt.append(f"{size - position}x")
+            position = size
+
+        self._fields: Tuple[Field, ...] = tuple(ordered)
+        self._size = position
+        self._format = "".join(fmt)
+        self._codecs = (
+            struct.Struct("<" + self._format),
+            struct.Struct(">" + self._format),
+        )
+
+        names: List[str] = []
+        for field in ordered:
+            names.append(field.name)
+            if field.binary is not None:
+                names.append(field.binary)
+
+        if len(set(names)) != len(names):
+            raise ValueError("Layout field names must be unique")
+
+        self._names: Tuple[str, ...] = tuple(names)
+        self._record_type = _make_record_type("Record", names)
+        self._build = _make_builder(self._fields, self._record_type)
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    @property
+    def fields(self) -> Tuple[Field, ...]:
+        return self._fields
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """
+        Record attribute names, in record order.
+        """
+        return self._names
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def format(self) -> str:
+        """
+        struct format string, without byte order prefix.
+        """
+        return self._format
+
+    @property
+    def record_type(self) -> type:
+        return self._record_type
+
+    def codec(self, reverse_endianity: bool = False) -> struct.Struct:
+        return self._codecs[reverse_endianity]
+
+    # ------------------------------------------------------------------
+    # Decoding
+    # ------------------------------------------------------------------
+
+    def decode(self, packet: Packet) -> tuple:
+        """
+        Decode all fields of ``packet`` with a single ``unpack_from``.
+        """
+        return self._build(
+            packet.unpack_from(self._codecs[packet.reverse_endianity])
+        )
+
+    # ------------------------------------------------------------------
+    # Property generation
+    # ------------------------------------------------------------------
+
+    def install(self, cls: type, packet_attr: str, cached: bool = False) -> None:
+        """
+        Generate field properties on ``cls`` reading from ``packet_attr``.
+
+        With ``cached`` set, getters serve values from ``self._record``,
+        decoding the whole layout on first access, and setters reset it to
+        ``None``; otherwise every access reads the packet directly.
+        """
+        slots = {name: index for index, name in enumerate(self._names)}
+
+        if self._record_type.__name__ == "Record":
+            name = f"{cls.__name__}Record"
+            self._record_type.__name__ = self._record_type.__qualname__ = name
+
+        for field in self._fields:
+            getter, setter = _TYPES[field.type][1:]
+
+            accessors = [(
+                field.name,
+                field.scaled,
+                field.settable and field.binary is None,
+            )]
+            if field.binary is not None:
+                accessors.append((field.binary, False, field.settable))
+
+            for name, scaled, settable in accessors:
+                if name in cls.__dict__:
+                    continue
+
+                if cached:
+                    fget = _make_record_getter(
+                        self, packet_attr, slots[name], field.enum
+                    )
+                else:
+                    fget = _make_packet_getter(
+                        packet_attr, getter, field.offset,
+                        field.convert if scaled else None, field.enum,
+                    )
+
+                fset = None
+                if settable:
+                    fset = _make_setter(
+                        packet_attr, setter, field.offset,
+                        field.enum is not None, cached,
+                    )
+                setattr(cls, name, property(fget, fset))
+
+
+def _enum_lookup(enum: Type[Enum]) -> Callable[[Any], Enum]:
+    # Enum.__call__ is slow; look members up directly and fall back to the
+    # enum itself for anything it has to resolve (or reject).
+    members = {m.value: m for m in enum}
+
+    def lookup(value):
+        member = members.get(value)
+        return member if member is not None else enum(value)
+
+    return lookup
+
+
+def _make_record_getter(
+    layout: Layout,
+    packet_attr: str,
+    slot: int,
+    enum: Optional[Type[Enum]],
+) -> Callable[[Any], Any]:
+    if enum is None:
+        def fget(self):
+            record = self._record
+            if record is None:
+                record = self._record = layout.decode(getattr(self, packet_attr))
+            return record[slot]
+    else:
+        lookup = _enum_lookup(enum)
+
+        def fget(self):
+            record = self._record
+            if record is None:
+                record = self._record = layout.decode(getattr(self, packet_attr))
+            return lookup(record[slot])
+
+    return fget
+
+
+def _make_packet_getter(
+    packet_attr: str,
+    getter: str,
+    offset: int,
+    convert: Optional[Callable[[Any], Any]],
+    enum: Optional[Type[Enum]],
+) -> Callable[[Any], Any]:
+    lookup = _enum_lookup(enum) if enum is not None else None
+
+    def fget(self):
+        value = getattr(getattr(self, packet_attr), getter)(offset)
+        if convert is not None:
+            value = convert(value)
+        return value if lookup is None else lookup(value)
+
+    return fget
+
+
+def _make_setter(
+    packet_attr: str,
+    setter: str,
+    offset: int,
+    is_enum: bool,
+    cached: bool,
+) -> Callable[[Any, Any], None]:
+    def fset(self, value) -> None:
+        getattr(getattr(self, packet_attr), setter)(
+            offset, int(value) if is_enum else value
+        )
+        if cached:
+            self._record = None
+
+    return fset
@@ -0,0 +1,285 @@
+"""
+Serial link utilization.
+
+At 38400 or 57600 baud the link is a hard budget shared by function
+requests and responses, periodic device messages (LIO signal streams, CPAR
+status messages), keep-alive pings and uploads. Two tools account for it:
+
+- :class:`LinkMonitor` measures the bytes written and read over a sliding
+  window, as framed and stuffed on the wire. AsyncSerialConnection keeps
+  one (``connection.link``); ``BusCentral.link_utilization`` relates it to
+  the baud rate, and BusCentral can defer background requests while the
+  link is busy (admission control).
+- :class:`LinkBudget` estimates up front whether a planned configuration
+  fits::
+
+      budget = central.link_budget()
+      budget.add_message("signal port 1", SignalMessage(), period_s=0.01)
+      budget.add_requests("ping", Ping(), interval_s=1.0)
+      budget.add_transfer("waveform", [SetWaveformProgram()], within_s=0.5)
+      if not budget.fits():
+          print(budget.report())
+
+Frame lengths include the DLE/STX/ETX framing and byte stuffing, and a
+byte takes ten bit times (8N1), as in TimeoutPolicy.
+"""
+
+from __future__ import annotations
+
+import time
+from enum import Enum
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from labbench_comm.protocols.device_function import DeviceFunction
+from labbench_comm.protocols.device_message import DeviceMessage
+from labbench_comm.protocols.frame import Frame, FrameEncoder
+from labbench_comm.protocols.packet import Packet
+from labbench_comm.protocols.timeouts import TimeoutPolicy
+
+
+class LinkMonitor:
+    """
+    Bytes sent and received over the last ``window_s`` seconds.
+
+    The window is kept as a ring of ``buckets`` time slices, so recording
+    is O(1) and the rates trail the traffic by at most one slice.
+    """
+
+    def __init__(self, window_s: float = 1.0, buckets: int = 10) -> None:
+        if window_s <= 0 or buckets < 1:
+            raise ValueError("window_s and buckets must be positive")
+
+        self.window_s = window_s
+        self._width = window_s / buckets
+        self._sent = [0] * buckets
+        self._received = [0] * buckets
+        # Index of the time slice each bucket currently holds
+        self._slices = [-1] * buckets
+
+        self.bytes_sent: int = 0
+        self.bytes_received: int = 0
+
+    def add_sent(self, count: int, now: Optional[float] = None) -> None:
+        self.bytes_sent += count
+        self._sent[self._bucket(now)] += count
+
+    def add_received(self, count: int, now: Optional[float] = None) -> None:
+        self.bytes_received += count
+        self._received[self._bucket(now)] += count
+
+    def rates(self, now: Optional[float] = None) -> Tuple[float, float]:
+        """
+        (sent, received) bytes per second over the window.
+        """
+        current = self._slice(now)
+        oldest = current - len(self._slices)
+        sent = received = 0
+        for index, slice_ in enumerate(self._slices):
+            if slice_ > oldest:
+                sent += self._sent[index]
+                received += self._received[index]
+        return sent / self.window_s, received / self.window_s
+
+    def _slice(self, now: Optional[float]) -> int:
+        return int((time.monotonic() if now is None else now) / self._width)
+
+    def _bucket(self, now: Optional[float]) -> int:
+        slice_ = self._slice(now)
+        index = slice_ % len(self._slices)
+        if self._slices[index] != slice_:
+            self._slices[index] = slice_
+            self._sent[index] = 0
+            self._received[index] = 0
+        return index
+
+
+class LinkUtilization(NamedTuple):
+    """
+    Measured link load; the fractions are None if the baud rate is unknown.
+    """
+
+    sent_bytes_per_s: float
+    received_bytes_per_s: float
+    sent: Optional[float]
+    received: Optional[float]
+
+    @property
+    def peak(self) -> Optional[float]:
+        if self.sent is None:
+            return None
+        return max(self.sent, self.received)
+
+
+class LinkDirection(Enum):
+    SENT = "sent"
+    RECEIVED = "received"
+
+
+class LoadItem(NamedTuple):
+    name: str
+    sent_bytes_per_s: float
+    received_bytes_per_s: float
+
+
+def frame_length(packet: Packet, direction: LinkDirection = LinkDirection.SENT) -> float:
+    """
+    Length of the packet on the wire, including framing and stuffing.
+
+    Sent packets are measured exactly. A received packet is typically a
+    template whose payload is not known yet, so its payload is assumed to
+    be random bytes, of which 1 in 256 needs stuffing.
+    """
+    length = FrameEncoder().frame_length(packet)
+    if direction is LinkDirection.RECEIVED:
+        data = packet.payload
+        length -= bytes(data).count(Frame.DLE)
+        length += packet.length / 256.0
+    return length
+
+
+class LinkBudget:
+    """
+    Planned link load, compared against the capacity of ``baudrate``.
+
+    Loads are added per source and summed per direction. ``threshold``
+    is the fraction of the capacity that is considered usable; the rest is
+    headroom for retries, bursts and traffic not accounted for.
+    """
+
+    BITS_PER_BYTE = TimeoutPolicy.BITS_PER_BYTE
+
+    def __init__(self, baudrate: int, threshold: float = 0.8) -> None:
+        if baudrate <= 0:
+            raise ValueError("baudrate must be positive")
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+
+        self.baudrate = baudrate
+        self.threshold = threshold
+        self.items: List[LoadItem] = []
+
+    @property
+    def capacity_bytes_per_s(self) -> float:
+        return self.baudrate / self.BITS_PER_BYTE
+
+    # ------------------------------------------------------------------
+    # Loads
+    # ------------------------------------------------------------------
+
+    def add(
+        self,
+        name: str,
+        sent_bytes_per_s: float = 0.0,
+        received_bytes_per_s: float = 0.0,
+    ) -> LinkBudget:
+        self.items.append(LoadItem(name, sent_bytes_per_s, received_bytes_per_s))
+        return self
+
+    def add_message(
+        self,
+        name: str,
+        message: DeviceMessage,
+        period_s: float,
+        direction: LinkDirection = LinkDirection.RECEIVED,
+    ) -> LinkBudget:
+        """
+        A message repeated every ``period_s`` seconds, by default sent by
+        the device (e.g. a signal stream or status messages).
+        """
+        rate = frame_length(message.packet, direction) / _positive(period_s)
+        if direction is LinkDirection.RECEIVED:
+            return self.add(name, received_bytes_per_s=rate)
+        return self.add(name, sent_bytes_per_s=rate)
+
+    def add_requests(
+        self,
+        name: str,
+        function: DeviceFunction,
+        interval_s: float,
+    ) -> LinkBudget:
+        """
+        A function executed every ``interval_s`` seconds (e.g. pings).
+        """
+        interval = _positive(interval_s)
+        sent, received = _exchange(function)
+        return self.add(name, sent / interval, received / interval)
+
+    def add_transfer(
+        self,
+        name: str,
+        functions: Sequence[DeviceFunction],
+        within_s: float,
+    ) -> LinkBudget:
+        """
+        Functions that must all complete within ``within_s`` seconds
+        (e.g. a waveform upload), averaged over that time.
+        """
+        within = _positive(within_s)
+        sent = received = 0.0
+        for function in functions:
+            request, response = _exchange(function)
+            sent += request
+            received += response
+        return self.add(name, sent / within, received / within)
+
+    # ------------------------------------------------------------------
+    # Estimates
+    # ------------------------------------------------------------------
+
+    def utilization(self) -> Tuple[float, float]:
+        """
+        (sent, received) planned load as fractions of the capacity.
+        """
+        capacity = self.capacity_bytes_per_s
+        sent = sum(item.sent_bytes_per_s for item in self.items)
+        received = sum(item.received_bytes_per_s for item in self.items)
+        return sent / capacity, received / capacity
+
+    def fits(self) -> bool:
+        return max(self.utilization()) <= self.threshold
+
+    def report(self) -> str:
+        capacity = self.capacity_bytes_per_s
+        lines = [
+            f"Link budget at {self.baudrate} baud "
+            f"({capacity:.0f} B/s per direction, threshold {self.threshold:.0%}):"
+        ]
+        for item in self.items:
+            lines.append(
+                f"  {item.name}: tx {item.sent_bytes_per_s:.0f} B/s "
+                f"({item.sent_bytes_per_s / capacity:.1%}), "
+                f"rx {item.received_bytes_per_s:.0f} B/s "
+                f"({item.received_bytes_per_s / capacity:.1%})"
+            )
+        sent, received = self.utilization()
+        lines.append(
+            f"  total: tx {sent:.1%}, rx {received:.1%} -> "
+            f"{'fits' if self.fits() else 'does not fit'}"
+        )
+        return "\n".join(lines)
+
+
+def _exchange(function: DeviceFunction) -> Tuple[float, float]:
+    # Some functions only build their request packet in on_send(). A budget
+    # must not change the function, so its attributes and request payload
+    # are restored afterwards
+    state = vars(function).copy()
+    request = function.get_request_packet()
+    payload = bytes(request.payload)
+
+    try:
+        function.on_send()
+        return (
+            frame_length(function.get_request_packet(), LinkDirection.SENT),
+            frame_length(function.get_response_packet(), LinkDirection.RECEIVED),
+        )
+    finally:
+        vars(function).clear()
+        vars(function).update(state)
+        request.payload[:] = payload
+
+
+def _positive(seconds: float) -> float:
+    if seconds <= 0:
+        raise ValueError("periods must be positive")
+    return seconds
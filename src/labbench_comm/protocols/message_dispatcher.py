@@ -11,7 +11,8 @@ class MessageDispatcher:
     Dispatcher for device messages.
 
     Maps a message code to a factory function that creates a DeviceMessage
-    instance from a received Packet.
+    instance from a received Packet. The factory is usually the message
+    class itself.
     """
 
     def __init__(
@@ -25,6 +26,10 @@ class MessageDispatcher:
         self.code = code
         self._creator = creator
 
+    @property
+    def creator(self) -> Callable[[Packet], DeviceMessage]:
+        return self._creator
+
     def create(self, packet: Packet) -> DeviceMessage:
         """
         Create and initialize a DeviceMessage from a packet.
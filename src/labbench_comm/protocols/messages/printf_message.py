@@ -9,6 +9,7 @@ class PrintfMessage(DeviceMessage):
     """
 
     CODE: int = 0xFF
+    HANDLER_NAME = "on_printf_message"
 
     @property
     def code(self) -> int:
@@ -25,11 +26,12 @@ class PrintfMessage(DeviceMessage):
     # ------------------------------------------------------------------
 
     def create_dispatcher(self) -> MessageDispatcher:
-        return MessageDispatcher(self.CODE, lambda p: PrintfMessage(p))
+        return MessageDispatcher(self.CODE, PrintfMessage)
 
     def dispatch(self, listener) -> None:
-            if hasattr(listener, "on_printf_message"):
-                listener.on_printf_message(self)
+        handler = getattr(listener, self.HANDLER_NAME, None)
+        if handler is not None:
+            handler(self)
 
     # ------------------------------------------------------------------
     # Message payload
@@ -0,0 +1,314 @@
+"""
+Bus instrumentation.
+
+:class:`BusMetrics` collects, per function code, the number of completed
+requests, a latency histogram, timeouts, NACKs (by error name, e.g. an
+``ErrorCode`` or ``EcpError``) and retries, and for the link the bytes
+sent and received before and after stuffing and the frames per code.
+Together these tell whether a slow session is spent in the host (queue
+waits, see ``BusCentral.queue_wait``), on the link (wire bytes, framing
+errors) or in the device (latency, timeouts, NACKs).
+
+Metrics are off by default; ``BusCentral.enable_metrics()`` turns them on
+and can log a summary line periodically. When disabled, the only cost on
+the I/O path is a check of ``BusCentral.metrics`` against None.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from labbench_comm.protocols.packet import ChecksumAlgorithmType, Packet
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of durations in nanoseconds.
+
+    Values below 2 * SUB_BUCKETS are counted exactly; above that, every
+    power of two is split into SUB_BUCKETS buckets, so percentiles are
+    accurate to within 1 / SUB_BUCKETS (about 6 %) of the value.
+    """
+
+    SUB_BUCKETS = 16
+    _SUB_BITS = 4
+
+    __slots__ = ("_counts", "count", "total_ns", "min_ns", "max_ns")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def record(self, value_ns: int) -> None:
+        if value_ns < 0:
+            value_ns = 0
+
+        shift = value_ns.bit_length() - self._SUB_BITS - 1
+        if shift <= 0:
+            index = value_ns
+        else:
+            index = (shift << self._SUB_BITS) + (value_ns >> shift)
+
+        counts = self._counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+
+        self.count += 1
+        self.total_ns += value_ns
+        if value_ns < self.min_ns or self.count == 1:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def percentile(self, fraction: float) -> int:
+        """
+        Value at or below which ``fraction`` (0..1) of the samples lie.
+
+        Returns the upper bound of the bucket holding that sample, within
+        the observed minimum and maximum; 0 if nothing was recorded.
+        """
+        if not self.count:
+            return 0
+
+        rank = max(1, min(self.count, math.ceil(fraction * self.count)))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return max(self.min_ns, min(self._upper_bound(index), self.max_ns))
+        return self.max_ns
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """
+        Add the samples of another histogram to this one.
+        """
+        if not other.count:
+            return
+
+        counts = self._counts
+        if len(other._counts) > len(counts):
+            counts.extend([0] * (len(other._counts) - len(counts)))
+        for index, count in enumerate(other._counts):
+            counts[index] += count
+
+        if not self.count or other.min_ns < self.min_ns:
+            self.min_ns = other.min_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.count += other.count
+        self.total_ns += other.total_ns
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def reset(self) -> None:
+        self._counts: List[int] = []
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def _upper_bound(self, index: int) -> int:
+        if index < 2 * self.SUB_BUCKETS:
+            return index
+        shift = (index >> self._SUB_BITS) - 1
+        mantissa = (index & (self.SUB_BUCKETS - 1)) + self.SUB_BUCKETS
+        return ((mantissa + 1) << shift) - 1
+
+    def __repr__(self) -> str:
+        return (
+            f"LatencyHistogram(count={self.count}, "
+            f"p50_ns={self.percentile(0.5)}, p99_ns={self.percentile(0.99)})"
+        )
+
+
+class FunctionMetrics:
+    """
+    Counters of one function code.
+    """
+
+    __slots__ = ("completed", "latency", "timeouts", "nacks", "retries")
+
+    def __init__(self) -> None:
+        self.completed = 0
+        self.latency = LatencyHistogram()
+        self.timeouts = 0
+        self.nacks: Dict[str, int] = {}
+        self.retries = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        latency = self.latency
+        return {
+            "completed": self.completed,
+            "timeouts": self.timeouts,
+            "nacks": dict(self.nacks),
+            "retries": self.retries,
+            "latency_ns": {
+                "min": latency.min_ns,
+                "mean": round(latency.mean_ns),
+                "p50": latency.percentile(0.50),
+                "p95": latency.percentile(0.95),
+                "p99": latency.percentile(0.99),
+                "max": latency.max_ns,
+            },
+        }
+
+
+class BusMetrics:
+    """
+    Function and link counters of one BusCentral.
+
+    Latency is measured from the write of a request to the arrival of its
+    response; NACKed requests are not included. "bytes" count packets as
+    encoded before byte stuffing (header, payload and checksum),
+    "wire_bytes" the framed, stuffed bytes actually written or read.
+    """
+
+    def __init__(self, receiver: Optional[Any] = None) -> None:
+        # PacketReceiver of the bus: raw byte and framing error counters
+        self._receiver = receiver
+        self.reset()
+
+    # ------------------------------------------------------------------
+    # Recording (called by BusCentral and Device)
+    # ------------------------------------------------------------------
+
+    def function(self, code: int) -> FunctionMetrics:
+        metrics = self.functions.get(code)
+        if metrics is None:
+            metrics = self.functions[code] = FunctionMetrics()
+        return metrics
+
+    def sent(self, packets: Sequence[Packet], wire_bytes: int) -> None:
+        frames = self.frames_sent
+        for packet in packets:
+            frames[packet.code] = frames.get(packet.code, 0) + 1
+            self.bytes_sent += packet_length(packet)
+        self.wire_bytes_sent += wire_bytes
+
+    def received(self, packet: Packet) -> None:
+        frames = self.frames_received
+        frames[packet.code] = frames.get(packet.code, 0) + 1
+
+    def completed(self, code: int, latency_ns: int) -> None:
+        metrics = self.function(code)
+        metrics.completed += 1
+        metrics.latency.record(latency_ns)
+
+    def timed_out(self, code: int) -> None:
+        self.function(code).timeouts += 1
+
+    def nack(self, code: int, error: str) -> None:
+        nacks = self.function(code).nacks
+        nacks[error] = nacks.get(error, 0) + 1
+
+    def retry(self, code: int) -> None:
+        self.function(code).retries += 1
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    @property
+    def bytes_received(self) -> int:
+        if self._receiver is None:
+            return 0
+        return self._receiver.frame_bytes_received - self._frame_base
+
+    @property
+    def wire_bytes_received(self) -> int:
+        if self._receiver is None:
+            return 0
+        return self._receiver.bytes_received - self._received_base
+
+    @property
+    def elapsed_s(self) -> float:
+        return time.monotonic() - self._started
+
+    def reset(self) -> None:
+        """
+        Zero all counters and restart the measurement interval.
+        """
+        self.functions: Dict[int, FunctionMetrics] = {}
+        self.frames_sent: Dict[int, int] = {}
+        self.frames_received: Dict[int, int] = {}
+        self.bytes_sent = 0
+        self.wire_bytes_sent = 0
+
+        receiver = self._receiver
+        self._received_base = receiver.bytes_received if receiver else 0
+        self._frame_base = receiver.frame_bytes_received if receiver else 0
+        self._malformed_base = receiver.malformed_frames if receiver else 0
+        self._checksum_base = receiver.checksum_errors if receiver else 0
+        self._started = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Plain-data copy of all counters, safe to keep or serialize.
+        """
+        receiver = self._receiver
+        elapsed = self.elapsed_s
+        return {
+            "elapsed_s": elapsed,
+            "functions": {
+                code: metrics.snapshot()
+                for code, metrics in sorted(self.functions.items())
+            },
+            "link": {
+                "bytes_sent": self.bytes_sent,
+                "wire_bytes_sent": self.wire_bytes_sent,
+                "bytes_received": self.bytes_received,
+                "wire_bytes_received": self.wire_bytes_received,
+                "frames_sent": dict(sorted(self.frames_sent.items())),
+                "frames_received": dict(sorted(self.frames_received.items())),
+                "malformed_frames": (
+                    receiver.malformed_frames - self._malformed_base
+                    if receiver else 0
+                ),
+                "checksum_errors": (
+                    receiver.checksum_errors - self._checksum_base
+                    if receiver else 0
+                ),
+            },
+        }
+
+    def summary(self) -> str:
+        """
+        One-line summary, as logged periodically by BusCentral.
+        """
+        latency = LatencyHistogram()
+        completed = timeouts = nacks = retries = 0
+        for metrics in self.functions.values():
+            completed += metrics.completed
+            timeouts += metrics.timeouts
+            nacks += sum(metrics.nacks.values())
+            retries += metrics.retries
+            latency.merge(metrics.latency)
+
+        elapsed = max(self.elapsed_s, 1e-9)
+        return (
+            f"{completed} requests "
+            f"(p50 {latency.percentile(0.50) / 1e6:.2f} ms, "
+            f"p99 {latency.percentile(0.99) / 1e6:.2f} ms), "
+            f"{timeouts} timeouts, {nacks} NACKs, {retries} retries; "
+            f"tx {self.wire_bytes_sent / elapsed:.0f} B/s, "
+            f"rx {self.wire_bytes_received / elapsed:.0f} B/s "
+            f"over {self.elapsed_s:.1f} s"
+        )
+
+
+def packet_length(packet: Packet) -> int:
+    """
+    Length of a packet as encoded, before byte stuffing.
+    """
+    if not packet.extended:
+        return 2 + packet.length
+
+    length = 2 + (1, 2, 4)[packet.length_encoding] + packet.length
+    if packet.address_enabled:
+        length += 1
+    if packet.checksum_algorithm != ChecksumAlgorithmType.NONE:
+        length += 1
+    return length
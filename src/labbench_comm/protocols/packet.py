@@ -21,6 +21,14 @@ class ChecksumAlgorithmType(IntEnum):
     CRC8CCITT = 0x08
 
 
+# Precompiled codecs indexed by Packet.reverse_endianity:
+# [0] little endian (wire order), [1] byte-reversed (big endian)
+_UINT16 = (struct.Struct("<H"), struct.Struct(">H"))
+_INT16 = (struct.Struct("<h"), struct.Struct(">h"))
+_UINT32 = (struct.Struct("<I"), struct.Struct(">I"))
+_INT32 = (struct.Struct("<i"), struct.Struct(">i"))
+
+
 class Packet:
     # ------------------------------------------------------------------
     # Construction
@@ -44,7 +52,14 @@ class Packet:
         self._data = bytearray(length)
 
     @classmethod
-    def from_frame(cls, frame: bytes) -> Packet:
+    def from_frame(cls, frame: bytes | memoryview) -> Packet:
+        """
+        Parse a destuffed frame into a Packet.
+
+        If frame is a memoryview (zero-copy delivery from the Destuffer),
+        the packet wraps a slice of it without copying. Call detach() to
+        give such a packet its own storage before the view is reused.
+        """
         if frame is None or len(frame) < 2:
             raise PacketFormatError("Frame too short")
 
@@ -53,9 +68,13 @@ class Packet:
 
         if fmt < 0x80:
             length = fmt
-            pkt = cls(code, length)
-            pkt._data[:] = frame[2 : 2 + length]
-            return pkt
+            return cls._wrap(
+                code,
+                length,
+                ChecksumAlgorithmType.NONE,
+                cls._get_length_encoding(length),
+                frame[2 : 2 + length],
+            )
 
         length_encoding = LengthEncodingType(fmt & 0x03)
         checksum_type = ChecksumAlgorithmType(fmt & 0x0C)
@@ -64,14 +83,19 @@ class Packet:
         offset = 2
         length, offset = cls._decode_length(frame, length_encoding, offset)
 
-        pkt = cls(code, length, checksum_type)
-        pkt._length_encoding = length_encoding
-
+        address = 0
         if address_enabled:
-            pkt.address = frame[offset]
+            address = frame[offset]
             offset += 1
 
-        pkt._data[:] = frame[offset : offset + length]
+        pkt = cls._wrap(
+            code,
+            length,
+            checksum_type,
+            length_encoding,
+            frame[offset : offset + length],
+        )
+        pkt.address = address
         offset += length
 
         if checksum_type != ChecksumAlgorithmType.NONE:
@@ -80,6 +104,56 @@ class Packet:
 
         return pkt
 
+    @classmethod
+    def _wrap(
+        cls,
+        code: int,
+        length: int,
+        checksum: ChecksumAlgorithmType,
+        length_encoding: LengthEncodingType,
+        data: bytes | bytearray | memoryview,
+        address: int = 0,
+        checksum_value: int = 0,
+    ) -> Packet:
+        """
+        Build a packet around already parsed fields.
+
+        A memoryview or bytearray payload is used as is; anything else is
+        copied into a new bytearray.
+        """
+        pkt = cls.__new__(cls)
+        pkt._code = code & 0xFF
+        pkt._length = length
+        pkt._length_encoding = length_encoding
+        pkt._checksum_type = checksum
+        pkt.address = address
+        pkt.reverse_endianity = False
+        pkt._checksum = checksum_value
+
+        if isinstance(data, (memoryview, bytearray)):
+            pkt._data = data
+        else:
+            pkt._data = bytearray(data)
+
+        return pkt
+
+    def detach(self) -> Packet:
+        """
+        Give the packet its own storage.
+
+        Packets parsed from a zero-copy frame reference the destuffer's
+        arena. Detaching copies the payload so the packet stays valid
+        after the arena is reused. Returns the packet itself.
+        """
+        if not isinstance(self._data, bytearray):
+            self._data = bytearray(self._data)
+        return self
+
+    @property
+    def is_view(self) -> bool:
+        """True if the payload still references an external buffer."""
+        return not isinstance(self._data, bytearray)
+
     # ------------------------------------------------------------------
     # Properties
     # ------------------------------------------------------------------
@@ -100,6 +174,16 @@ class Packet:
     def empty(self) -> bool:
         return self._length == 0
 
+    @property
+    def payload(self) -> bytearray | memoryview:
+        """
+        Payload buffer, without copying.
+
+        For a packet that :attr:`is_view`, the buffer is only valid while
+        the packet is being delivered; copy it (or :meth:`detach`) to keep it.
+        """
+        return self._data
+
     @property
     def address_enabled(self) -> bool:
         return self.address != 0
@@ -112,6 +196,10 @@ class Packet:
     def checksum_algorithm(self) -> ChecksumAlgorithmType:
         return self._checksum_type
 
+    @property
+    def length_encoding(self) -> LengthEncodingType:
+        return self._length_encoding
+
     @property
     def extended(self) -> bool:
         if self.address_enabled:
@@ -167,21 +255,30 @@ class Packet:
         self.insert_byte(pos, 1 if value else 0)
 
     def insert_uint16(self, pos: int, value: int) -> None:
-        self._serialize(pos, struct.pack("<H", value))
+        _UINT16[self.reverse_endianity].pack_into(self._data, pos, value)
 
     def insert_int16(self, pos: int, value: int) -> None:
-        self._serialize(pos, struct.pack("<h", value))
+        _INT16[self.reverse_endianity].pack_into(self._data, pos, value)
 
     def insert_uint32(self, pos: int, value: int) -> None:
-        self._serialize(pos, struct.pack("<I", value))
+        _UINT32[self.reverse_endianity].pack_into(self._data, pos, value)
 
     def insert_int32(self, pos: int, value: int) -> None:
-        self._serialize(pos, struct.pack("<i", value))
+        _INT32[self.reverse_endianity].pack_into(self._data, pos, value)
 
     def insert_string(self, pos: int, size: int, value: str) -> None:
         raw = value.encode("ascii", errors="ignore")[:size]
         self._data[pos : pos + size] = raw.ljust(size, b"\x00")
 
+    def insert_bytes(self, pos: int, data: bytes | bytearray | memoryview) -> None:
+        """
+        Copy ``data`` into the payload at ``pos`` with one slice assignment.
+        """
+        end = pos + len(data)
+        if end > len(self._data):
+            raise IndexError("data does not fit in the packet payload")
+        self._data[pos:end] = data
+
     # ------------------------------------------------------------------
     # Get methods
     # ------------------------------------------------------------------
@@ -193,37 +290,37 @@ class Packet:
         return self.get_byte(pos) != 0
 
     def get_uint16(self, pos: int) -> int:
-        return self._deserialize(pos, "<H")
+        return _UINT16[self.reverse_endianity].unpack_from(self._data, pos)[0]
 
     def get_int16(self, pos: int) -> int:
-        return self._deserialize(pos, "<h")
+        return _INT16[self.reverse_endianity].unpack_from(self._data, pos)[0]
 
     def get_uint32(self, pos: int) -> int:
-        return self._deserialize(pos, "<I")
+        return _UINT32[self.reverse_endianity].unpack_from(self._data, pos)[0]
 
     def get_int32(self, pos: int) -> int:
-        return self._deserialize(pos, "<i")
+        return _INT32[self.reverse_endianity].unpack_from(self._data, pos)[0]
+
+    def get_bytes(self, pos: int, size: int) -> bytes:
+        return bytes(self._data[pos : pos + size])
 
     def get_string(self, pos: int, size: int) -> str:
-        raw = self._data[pos : pos + size]
+        raw = bytes(self._data[pos : pos + size])
         return raw.rstrip(b"\x00").decode("ascii", errors="ignore")
 
+    def unpack_from(self, codec: struct.Struct, pos: int = 0) -> Tuple:
+        """
+        Decode several fields at once with a precompiled struct.
+
+        The codec carries its own byte order; callers honouring
+        ``reverse_endianity`` select the matching codec themselves.
+        """
+        return codec.unpack_from(self._data, pos)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _serialize(self, pos: int, data: bytes) -> None:
-        if self.reverse_endianity:
-            data = data[::-1]
-        self._data[pos : pos + len(data)] = data
-
-    def _deserialize(self, pos: int, fmt: str) -> int:
-        size = struct.calcsize(fmt)
-        raw = self._data[pos : pos + size]
-        if self.reverse_endianity:
-            raw = raw[::-1]
-        return struct.unpack(fmt, raw)[0]
-
     @staticmethod
     def _get_length_encoding(length: int) -> LengthEncodingType:
         if length > 0xFFFF:
@@ -236,8 +333,8 @@ class Packet:
         if self._length_encoding == LengthEncodingType.UINT8:
             return bytes([self._length])
         if self._length_encoding == LengthEncodingType.UINT16:
-            return struct.pack("<H", self._length)
-        return struct.pack("<I", self._length)
+            return _UINT16[0].pack(self._length)
+        return _UINT32[0].pack(self._length)
 
     @staticmethod
     def _decode_length(
@@ -248,8 +345,8 @@ class Packet:
         if encoding == LengthEncodingType.UINT8:
             return frame[offset], offset + 1
         if encoding == LengthEncodingType.UINT16:
-            return struct.unpack_from("<H", frame, offset)[0], offset + 2
-        return struct.unpack_from("<I", frame, offset)[0], offset + 4
+            return _UINT16[0].unpack_from(frame, offset)[0], offset + 2
+        return _UINT32[0].unpack_from(frame, offset)[0], offset + 4
 
     @staticmethod
     def _validate_checksum(
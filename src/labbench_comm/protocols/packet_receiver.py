@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import struct
+from typing import Callable, List, Optional
+
+from labbench_comm.protocols.destuffer import Destuffer
+from labbench_comm.protocols.packet import (
+    ChecksumAlgorithmType,
+    LengthEncodingType,
+    Packet,
+)
+from labbench_comm.utils.crc8_ccitt import crc8_ccitt
+
+
+_LENGTH_FORMATS = (
+    struct.Struct("<B"),
+    struct.Struct("<H"),
+    struct.Struct("<I"),
+)
+
+_LENGTH_ENCODINGS = tuple(LengthEncodingType)
+
+_CHECKSUM_TYPES = {
+    int(algorithm): algorithm for algorithm in ChecksumAlgorithmType
+}
+
+
+class PacketReceiver(Destuffer):
+    """
+    Inbound pipeline stage: destuffing, header parsing and checksum
+    verification in one pass.
+
+    Completed frames are parsed in place in the destuffer's arena. The
+    header is decoded, the frame length is checked against it and the
+    checksum is verified over the arena without slicing a copy. Valid
+    frames are delivered to on_packet() callbacks as ready Packets:
+
+    - with zero_copy=True the packet wraps a view of the arena,
+    - otherwise the payload is copied once into the packet.
+
+    Malformed and checksum-failing frames are counted and dropped; no
+    exceptions are raised on the receive path. Raw frame callbacks
+    registered with on_receive() keep working.
+    """
+
+    def __init__(self, zero_copy: bool = False, capacity: int = Destuffer.DEFAULT_CAPACITY) -> None:
+        super().__init__(zero_copy=zero_copy, capacity=capacity)
+        self._packet_callbacks: List[Callable[[Packet], None]] = []
+
+        self.packets_received: int = 0
+        # Length of the destuffed frames, valid or not
+        self.frame_bytes_received: int = 0
+        self.malformed_frames: int = 0
+        self.checksum_errors: int = 0
+
+    def on_packet(self, callback: Callable[[Packet], None]) -> None:
+        """
+        Register a callback invoked with each valid packet.
+        """
+        self._packet_callbacks.append(callback)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _notify_listeners(self) -> None:
+        with memoryview(self._arena) as view:
+            frame = view[: self._length]
+        self.frame_bytes_received += self._length
+        try:
+            self._deliver(frame)
+        finally:
+            # Dropped, not released: a consumer may have kept it
+            del frame
+            self._reclaim_arena()
+
+    def _deliver(self, frame: memoryview) -> None:
+        # Separate so that its references to the frame are gone when the
+        # arena is reclaimed
+        if self._callbacks:
+            raw = frame if self._zero_copy else bytes(frame)
+            for cb in self._callbacks:
+                cb(self, raw)
+
+        packet = self._parse(frame)
+        if packet is not None:
+            self.packets_received += 1
+            for cb in self._packet_callbacks:
+                cb(packet)
+
+    def _parse(self, frame: memoryview) -> Optional[Packet]:
+        size = len(frame)
+        if size < 2:
+            self.malformed_frames += 1
+            return None
+
+        code = frame[0]
+        fmt = frame[1]
+        address = 0
+
+        if fmt < 0x80:
+            length = fmt
+            offset = 2
+            encoding = 0
+            checksum_type = 0
+        else:
+            encoding = fmt & 0x03
+            checksum_type = fmt & 0x0C
+            if encoding >= len(_LENGTH_FORMATS) or checksum_type not in _CHECKSUM_TYPES:
+                self.malformed_frames += 1
+                return None
+
+            length_format = _LENGTH_FORMATS[encoding]
+            offset = 2 + length_format.size
+            if size < offset:
+                self.malformed_frames += 1
+                return None
+            length = length_format.unpack_from(frame, 2)[0]
+
+            if fmt & 0x10:
+                if size <= offset:
+                    self.malformed_frames += 1
+                    return None
+                address = frame[offset]
+                offset += 1
+
+        end = offset + length
+        if size != end + (1 if checksum_type else 0):
+            self.malformed_frames += 1
+            return None
+
+        checksum = 0
+        if checksum_type:
+            checksum = frame[end]
+            covered = frame[:end]
+            if checksum_type == ChecksumAlgorithmType.CRC8CCITT:
+                actual = crc8_ccitt(covered)
+            else:
+                actual = sum(covered) & 0xFF
+            covered.release()
+
+            if actual != checksum:
+                self.checksum_errors += 1
+                return None
+
+        payload = frame[offset:end]
+        if not self._zero_copy:
+            payload = bytearray(payload)
+
+        return Packet._wrap(
+            code,
+            length,
+            _CHECKSUM_TYPES[checksum_type],
+            _LENGTH_ENCODINGS[encoding],
+            payload,
+            address,
+            checksum,
+        )
@@ -0,0 +1,187 @@
+"""
+Fair, prioritized scheduling of requests on a bus.
+
+:class:`RequestScheduler` hands out the in-flight slots of a BusCentral.
+Waiting requests are queued in one lane per :class:`Priority` and, within
+a lane, per device address. A released slot goes to the highest priority
+lane with waiters, so a critical request (e.g. a stop command) is sent as
+soon as the current transaction ends, whatever else is queued. Within a
+lane, slots are granted round-robin across addresses, so a device that
+queues many requests cannot starve the others on the same serial port.
+
+The time requests wait for a slot is recorded per priority
+(:class:`WaitStatistics`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from enum import IntEnum
+from typing import Dict, Hashable, Tuple
+
+
+class Priority(IntEnum):
+    """
+    Execution priority of a request; lower values are served first.
+    """
+
+    CRITICAL = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+class WaitStatistics:
+    """
+    Time spent waiting for an in-flight slot, in milliseconds.
+
+    Requests that got a slot immediately count as zero waits.
+    """
+
+    __slots__ = ("count", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def record(self, wait_ms: float) -> None:
+        self.count += 1
+        self.total_ms += wait_ms
+        if wait_ms > self.max_ms:
+            self.max_ms = wait_ms
+
+    def reset(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"WaitStatistics(count={self.count}, mean_ms={self.mean_ms:.3f}, "
+            f"max_ms={self.max_ms:.3f})"
+        )
+
+
+class _Lane:
+    """
+    Waiters of one priority, queued per key and served round-robin.
+    """
+
+    __slots__ = ("queues", "rotation")
+
+    def __init__(self) -> None:
+        self.queues: Dict[Hashable, deque[asyncio.Future]] = {}
+        # Keys with waiters, in the order they will be served
+        self.rotation: deque[Hashable] = deque()
+
+    def append(self, key: Hashable, future: asyncio.Future) -> None:
+        queue = self.queues.get(key)
+        if queue is None:
+            queue = self.queues[key] = deque()
+            self.rotation.append(key)
+        queue.append(future)
+
+    def pop(self) -> asyncio.Future:
+        key = self.rotation.popleft()
+        queue = self.queues[key]
+        future = queue.popleft()
+        if queue:
+            self.rotation.append(key)
+        else:
+            del self.queues[key]
+        return future
+
+    def remove(self, key: Hashable, future: asyncio.Future) -> None:
+        queue = self.queues.get(key)
+        if queue is None or future not in queue:
+            return
+
+        queue.remove(future)
+        if not queue:
+            del self.queues[key]
+            self.rotation.remove(key)
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self.queues.values())
+
+
+class RequestScheduler:
+    """
+    Counting semaphore with priority lanes and round-robin fairness
+    across keys within a lane.
+
+    With a single key and priority it behaves like ``asyncio.Semaphore``
+    (FIFO).
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self._free = capacity
+        self._lanes: Tuple[_Lane, ...] = tuple(_Lane() for _ in Priority)
+        self._statistics: Dict[Priority, WaitStatistics] = {
+            priority: WaitStatistics() for priority in Priority
+        }
+
+    @property
+    def free(self) -> int:
+        return self._free
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(lane) for lane in self._lanes)
+
+    @property
+    def wait_statistics(self) -> Dict[Priority, WaitStatistics]:
+        return self._statistics
+
+    async def acquire(
+        self,
+        key: Hashable = 0,
+        priority: Priority = Priority.NORMAL,
+    ) -> None:
+        if self._free > 0:
+            self._free -= 1
+            self._statistics[priority].record(0.0)
+            return
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        future = loop.create_future()
+        lane = self._lanes[priority]
+        lane.append(key, future)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted, but cancelled before it could be used
+                self.release()
+            else:
+                lane.remove(key, future)
+            raise
+
+        self._statistics[priority].record((loop.time() - start) * 1000.0)
+
+    def release(self) -> None:
+        if not self.grant(Priority.BACKGROUND):
+            self._free += 1
+
+    def grant(self, priority: Priority = Priority.CRITICAL) -> bool:
+        """
+        Hand a held slot to the next waiter of ``priority`` or more urgent.
+
+        Returns False, the caller keeping the slot, if there is none.
+        """
+        for lane in self._lanes[: priority + 1]:
+            while lane.rotation:
+                future = lane.pop()
+                # Skip waiters cancelled before they could remove themselves
+                if not future.done():
+                    future.set_result(None)
+                    return True
+        return False
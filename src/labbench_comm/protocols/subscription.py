@@ -0,0 +1,246 @@
+"""
+Asynchronous message subscriptions.
+
+Message listeners (``on_status_message`` and the ``*_received`` callback
+lists of the devices) run synchronously on the serial reader path, so a
+slow callback stalls all I/O. A :class:`Subscription` decouples the two:
+the reader only queues the received packet, and the message is built and
+consumed in the subscriber's own task::
+
+    async with device.subscribe(StatusMessage, maxsize=32,
+                                policy=DropPolicy.LATEST) as statuses:
+        async for status in statuses:
+            ...
+
+When the bounded queue is full, the :class:`DropPolicy` decides what
+happens: LOSSLESS pauses reading from the port until the subscriber has
+caught up, DROP_OLDEST discards the oldest queued message and LATEST
+keeps only the most recent one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from enum import Enum
+from typing import Callable, Generic, Optional, Type, TypeVar
+
+from labbench_comm.protocols.device_message import DeviceMessage
+from labbench_comm.protocols.exceptions import SubscriptionClosedError
+from labbench_comm.protocols.packet import Packet
+
+
+M = TypeVar("M", bound=DeviceMessage)
+
+
+class DropPolicy(Enum):
+    """
+    What a subscription does when its queue is full.
+
+    - LOSSLESS: keep every message and pause reading from the port until
+      the queue has drained to half its size. This also delays function
+      responses, so keep consuming while executing functions.
+    - DROP_OLDEST: discard the oldest queued message
+    - LATEST: keep only the most recent message (conflate); maxsize is 1
+    """
+
+    LOSSLESS = "lossless"
+    DROP_OLDEST = "drop_oldest"
+    LATEST = "latest"
+
+
+class Subscription(Generic[M]):
+    """
+    Bounded queue of received messages of one type.
+
+    Created by ``BusCentral.subscribe`` / ``Device.subscribe``. Iterate
+    with ``async for`` or call :meth:`get`; iteration ends once the
+    subscription is closed (by :meth:`close`, leaving an ``async with``
+    block, or closing the bus) and the queue is empty.
+    """
+
+    def __init__(
+        self,
+        message_type: Type[M],
+        maxsize: int = 64,
+        policy: DropPolicy = DropPolicy.LOSSLESS,
+        address: Optional[int] = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self._message_type = message_type
+        self._dispatcher = message_type().create_dispatcher()
+        self._code = self._dispatcher.code
+        self._policy = DropPolicy(policy)
+        self._maxsize = 1 if self._policy is DropPolicy.LATEST else maxsize
+        self._address = address
+
+        self._queue: deque[Packet] = deque()
+        self._getters: deque[asyncio.Future] = deque()
+        self._closed = False
+
+        # Set by BusCentral: flow control for LOSSLESS, and removal
+        self._pause: Optional[Callable[[Subscription], None]] = None
+        self._resume: Optional[Callable[[Subscription], None]] = None
+        self._on_close: Optional[Callable[[Subscription], None]] = None
+        self._paused = False
+
+        self.received: int = 0
+        self.dropped: int = 0
+        self.max_lag: int = 0
+
+    # ------------------------------------------------------------------
+    # Properties
+    # ------------------------------------------------------------------
+
+    @property
+    def message_type(self) -> Type[M]:
+        return self._message_type
+
+    @property
+    def code(self) -> int:
+        return self._code
+
+    @property
+    def address(self) -> Optional[int]:
+        return self._address
+
+    @property
+    def policy(self) -> DropPolicy:
+        return self._policy
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def lag(self) -> int:
+        """
+        Messages received but not yet consumed.
+        """
+        return len(self._queue)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    # ------------------------------------------------------------------
+    # Producer side (serial reader)
+    # ------------------------------------------------------------------
+
+    def offer(self, packet: Packet) -> None:
+        """
+        Queue a received packet; the message is built by the consumer.
+        """
+        if self._closed:
+            return
+
+        self.received += 1
+        queue = self._queue
+        if len(queue) >= self._maxsize:
+            if self._policy is DropPolicy.LOSSLESS:
+                if not self._paused and self._pause is not None:
+                    self._paused = True
+                    self._pause(self)
+            else:
+                queue.popleft()
+                self.dropped += 1
+
+        queue.append(packet.detach())
+        if len(queue) > self.max_lag:
+            self.max_lag = len(queue)
+
+        while self._getters:
+            getter = self._getters.popleft()
+            if not getter.done():
+                getter.set_result(None)
+                break
+
+    # ------------------------------------------------------------------
+    # Consumer side
+    # ------------------------------------------------------------------
+
+    def get_nowait(self) -> M:
+        """
+        Return the next message; raises asyncio.QueueEmpty if there is none.
+        """
+        if not self._queue:
+            if self._closed:
+                raise SubscriptionClosedError("Subscription is closed")
+            raise asyncio.QueueEmpty()
+
+        packet = self._queue.popleft()
+        if self._paused and len(self._queue) <= self._maxsize // 2:
+            self._paused = False
+            if self._resume is not None:
+                self._resume(self)
+
+        return self._dispatcher.create(packet)
+
+    async def get(self) -> M:
+        """
+        Wait for and return the next message.
+
+        Raises SubscriptionClosedError once the subscription is closed and
+        its queue is empty.
+        """
+        while not self._queue:
+            if self._closed:
+                raise SubscriptionClosedError("Subscription is closed")
+
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            finally:
+                if getter in self._getters:
+                    self._getters.remove(getter)
+
+        return self.get_nowait()
+
+    def close(self) -> None:
+        """
+        Stop receiving; messages already queued can still be consumed.
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        if self._paused:
+            self._paused = False
+            if self._resume is not None:
+                self._resume(self)
+        if self._on_close is not None:
+            self._on_close(self)
+
+        getters, self._getters = self._getters, deque()
+        for getter in getters:
+            if not getter.done():
+                getter.set_result(None)
+
+    # ------------------------------------------------------------------
+    # Iteration / context manager
+    # ------------------------------------------------------------------
+
+    def __aiter__(self) -> Subscription[M]:
+        return self
+
+    async def __anext__(self) -> M:
+        try:
+            return await self.get()
+        except SubscriptionClosedError:
+            raise StopAsyncIteration from None
+
+    async def __aenter__(self) -> Subscription[M]:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"<Subscription {self._message_type.__name__} "
+            f"policy={self._policy.name} lag={self.lag} "
+            f"received={self.received} dropped={self.dropped}>"
+        )
@@ -0,0 +1,177 @@
+"""
+Size-aware, adaptive request timeouts.
+
+A fixed timeout is either too short for large uploads on a slow link or
+far too long for small functions. :class:`TimeoutPolicy` instead computes
+the timeout of each request as
+
+    wire time of the request and response frames at the link baud rate
+    + a latency allowance for the function code
+
+The allowance is learned from the observed response times of the code,
+in the manner of TCP retransmission timeouts: an exponentially weighted
+mean plus four mean deviations, but never less than a high percentile of
+the recent samples, ``minimum_allowance_ms`` and ``minimum_fraction`` of
+the fallback. Until enough samples are seen, the fallback allowance
+(``BusCentral.timeout_ms``) itself is used. Each consecutive timeout of a
+code doubles its allowance, so retries wait longer; a response resets it.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Dict, Optional
+
+
+class _CodeStatistics:
+    __slots__ = ("mean", "deviation", "samples", "backoff")
+
+    def __init__(self, window: int) -> None:
+        self.mean = 0.0
+        self.deviation = 0.0
+        self.samples: deque[float] = deque(maxlen=window)
+        self.backoff = 0
+
+
+class TimeoutPolicy:
+    """
+    Per function code request timeouts (see module docstring).
+
+    Times are in milliseconds. ``baudrate`` may be None when the link
+    speed is unknown, in which case wire time is not accounted for.
+    """
+
+    # Start bit, 8 data bits and a stop bit per byte (8N1)
+    BITS_PER_BYTE = 10
+
+    def __init__(
+        self,
+        minimum_allowance_ms: float = 50.0,
+        maximum_allowance_ms: float = 10000.0,
+        gain: float = 0.125,
+        deviation_gain: float = 0.25,
+        deviation_factor: float = 4.0,
+        percentile: float = 0.99,
+        window: int = 64,
+        min_samples: int = 3,
+        max_backoff: int = 4,
+        minimum_fraction: float = 0.0,
+    ) -> None:
+        if not 0.0 < percentile <= 1.0:
+            raise ValueError("percentile must be in (0, 1]")
+        if minimum_allowance_ms > maximum_allowance_ms:
+            raise ValueError("minimum_allowance_ms exceeds maximum_allowance_ms")
+        if not 0.0 <= minimum_fraction <= 1.0:
+            raise ValueError("minimum_fraction must be in [0, 1]")
+
+        self.minimum_allowance_ms = minimum_allowance_ms
+        self.maximum_allowance_ms = maximum_allowance_ms
+        self.gain = gain
+        self.deviation_gain = deviation_gain
+        self.deviation_factor = deviation_factor
+        self.percentile = percentile
+        self.min_samples = max(1, min_samples)
+        self.max_backoff = max_backoff
+        self.minimum_fraction = minimum_fraction
+
+        self._window = window
+        self._statistics: Dict[int, _CodeStatistics] = {}
+
+    # ------------------------------------------------------------------
+    # Timeouts
+    # ------------------------------------------------------------------
+
+    def wire_time_ms(self, length: int, baudrate: Optional[int]) -> float:
+        """
+        Time to transmit ``length`` bytes at ``baudrate``.
+        """
+        if not baudrate:
+            return 0.0
+        return 1000.0 * length * self.BITS_PER_BYTE / baudrate
+
+    def allowance_ms(self, code: int, fallback_ms: float) -> float:
+        """
+        Latency allowance for ``code``, excluding wire time.
+        """
+        statistics = self._statistics.get(code)
+        if statistics is None or len(statistics.samples) < self.min_samples:
+            allowance = fallback_ms
+            backoff = statistics.backoff if statistics is not None else 0
+        else:
+            allowance = max(
+                statistics.mean + self.deviation_factor * statistics.deviation,
+                self._percentile(statistics.samples),
+                self.minimum_allowance_ms,
+                self.minimum_fraction * fallback_ms,
+            )
+            backoff = statistics.backoff
+
+        return min(allowance * (1 << backoff), self.maximum_allowance_ms)
+
+    def timeout_ms(
+        self,
+        code: int,
+        wire_ms: float,
+        fallback_ms: float,
+    ) -> float:
+        """
+        Timeout for a request of ``code`` whose frames take ``wire_ms``
+        on the wire.
+        """
+        return wire_ms + self.allowance_ms(code, fallback_ms)
+
+    # ------------------------------------------------------------------
+    # Observations
+    # ------------------------------------------------------------------
+
+    def observe(self, code: int, elapsed_ms: float, wire_ms: float = 0.0) -> None:
+        """
+        Record that a request of ``code`` was answered after ``elapsed_ms``.
+        """
+        sample = max(0.0, elapsed_ms - wire_ms)
+        statistics = self._get(code)
+
+        if statistics.samples:
+            error = sample - statistics.mean
+            statistics.mean += self.gain * error
+            statistics.deviation += self.deviation_gain * (
+                abs(error) - statistics.deviation
+            )
+        else:
+            statistics.mean = sample
+            statistics.deviation = sample / 2.0
+
+        statistics.samples.append(sample)
+        statistics.backoff = 0
+
+    def timed_out(self, code: int) -> None:
+        """
+        Record that a request of ``code`` timed out.
+        """
+        statistics = self._get(code)
+        statistics.backoff = min(statistics.backoff + 1, self.max_backoff)
+
+    def reset(self, code: Optional[int] = None) -> None:
+        """
+        Forget what was learned, for one code or for all of them.
+        """
+        if code is None:
+            self._statistics.clear()
+        else:
+            self._statistics.pop(code, None)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _get(self, code: int) -> _CodeStatistics:
+        statistics = self._statistics.get(code)
+        if statistics is None:
+            statistics = self._statistics[code] = _CodeStatistics(self._window)
+        return statistics
+
+    def _percentile(self, samples: deque[float]) -> float:
+        ordered = sorted(samples)
+        index = max(0, math.ceil(self.percentile * len(ordered)) - 1)
+        return ordered[index]
@@ -19,7 +19,13 @@ class AsyncConnection(ABC):
 
     @abstractmethod
     async def write_bytes(self, data: bytes) -> None:
-        ...
+        """
+        Write a complete frame.
+
+        data may be any bytes-like object, including a memoryview of a
+        reused encoder buffer. It is only valid until this call returns;
+        implementations that queue data must copy it.
+        """
 
     @abstractmethod
     def attach_destuffer(self, destuffer) -> None:
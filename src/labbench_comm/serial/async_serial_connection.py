@@ -1,8 +1,32 @@
 import asyncio
-from typing import Optional
+import logging
+import os
+from enum import Enum
+from typing import List, Optional, Tuple
 
 from labbench_comm.serial.base import SerialIO
 from labbench_comm.protocols.destuffer import Destuffer
+from labbench_comm.protocols.link import LinkMonitor
+from labbench_comm.protocols.tracing import CHUNK_RECEIVED, monotonic_ns
+from labbench_comm.protocols.exceptions import (
+    SerialClosedError,
+    SerialConnectionError,
+)
+
+
+class ReaderMode(Enum):
+    """
+    How the background reader learns about received bytes.
+
+    - AUTO: EVENT when the SerialIO has a file descriptor and the event
+      loop supports add_reader, POLL otherwise
+    - EVENT: wake up only when the descriptor becomes readable
+    - POLL: poll read_nonblocking() with a 1 ms sleep when idle
+    """
+
+    AUTO = "auto"
+    EVENT = "event"
+    POLL = "poll"
 
 
 class AsyncSerialConnection:
@@ -11,17 +35,69 @@ class AsyncSerialConnection:
 
     Responsibilities:
     - Manage serial port lifecycle
-    - Run a background reader task
+    - Run a background reader (event-driven or polling)
     - Feed raw bytes into a Destuffer
     - Provide async-safe write operations
+    - Pause and resume reading for flow control (pause_reading)
+    - Measure the bytes written and read per second (link)
+
+    By default every write runs SerialIO.write_bytes on a worker thread.
+    With native_writes=True (opt-in, not yet proven on all serial
+    drivers) and a SerialIO that has a write_fileno(), writes are instead
+    copied into a queue that is flushed with os.write on the event loop;
+    frames written back to back are coalesced into a single write, and
+    loop.add_writer resumes a partial write. PySerialIO then switches the
+    port descriptor to non-blocking mode.
     """
 
-    def __init__(self, serial_io: SerialIO) -> None:
+    READ_SIZE = 4096
+
+    # Readable wakeups in a row without data before the descriptor is
+    # considered broken (e.g. a hung-up device) and polling takes over.
+    MAX_EMPTY_WAKEUPS = 64
+
+    # Backpressure for native writes: write_bytes() waits while more than
+    # write_high_water bytes are queued, until at most write_low_water remain.
+    WRITE_HIGH_WATER = 64 * 1024
+    WRITE_LOW_WATER = 16 * 1024
+
+    # How long close() waits for queued writes to be handed to the OS
+    CLOSE_DRAIN_TIMEOUT = 1.0
+
+    def __init__(
+        self,
+        serial_io: SerialIO,
+        reader_mode: ReaderMode = ReaderMode.AUTO,
+        native_writes: bool = False,
+    ) -> None:
         self._io = serial_io
         self._destuffer: Optional[Destuffer] = None
+        self._requested_mode = ReaderMode(reader_mode)
+        self._native_writes = native_writes
 
         self._reader_task: Optional[asyncio.Task] = None
+        self._reader_fd: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._empty_wakeups = 0
+        self._paused = False
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+
+        self._write_fd: Optional[int] = None
+        self._write_queue = bytearray()
+        self._writer_registered = False
+        self._flush_scheduled = False
+        self._write_waiters: List[Tuple[int, asyncio.Future]] = []
+        self.write_high_water = self.WRITE_HIGH_WATER
+        self.write_low_water = self.WRITE_LOW_WATER
+
+        # Wire bytes in each direction, for link utilization
+        self.link = LinkMonitor()
+        # Optional TraceSink, see labbench_comm.protocols.tracing
+        self.tracer = None
+
         self._lock = asyncio.Lock()
+        self._log = logging.getLogger(__name__)
 
     # ------------------------------------------------------------------
     # Configuration
@@ -36,6 +112,44 @@ class AsyncSerialConnection:
 
         self._destuffer = destuffer
 
+    @property
+    def reader_mode(self) -> Optional[ReaderMode]:
+        """
+        Active reader mode (EVENT or POLL), or None when not reading.
+        """
+        if self._reader_fd is not None:
+            return ReaderMode.EVENT
+        if self._reader_task is not None:
+            return ReaderMode.POLL
+        return None
+
+    @property
+    def baudrate(self) -> Optional[int]:
+        """
+        Link speed reported by the SerialIO, or None if unknown.
+        """
+        return getattr(self._io, "baudrate", None)
+
+    @property
+    def reading_paused(self) -> bool:
+        return self._paused
+
+    @property
+    def native_writes_active(self) -> bool:
+        """
+        True if writes currently use the queued os.write path.
+        """
+        return self._write_fd is not None
+
+    @property
+    def queued_bytes(self) -> int:
+        """
+        Bytes accepted by write_bytes() but not yet handed to the OS.
+
+        Always 0 for threaded writes, which complete before returning.
+        """
+        return len(self._write_queue)
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
@@ -50,16 +164,30 @@ class AsyncSerialConnection:
 
             self._io.open()
 
-            self._reader_task = asyncio.create_task(
-                self._reader_loop(),
-                name="AsyncSerialConnection.reader",
-            )
+            try:
+                self._start_reader()
+                self._start_writer()
+            except Exception:
+                self._remove_fd_reader()
+                self._io.close()
+                raise
 
     async def close(self) -> None:
         async with self._lock:
             if not self.is_open:
                 return
 
+            if self._write_fd is not None:
+                try:
+                    await asyncio.wait_for(
+                        self._wait_queued(0), self.CLOSE_DRAIN_TIMEOUT
+                    )
+                except (asyncio.TimeoutError, SerialConnectionError):
+                    pass
+                self._stop_writer(SerialClosedError("Connection closed"))
+
+            self._remove_fd_reader()
+
             if self._reader_task:
                 self._reader_task.cancel()
                 try:
@@ -79,23 +207,265 @@ class AsyncSerialConnection:
     # I/O
     # ------------------------------------------------------------------
 
-    async def write_bytes(self, data: bytes) -> None:
+    async def write_bytes(self, data: bytes, drain: bool = False) -> None:
+        """
+        Write a frame.
+
+        With native writes the data is copied into the write queue and the
+        call returns once it is queued, waiting only while the queue is
+        above write_high_water. With drain=True it also waits until the
+        queue has been handed to the OS.
+        """
         if not self.is_open:
             raise RuntimeError("Connection is not open")
 
-        # Offload blocking write
-        await asyncio.to_thread(self._io.write_bytes, data)
+        self.link.add_sent(len(data))
+        if self._write_fd is None:
+            # Offload blocking write
+            await asyncio.to_thread(self._io.write_bytes, data)
+            return
+
+        self._write_queue += data
+        if not self._flush_scheduled and not self._writer_registered:
+            # Flush on the next loop iteration so that frames written in
+            # the same iteration go out in one os.write
+            self._flush_scheduled = True
+            self._loop.call_soon(self._flush)
+
+        if drain:
+            await self._wait_queued(0)
+        elif len(self._write_queue) > self.write_high_water:
+            await self._wait_queued(self.write_low_water)
+
+    async def drain(self) -> None:
+        """
+        Wait until all queued writes have been handed to the OS.
+        """
+        if self._write_fd is not None:
+            await self._wait_queued(0)
+
+    def pause_reading(self) -> None:
+        """
+        Stop reading from the port until resume_reading() is called.
+
+        Received bytes stay in the OS and device buffers; once those fill
+        up, the device is throttled by serial flow control (if enabled) or
+        data is lost there. Bytes already read are still delivered.
+        """
+        if self._paused:
+            return
+
+        self._paused = True
+        self._resumed.clear()
+        if self._reader_fd is not None and self._loop is not None:
+            self._loop.remove_reader(self._reader_fd)
+
+    def resume_reading(self) -> None:
+        if not self._paused:
+            return
+
+        self._paused = False
+        self._resumed.set()
+        if self._reader_fd is not None and self._loop is not None:
+            self._loop.add_reader(self._reader_fd, self._on_readable)
 
     # ------------------------------------------------------------------
     # Background reader
     # ------------------------------------------------------------------
 
+    def _start_reader(self) -> None:
+        self._loop = asyncio.get_running_loop()
+
+        if self._requested_mode is not ReaderMode.POLL:
+            if self._add_fd_reader():
+                return
+            if self._requested_mode is ReaderMode.EVENT:
+                raise RuntimeError(
+                    "Event-driven reading needs a SerialIO with a fileno() "
+                    "and an event loop that supports add_reader"
+                )
+
+        self._start_polling()
+
+    def _add_fd_reader(self) -> bool:
+        fd = self._io.fileno()
+        if fd is None:
+            return False
+
+        try:
+            self._loop.add_reader(fd, self._on_readable)
+        except NotImplementedError:
+            # e.g. the Windows proactor event loop
+            return False
+
+        if self._paused:
+            self._loop.remove_reader(fd)
+
+        self._reader_fd = fd
+        self._empty_wakeups = 0
+        return True
+
+    def _remove_fd_reader(self) -> None:
+        if self._reader_fd is None:
+            return
+
+        if not self._paused:
+            self._loop.remove_reader(self._reader_fd)
+        self._reader_fd = None
+
+    def _start_polling(self) -> None:
+        self._reader_task = asyncio.create_task(
+            self._reader_loop(),
+            name="AsyncSerialConnection.reader",
+        )
+
+    def _on_readable(self) -> None:
+        # Drain everything that is available in one wakeup
+        try:
+            received = 0
+            while True:
+                n, data = self._io.read_nonblocking(self.READ_SIZE)
+                if not n:
+                    break
+
+                received += n
+                if self.tracer is not None:
+                    self.tracer.emit(
+                        monotonic_ns(), CHUNK_RECEIVED, 0, 0, n
+                    )
+                if self._destuffer:
+                    self._destuffer.add_bytes(data)
+
+                if n < self.READ_SIZE or self._paused:
+                    break
+
+        except Exception as exc:
+            # Same policy as the polling loop: unexpected errors close
+            # the connection
+            self._log.exception("Serial read failed, closing connection")
+            error = SerialConnectionError("Serial read failed")
+            error.__cause__ = exc
+            self._abort(error)
+            return
+
+        if received:
+            self.link.add_received(received)
+            self._empty_wakeups = 0
+            return
+
+        self._empty_wakeups += 1
+        if self._empty_wakeups >= self.MAX_EMPTY_WAKEUPS:
+            self._log.warning(
+                "Serial descriptor is readable without data, "
+                "falling back to polling"
+            )
+            self._remove_fd_reader()
+            self._start_polling()
+
+    # ------------------------------------------------------------------
+    # Native writer
+    # ------------------------------------------------------------------
+
+    def _start_writer(self) -> None:
+        if not self._native_writes:
+            return
+
+        fd = self._io.write_fileno()
+        if fd is None:
+            return
+
+        try:
+            # Probe for add_writer support (not available on the
+            # Windows proactor event loop)
+            self._loop.add_writer(fd, self._flush)
+            self._loop.remove_writer(fd)
+        except NotImplementedError:
+            return
+
+        self._write_fd = fd
+
+    def _stop_writer(self, exc: Exception) -> None:
+        if self._writer_registered:
+            self._loop.remove_writer(self._write_fd)
+            self._writer_registered = False
+
+        self._write_fd = None
+        self._write_queue.clear()
+
+        waiters, self._write_waiters = self._write_waiters, []
+        for _, future in waiters:
+            if not future.done():
+                future.set_exception(exc)
+
+    def _abort(self, exc: Exception) -> None:
+        # Close after an I/O error; writers waiting on the queue fail with
+        # exc, as close() returns early once the port is closed
+        self._stop_writer(exc)
+        self._remove_fd_reader()
+        self._io.close()
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        if self._write_fd is None or not self._write_queue:
+            return
+
+        try:
+            written = os.write(self._write_fd, self._write_queue)
+        except (BlockingIOError, InterruptedError):
+            written = 0
+        except OSError as exc:
+            self._log.exception("Serial write failed, closing connection")
+            error = SerialConnectionError("Serial write failed")
+            error.__cause__ = exc
+            self._abort(error)
+            return
+
+        if written:
+            del self._write_queue[:written]
+
+        if self._write_queue and not self._writer_registered:
+            self._loop.add_writer(self._write_fd, self._flush)
+            self._writer_registered = True
+        elif not self._write_queue and self._writer_registered:
+            self._loop.remove_writer(self._write_fd)
+            self._writer_registered = False
+
+        self._wake_write_waiters()
+
+    async def _wait_queued(self, threshold: int) -> None:
+        if len(self._write_queue) <= threshold:
+            return
+
+        future = self._loop.create_future()
+        self._write_waiters.append((threshold, future))
+        await future
+
+    def _wake_write_waiters(self) -> None:
+        queued = len(self._write_queue)
+        pending = []
+        for threshold, future in self._write_waiters:
+            if future.done():
+                continue
+            if queued <= threshold:
+                future.set_result(None)
+            else:
+                pending.append((threshold, future))
+        self._write_waiters = pending
+
     async def _reader_loop(self) -> None:
         try:
             while True:
+                if self._paused:
+                    await self._resumed.wait()
+
                 n, data = self._io.read_nonblocking(1024)
 
                 if n and self._destuffer:
+                    self.link.add_received(n)
+                    if self.tracer is not None:
+                        self.tracer.emit(
+                            monotonic_ns(), CHUNK_RECEIVED, 0, 0, n
+                        )
                     self._destuffer.add_bytes(data)
                 else:
                     # Avoid hot spinning when no data is available
@@ -105,12 +475,12 @@ class AsyncSerialConnection:
             # Normal shutdown path
             pass
 
-        except Exception:
+        except Exception as exc:
             # Any unexpected error should close the connection
-            try:
-                self._io.close()
-            finally:
-                raise
+            error = SerialConnectionError("Serial read failed")
+            error.__cause__ = exc
+            self._abort(error)
+            raise
 
     # ------------------------------------------------------------------
     # Async context manager
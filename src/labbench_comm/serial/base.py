@@ -1,7 +1,7 @@
 # labbench_comm/serial/base.py
 
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import Optional, Tuple
 
 
 class SerialIO(ABC):
@@ -11,6 +11,10 @@ class SerialIO(ABC):
     This interface is intentionally small:
     - write_bytes() sends raw bytes
     - read_nonblocking() retrieves available bytes without blocking
+
+    Implementations backed by a selectable OS handle may also override
+    fileno() and write_fileno() so the connection can wait for readiness
+    instead of polling or blocking a thread.
     """
 
     @abstractmethod
@@ -44,3 +48,28 @@ class SerialIO(ABC):
         May return (0, b"") if no data is available.
         """
         ...
+
+    @property
+    def baudrate(self) -> Optional[int]:
+        """
+        Configured link speed in bits per second, or None if unknown.
+        """
+        return None
+
+    def fileno(self) -> Optional[int]:
+        """
+        File descriptor that becomes readable when data arrives.
+
+        Returns None (the default) if the implementation has none, in
+        which case the connection falls back to polling read_nonblocking().
+        """
+        return None
+
+    def write_fileno(self) -> Optional[int]:
+        """
+        Non-blocking file descriptor that writes to the device.
+
+        Returns None (the default) if the implementation has none, in
+        which case writes go through write_bytes() on a worker thread.
+        """
+        return None
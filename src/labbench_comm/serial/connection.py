@@ -3,6 +3,7 @@
 from __future__ import annotations
 from typing import Optional, Tuple
 
+import os
 import serial
 from serial import SerialException
 import serial.tools.list_ports
@@ -105,6 +106,10 @@ class PySerialIO(SerialIO):
     def is_open(self) -> bool:
         return self._serial is not None and self._serial.is_open
 
+    @property
+    def baudrate(self) -> int:
+        return self._baudrate
+
     def _require_open(self) -> serial.Serial:
         ser = self._serial
         if ser is None or not ser.is_open:
@@ -150,6 +155,29 @@ class PySerialIO(SerialIO):
 
         return len(data), data
 
+    def fileno(self) -> Optional[int]:
+        ser = self._serial
+        if ser is None or not ser.is_open:
+            return None
+
+        # Only the POSIX backend exposes a selectable descriptor
+        fileno = getattr(ser, "fileno", None)
+        if fileno is None:
+            return None
+
+        try:
+            return fileno()
+        except (SerialException, OSError, AttributeError):
+            return None
+
+    def write_fileno(self) -> Optional[int]:
+        # pyserial opens the POSIX port with O_NONBLOCK; make sure of it,
+        # as the async writer relies on EAGAIN instead of blocking.
+        fd = self.fileno()
+        if fd is not None:
+            os.set_blocking(fd, False)
+        return fd
+
     # -------------------- Utilities -------------------- #
 
     @staticmethod
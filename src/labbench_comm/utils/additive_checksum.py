@@ -13,10 +13,37 @@ def additive_checksum(data: bytes, length: int | None = None) -> int:
     if data is None:
         return checksum
 
-    if length is None:
-        length = len(data)
+    view = memoryview(data)
+    if length is not None:
+        view = view[:length]
 
-    for i in range(length):
-        checksum = (checksum + data[i]) & 0xFF
+    return sum(view) & 0xFF
 
-    return checksum
+
+class AdditiveChecksum:
+    """
+    Incremental additive checksum.
+
+    Counterpart of Crc8 for packets using the additive algorithm.
+    """
+
+    __slots__ = ("_sum",)
+
+    def __init__(self, data: bytes | None = None) -> None:
+        self._sum = 0x00
+        if data is not None:
+            self.update(data)
+
+    def update(self, data: bytes) -> AdditiveChecksum:
+        self._sum = (self._sum + sum(memoryview(data))) & 0xFF
+        return self
+
+    def update_byte(self, value: int) -> AdditiveChecksum:
+        self._sum = (self._sum + value) & 0xFF
+        return self
+
+    def digest(self) -> int:
+        return self._sum
+
+    def reset(self) -> None:
+        self._sum = 0x00
@@ -7,6 +7,8 @@ def crc8_ccitt(data: bytes, length: int | None = None) -> int:
 
     Polynomial: 0x07
     Initial value: 0x00
+
+    Table driven: one lookup per byte instead of an 8-step bit loop.
     """
 
     crc = 0x00
@@ -14,13 +16,49 @@ def crc8_ccitt(data: bytes, length: int | None = None) -> int:
     if data is None:
         return crc
 
-    if length is None:
-        length = len(data)
+    if length is not None:
+        data = memoryview(data)[:length]
+
+    table = _CRC8_TABLE
+    for value in data:
+        crc = table[crc ^ value]
+
+    return crc
+
+
+class Crc8:
+    """
+    Incremental CRC-8-CCITT.
+
+    Feed data with update() while a packet is assembled and read the
+    checksum with digest(). The result equals crc8_ccitt() over the
+    concatenation of all updates.
+    """
+
+    __slots__ = ("_crc",)
+
+    def __init__(self, data: bytes | None = None) -> None:
+        self._crc = 0x00
+        if data is not None:
+            self.update(data)
+
+    def update(self, data: bytes) -> Crc8:
+        crc = self._crc
+        table = _CRC8_TABLE
+        for value in data:
+            crc = table[crc ^ value]
+        self._crc = crc
+        return self
 
-    for i in range(length):
-        crc = _update_crc8_ccitt(crc, data[i])
+    def update_byte(self, value: int) -> Crc8:
+        self._crc = _CRC8_TABLE[self._crc ^ (value & 0xFF)]
+        return self
 
-    return crc & 0xFF
+    def digest(self) -> int:
+        return self._crc
+
+    def reset(self) -> None:
+        self._crc = 0x00
 
 
 def _update_crc8_ccitt(crc: int, value: int) -> int:
@@ -36,3 +74,7 @@ def _update_crc8_ccitt(crc: int, value: int) -> int:
             data = (data << 1) & 0xFF
 
     return data
+
+
+# CRC after one byte is a function of (crc ^ value) only
+_CRC8_TABLE = bytes(_update_crc8_ccitt(0x00, i) for i in range(256))
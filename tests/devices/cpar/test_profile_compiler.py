@@ -0,0 +1,132 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from labbench_comm.devices.cpar import (
+    InstructionCodec,
+    ProfileCompiler,
+    WaveformInstructionType,
+)
+
+
+def _execute(instructions):
+    # Tick-by-tick reference of the device, on the encoded instructions
+    pressure = 0.0
+    ticks = []
+    for instruction in instructions:
+        decoded = InstructionCodec.decode(InstructionCodec.encode(instruction))
+        count = int(round(decoded.time * InstructionCodec.UPDATE_RATE))
+        step = decoded.argument / InstructionCodec.UPDATE_RATE
+        if decoded.operand is WaveformInstructionType.DEC:
+            step = -step
+        for _ in range(count):
+            if decoded.operand is WaveformInstructionType.STEP:
+                pressure = decoded.argument
+            else:
+                pressure = min(max(pressure + step, 0.0), InstructionCodec.MAX_PRESSURE)
+            ticks.append(pressure)
+    return np.array(ticks)
+
+
+def _smooth_curve(seconds: float, seed: int = 5):
+    rng = random.Random(seed)
+    t = np.arange(int(seconds * 100)) / 100.0
+    curve = 40.0 + np.zeros_like(t)
+    for _ in range(4):
+        curve += rng.uniform(2, 10) * np.sin(t / rng.uniform(1, 10) + rng.uniform(0, 6))
+    return curve
+
+
+@pytest.mark.unittest
+def test_ramp_and_hold_compile_to_one_instruction_each():
+    target = np.concatenate([np.linspace(0.0, 50.0, 1000), np.full(500, 50.0)])
+
+    profile = ProfileCompiler(tolerance=0.1).compile(target)
+
+    operands = [i.operand for i in profile.instructions]
+    assert operands == [WaveformInstructionType.INC, WaveformInstructionType.STEP]
+    assert profile.duration == pytest.approx(15.0)
+    assert profile.max_error <= 0.1
+
+
+@pytest.mark.unittest
+def test_jumps_use_steps():
+    target = np.concatenate([np.full(200, 20.0), np.full(200, 60.0), np.full(200, 5.0)])
+
+    profile = ProfileCompiler(tolerance=0.1).compile(target)
+
+    assert [i.argument for i in profile.instructions] == pytest.approx([20.0, 60.0, 5.0], abs=1e-6)
+    assert all(i.operand is WaveformInstructionType.STEP for i in profile.instructions)
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("tolerance", [0.05, 0.5, 2.0])
+def test_error_within_tolerance_and_matches_device(tolerance):
+    target = _smooth_curve(120.0)
+
+    profile = ProfileCompiler(tolerance=tolerance).compile(target)
+    executed = _execute(profile.instructions)
+
+    assert len(executed) == len(target)
+    np.testing.assert_allclose(profile.pressure, executed, atol=1e-9)
+    assert profile.max_error == pytest.approx(np.abs(executed - target).max())
+    assert profile.max_error <= tolerance + 1e-3
+    assert profile.rms_error <= profile.max_error
+
+
+@pytest.mark.unittest
+def test_fewer_instructions_for_larger_tolerance():
+    target = _smooth_curve(60.0)
+
+    fine = ProfileCompiler(tolerance=0.1).compile(target)
+    coarse = ProfileCompiler(tolerance=1.0).compile(target)
+
+    assert len(coarse) < len(fine)
+
+
+@pytest.mark.unittest
+def test_resamples_to_device_rate():
+    profile = ProfileCompiler().compile([0.0, 10.0, 20.0, 30.0], sample_rate=1.0)
+
+    assert len(profile.target) == 400
+    assert profile.duration == pytest.approx(4.0)
+    assert profile.target[100] == pytest.approx(10.0)
+
+
+@pytest.mark.unittest
+def test_clips_to_max_pressure():
+    profile = ProfileCompiler(tolerance=0.1).compile(np.full(100, 150.0))
+
+    assert profile.instructions[0].argument == pytest.approx(InstructionCodec.MAX_PRESSURE)
+    assert profile.max_error <= 0.1
+
+
+@pytest.mark.unittest
+def test_long_hold_is_split_at_max_time():
+    profile = ProfileCompiler().compile(np.full(int(700 * 100), 30.0))
+
+    assert [i.operand for i in profile.instructions] == [WaveformInstructionType.STEP] * 2
+    assert profile.duration == pytest.approx(700.0)
+
+
+@pytest.mark.unittest
+def test_rejects_profiles_over_instruction_limit():
+    rng = np.random.default_rng(1)
+    noise = rng.uniform(0, 100, 2000)
+
+    with pytest.raises(ValueError):
+        ProfileCompiler(tolerance=0.1, max_instructions=256).compile(noise)
+
+
+@pytest.mark.unittest
+def test_create_function_serializes_program():
+    profile = ProfileCompiler().compile(_smooth_curve(30.0))
+
+    function = profile.create_function(channel=1, repeat=2)
+    function.on_send()
+
+    assert function.channel == 1
+    assert function.request.length == 2 + 6 * len(profile)
+    assert function.program_length == pytest.approx(2 * profile.duration)
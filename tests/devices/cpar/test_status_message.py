@@ -0,0 +1,142 @@
+import pytest
+
+from labbench_comm.devices.cpar import (
+    CPARplusCentral,
+    CPARplusStatus,
+    DeviceState,
+    StatusMessage,
+    StopCondition,
+)
+from labbench_comm.protocols.bus_central import BusCentral
+from labbench_comm.protocols.packet import Packet
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.destuffer = None
+
+    def attach_destuffer(self, destuffer) -> None:
+        self.destuffer = destuffer
+
+    @property
+    def is_open(self) -> bool:
+        return False
+
+    async def open(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def write_bytes(self, data: bytes) -> None:
+        pass
+
+
+def make_status(state: DeviceState, pressure: int = 2048) -> StatusMessage:
+    packet = Packet(0x80, 22)
+    packet.insert_byte(0, state - 1)
+    packet.insert_byte(1, 0x01 | 0x04 | 0x20)
+    packet.insert_uint16(2, 7)
+    packet.insert_byte(4, StopCondition.STOPCOND_STOP_BUTTON_PRESSED)
+    packet.insert_byte(5, 51)
+    packet.insert_byte(6, 102)
+    packet.insert_uint16(7, 4095)
+    for offset in range(9, 21, 2):
+        packet.insert_uint16(offset, pressure + offset)
+    packet.insert_bool(21, True)
+    return StatusMessage(packet)
+
+
+# ---------------------------------------------------------------------------
+# CPARplusStatus
+# ---------------------------------------------------------------------------
+
+@pytest.mark.unittest
+def test_status_slots_follow_layout():
+    derived = {"record", "system_state"} | {
+        "vas_connected", "vas_is_low", "power_on",
+        "compressor_running", "start_possible", "supply_pressure_low",
+    }
+    names = [
+        "stop_condition_binary" if name == "stop_condition" else name
+        for name in StatusMessage.LAYOUT.names
+    ]
+
+    assert set(CPARplusStatus.__slots__) == set(names) | derived
+
+
+@pytest.mark.unittest
+def test_status_fields_are_assigned_by_layout_name():
+    # Distinct values, so a field assigned from the wrong position shows up
+    record = tuple(range(len(StatusMessage.LAYOUT.names)))
+    status = CPARplusStatus(record)
+
+    for index, name in enumerate(StatusMessage.LAYOUT.names):
+        if name == "stop_condition":
+            name = "stop_condition_binary"
+        assert getattr(status, name) == index, name
+
+
+@pytest.mark.unittest
+def test_status_matches_message_properties():
+    message = make_status(DeviceState.STATE_STIMULATING)
+    status = message.status
+
+    for name in StatusMessage.LAYOUT.names:
+        assert getattr(status, name) == getattr(message, name), name
+
+    assert status.system_state is DeviceState.STATE_STIMULATING
+    assert status.stop_condition is StopCondition.STOPCOND_STOP_BUTTON_PRESSED
+    assert status.vas_connected and status.power_on and status.supply_pressure_low
+    assert not (status.vas_is_low or status.compressor_running or status.start_possible)
+
+
+@pytest.mark.unittest
+def test_status_is_cached_until_packet_changes():
+    message = make_status(DeviceState.STATE_IDLE)
+    status = message.status
+
+    assert message.status is status
+
+    message.actual_pressure_01_binary = 4095
+    updated = message.status
+
+    assert updated is not status
+    assert updated.actual_pressure_01 == message.actual_pressure_01
+
+
+@pytest.mark.unittest
+def test_unknown_stop_condition_only_fails_on_access():
+    message = make_status(DeviceState.STATE_IDLE)
+    message.packet.insert_byte(4, 200)
+
+    status = StatusMessage(message.packet).status
+
+    assert status.stop_condition_binary == 200
+    with pytest.raises(ValueError):
+        status.stop_condition
+
+
+# ---------------------------------------------------------------------------
+# CPARplusCentral
+# ---------------------------------------------------------------------------
+
+@pytest.mark.unittest
+def test_central_state_and_recording_from_status():
+    device = CPARplusCentral(BusCentral(FakeConnection()))
+    seen = []
+    device.status_received.append(lambda sender, msg: seen.append(msg))
+
+    first = make_status(DeviceState.STATE_STIMULATING, pressure=1000)
+    device.on_status_message(first)
+    device.on_status_message(make_status(DeviceState.STATE_STIMULATING, pressure=2000))
+
+    assert device.state is DeviceState.STATE_STIMULATING
+    assert device.status.actual_pressure_01 == device.actual_pressure_01
+    assert device.response_connected
+    assert seen[0] is first
+
+    data = device._current_stimulation_data
+    assert len(data) == 2
+    assert data.actual_pressure_01 == [first.actual_pressure_01, device.actual_pressure_01]
+    assert data.final_vas_scores == [first.final_vas_score] * 2
@@ -0,0 +1,157 @@
+import pytest
+
+from labbench_comm.devices.cpar.stimulation_data import (
+    StimulationData,
+    StimulationSample,
+)
+
+
+def _sample(i: float) -> StimulationSample:
+    return StimulationSample(
+        actual_pressure_01=i,
+        target_pressure_01=i + 0.1,
+        final_pressure_01=i + 0.2,
+        actual_pressure_02=i + 0.3,
+        target_pressure_02=i + 0.4,
+        final_pressure_02=i + 0.5,
+        vas_score=i / 10,
+        final_vas_score=i / 20,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Appending and accessors
+# ---------------------------------------------------------------------------
+
+@pytest.mark.unittest
+def test_empty_data():
+    data = StimulationData()
+
+    assert len(data) == 0
+    assert not data.has_data
+    assert data.samples == []
+    assert data.time == []
+    assert data.actual_pressure_01 == []
+
+
+@pytest.mark.unittest
+def test_samples_round_trip_beyond_capacity():
+    data = StimulationData(capacity=2)
+    samples = [_sample(i) for i in range(5)]
+    for sample in samples:
+        data.add_sample(sample)
+
+    assert len(data) == 5
+    assert data.samples == samples
+    assert data[-1] == samples[-1]
+    assert data.actual_pressure_01 == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert data.vas_scores == [s.vas_score for s in samples]
+    assert data.time == pytest.approx([0.0, 0.05, 0.1, 0.15, 0.2])
+
+    with pytest.raises(IndexError):
+        data[5]
+
+
+@pytest.mark.unittest
+def test_add_values_requires_all_channels():
+    data = StimulationData()
+
+    with pytest.raises(ValueError):
+        data.add_values(1.0, 2.0)
+
+
+@pytest.mark.unittest
+def test_column_view_survives_growth():
+    data = StimulationData(capacity=2)
+    data.add_sample(_sample(1))
+    data.add_sample(_sample(2))
+    view = data.column("actual_pressure_01")
+
+    data.add_sample(_sample(3))
+
+    assert view.tolist() == [1.0, 2.0]
+    assert data.column("actual_pressure_01").tolist() == [1.0, 2.0, 3.0]
+
+    with pytest.raises(KeyError):
+        data.column("pressure")
+
+
+@pytest.mark.unittest
+def test_as_dict_keeps_format():
+    data = StimulationData()
+    data.add_sample(_sample(1))
+
+    result = data.as_dict()
+
+    assert list(result) == [
+        "time",
+        "actual_pressure_01",
+        "target_pressure_01",
+        "final_pressure_01",
+        "actual_pressure_02",
+        "target_pressure_02",
+        "final_pressure_02",
+        "vas_score",
+        "final_vas_score",
+    ]
+    assert result["final_vas_score"] == [0.05]
+
+
+@pytest.mark.unittest
+def test_between_selects_time_range():
+    data = StimulationData()
+    for i in range(10):
+        data.add_sample(_sample(i))
+
+    window = data.between(0.15, 0.3)
+
+    assert window.actual_pressure_01 == [3.0, 4.0, 5.0]
+    assert data.between(start=0.4).actual_pressure_01 == [8.0, 9.0]
+    assert len(data.between(0.3, 0.1)) == 0
+
+
+# ---------------------------------------------------------------------------
+# NumPy export
+# ---------------------------------------------------------------------------
+
+@pytest.mark.unittest
+def test_to_numpy_shares_memory():
+    np = pytest.importorskip("numpy")
+    data = StimulationData()
+    for i in range(4):
+        data.add_sample(_sample(i))
+
+    columns = data.to_numpy()
+
+    np.testing.assert_allclose(columns["time"], [0.0, 0.05, 0.1, 0.15])
+    np.testing.assert_array_equal(columns["actual_pressure_01"], [0, 1, 2, 3])
+    assert not columns["vas_score"].flags.writeable
+
+    # Writes into spare capacity do not show in an existing view
+    data.add_sample(_sample(4))
+    assert len(columns["actual_pressure_01"]) == 4
+    assert np.shares_memory(
+        columns["actual_pressure_01"], data.to_numpy()["actual_pressure_01"]
+    )
+
+
+@pytest.mark.unittest
+def test_samples_is_a_writable_list_view():
+    data = StimulationData(capacity=2)
+    data.samples.append(_sample(0))
+    data.samples.extend([_sample(1), _sample(2)])
+    view = data.column("actual_pressure_01")
+
+    data.samples[1] = _sample(7)
+    del data.samples[0]
+    data.samples.insert(0, _sample(5))
+
+    assert data.samples == [_sample(5), _sample(7), _sample(2)]
+    assert data.samples[-1] == _sample(2)
+    assert data.actual_pressure_01 == [5.0, 7.0, 2.0]
+    # Views taken before the changes still show the old samples
+    assert list(view) == [0.0, 1.0, 2.0]
+
+    data.samples = [_sample(3)]
+    assert len(data) == 1
+    assert data.vas_scores == [_sample(3).vas_score]
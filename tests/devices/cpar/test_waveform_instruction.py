@@ -1,6 +1,10 @@
 import math
+import random
+
 import pytest
 
+from labbench_comm.devices.cpar import instruction_codec
+from labbench_comm.devices.cpar.functions import SetWaveformProgram
 from labbench_comm.devices.cpar.waveform import WaveformInstruction
 from labbench_comm.devices.cpar.instruction_codec import InstructionCodec
 from labbench_comm.devices.cpar.definitions import WaveformInstructionType
@@ -183,3 +187,88 @@ def test_opcode_bits_preserved():
 
     opcode = (binary >> 46) & 0x03
     assert opcode == instr.operand
+
+
+# ---------------------------------------------------------------------------
+# Batch encode / decode
+# ---------------------------------------------------------------------------
+
+def _program(count: int):
+    rng = random.Random(count)
+    factories = [
+        lambda: WaveformInstruction.step(rng.uniform(-5.0, 100.0), rng.uniform(-1.0, 10.0)),
+        lambda: WaveformInstruction.increment(rng.uniform(0.0, 50.0), rng.uniform(0.0, 10.0)),
+        lambda: WaveformInstruction.decrement(rng.uniform(0.0, 50.0), rng.uniform(0.0, 10.0)),
+        lambda: WaveformInstruction(argument=rng.uniform(0.0, 5.0), time=rng.uniform(0.0, 5.0)),
+    ]
+    return [factories[i % 4]() for i in range(count)]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def batch_backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(instruction_codec, "_numpy", lambda: None)
+    return request.param
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("count", [0, 3, 256])
+def test_encode_many_matches_encode(batch_backend, count):
+    program = _program(count)
+
+    encoded = InstructionCodec.encode_many(program)
+
+    assert encoded == b"".join(InstructionCodec.encode(i) for i in program)
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("count", [0, 3, 256])
+def test_decode_many_matches_decode(batch_backend, count):
+    encoded = InstructionCodec.encode_many(_program(count))
+    size = InstructionCodec.INSTRUCTIONS_LENGTH
+
+    decoded = InstructionCodec.decode_many(memoryview(encoded))
+
+    assert decoded == [
+        InstructionCodec.decode(encoded[i : i + size])
+        for i in range(0, len(encoded), size)
+    ]
+    assert all(type(i.argument) is float for i in decoded)
+
+
+@pytest.mark.unittest
+def test_encode_many_raises_for_first_invalid_instruction(batch_backend):
+    program = _program(64)
+    program[40] = WaveformInstruction.step(120.0, 1.0)
+    program[50] = WaveformInstruction.increment(1.0, InstructionCodec.MAX_TIME + 1)
+
+    with pytest.raises(ValueError, match="STEP instruction pressure"):
+        InstructionCodec.encode_many(program)
+
+
+@pytest.mark.unittest
+def test_decode_many_invalid_length():
+    with pytest.raises(ValueError):
+        InstructionCodec.decode_many(b"\x00" * 7)
+
+
+@pytest.mark.unittest
+def test_set_waveform_program_roundtrip(batch_backend):
+    program = SetWaveformProgram()
+    program.channel = 1
+    program.repeat = 3
+    program.instructions = _program(40)
+    program.on_send()
+
+    received = SetWaveformProgram()
+    received.set_request(program.request)
+    received.on_slave_received()
+
+    assert program.request.get_bytes(2, 240) == program.serialize_instructions()
+    assert received.channel == 1
+    assert received.repeat == 3
+    assert received.instructions == InstructionCodec.decode_many(
+        program.serialize_instructions()
+    )
@@ -0,0 +1,138 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from labbench_comm.devices.cpar import (
+    InstructionCodec,
+    SetWaveformProgram,
+    WaveformInstruction,
+    WaveformInstructionType,
+)
+from labbench_comm.devices.cpar.waveform_simulator import Trigger, WaveformSimulator
+
+MAX_OPERAND = 0x3FFFFFFF
+
+
+def _step_by_step(instructions, repeat=1):
+    # Tick-by-tick reference with the fixed-point accumulator
+    encoded = InstructionCodec.encode_many(instructions)
+    accumulator = 0
+    ticks = []
+    for _ in range(repeat):
+        for i in range(0, len(encoded), 6):
+            binary = int.from_bytes(encoded[i : i + 6], "little")
+            opcode = WaveformInstructionType(binary >> 46)
+            operand = (binary >> 16) & MAX_OPERAND
+            cycles = binary & 0xFFFF
+            if opcode is WaveformInstructionType.TRIG:
+                continue
+            for _ in range(cycles):
+                if opcode is WaveformInstructionType.STEP:
+                    accumulator = operand
+                elif opcode is WaveformInstructionType.INC:
+                    accumulator = min(accumulator + operand, MAX_OPERAND)
+                else:
+                    accumulator = max(accumulator - operand, 0)
+                ticks.append(min(100.0 * (accumulator / MAX_OPERAND), 100.0))
+    return np.array(ticks)
+
+
+def _random_program(rng, count):
+    factories = [
+        lambda: WaveformInstruction.step(rng.uniform(0, 100), rng.uniform(0, 0.5)),
+        lambda: WaveformInstruction.increment(rng.uniform(0, 200), rng.uniform(0, 1.0)),
+        lambda: WaveformInstruction.decrement(rng.uniform(0, 200), rng.uniform(0, 1.0)),
+        lambda: WaveformInstruction(argument=0.0, time=rng.uniform(0, 0.5)),
+    ]
+    return [rng.choice(factories)() for _ in range(count)]
+
+
+@pytest.mark.unittest
+def test_step_ramp_and_clamping():
+    program = [
+        WaveformInstruction.step(10.0, 0.05),
+        WaveformInstruction.increment(100.0, 0.05),
+        WaveformInstruction.decrement(300.0, 0.1),
+        WaveformInstruction.increment(2000.0, 0.1),
+    ]
+
+    waveform = WaveformSimulator().simulate(program)
+
+    assert waveform.duration == pytest.approx(0.3)
+    np.testing.assert_allclose(waveform.pressure[:5], 10.0, atol=1e-6)
+    np.testing.assert_allclose(waveform.pressure[5:10], [11, 12, 13, 14, 15], atol=1e-6)
+    assert waveform.pressure[10:20].min() == 0.0
+    assert waveform.pressure[-1] == InstructionCodec.MAX_PRESSURE
+
+
+@pytest.mark.unittest
+def test_matches_step_by_step_reference():
+    rng = random.Random(7)
+    for count in (1, 5, 40):
+        program = _random_program(rng, count)
+
+        waveform = WaveformSimulator().simulate(program, repeat=3)
+
+        np.testing.assert_array_equal(waveform.pressure, _step_by_step(program, 3))
+
+
+@pytest.mark.unittest
+def test_set_waveform_program_repeat_channel_and_triggers():
+    function = SetWaveformProgram()
+    function.channel = 1
+    function.repeat = 2
+    function.instructions = [
+        WaveformInstruction.step(20.0, 1.0),
+        WaveformInstruction(argument=0.0, time=0.25),
+        WaveformInstruction.increment(10.0, 1.0),
+    ]
+
+    waveform = WaveformSimulator().simulate(function)
+
+    assert waveform.channel == 1
+    assert waveform.duration == pytest.approx(function.program_length)
+    assert waveform.triggers == [Trigger(1.25, 0.0), Trigger(3.25, 0.0)]
+    np.testing.assert_allclose(waveform.time[:2], [0.0, 0.01])
+
+
+@pytest.mark.unittest
+def test_batch_matches_single_programs():
+    rng = random.Random(3)
+    programs = [_random_program(rng, rng.randrange(0, 30)) for _ in range(50)]
+    programs.append(InstructionCodec.encode_many(programs[0]))
+
+    simulator = WaveformSimulator()
+    batch = simulator.simulate_many(programs)
+
+    assert len(batch) == len(programs)
+    assert batch.pressure.shape == (len(programs), max(batch.lengths))
+    for i, program in enumerate(programs):
+        single = simulator.simulate(program)
+        np.testing.assert_array_equal(batch[i].pressure, single.pressure)
+        assert batch[i].triggers == single.triggers
+        assert np.isnan(batch.pressure[i, batch.lengths[i]:]).all()
+
+
+@pytest.mark.unittest
+def test_batch_renders_in_chunks(monkeypatch):
+    rng = random.Random(11)
+    programs = [_random_program(rng, 20) for _ in range(10)]
+    simulator = WaveformSimulator()
+    expected = simulator.simulate_many(programs).pressure
+
+    monkeypatch.setattr(WaveformSimulator, "_CHUNK_TICKS", 50)
+
+    np.testing.assert_array_equal(simulator.simulate_many(programs).pressure, expected)
+
+
+@pytest.mark.unittest
+def test_empty_inputs():
+    simulator = WaveformSimulator()
+
+    assert simulator.simulate([]).duration == 0.0
+    assert simulator.simulate_many([]).pressure.shape == (0, 0)
+
+    with pytest.raises(ValueError):
+        simulator.simulate([], repeat=0)
@@ -0,0 +1,101 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from labbench_comm.devices.cpar.messages import StatusMessage as CPARStatusMessage
+from labbench_comm.devices.lio.messages import ButtonMessage, SignalMessage
+from labbench_comm.protocols.batch import BatchCollector, BatchDecoder
+from labbench_comm.protocols.frame import Frame
+from labbench_comm.protocols.packet import Packet
+from labbench_comm.protocols.packet_receiver import PacketReceiver
+
+
+def _random_packets(code: int, length: int, count: int, seed: int = 3):
+    rng = random.Random(seed)
+    packets = []
+    for _ in range(count):
+        packet = Packet(code, length)
+        for i in range(length):
+            packet.insert_byte(i, rng.randrange(256))
+        packets.append(packet)
+    return packets
+
+
+@pytest.mark.unittest
+def test_signal_columns_match_message_properties():
+    packets = _random_packets(0x90, 21, 200)
+    # Exercise the zero-range branch of value
+    packets[0].insert_uint16(13, 0)
+
+    decoder = BatchDecoder(SignalMessage)
+    columns = decoder.decode_columns(packets)
+
+    assert len(columns["signal"]) == 200
+    for i, packet in enumerate(packets):
+        message = SignalMessage(packet)
+        assert columns["a"][i] == message.a
+        assert columns["target"][i] == message.target
+        assert columns["value"][i] == message.value
+        assert columns["voltage"][i] == message.voltage
+        assert columns["port"][i] == packet.get_byte(0)
+
+
+@pytest.mark.unittest
+def test_cpar_status_columns_match_message_properties():
+    packets = _random_packets(0x80, 22, 100)
+    decoder = BatchDecoder(CPARStatusMessage)
+    columns = decoder.columns(decoder.decode(b"".join(p.payload for p in packets)))
+
+    for i, packet in enumerate(packets):
+        message = CPARStatusMessage(packet)
+        assert columns["actual_pressure_01"][i] == message.actual_pressure_01
+        assert columns["supply_pressure"][i] == message.supply_pressure
+        assert columns["vas_score"][i] == message.vas_score
+        assert columns["target_pressure_02_binary"][i] == message.target_pressure_02_binary
+        assert columns["system_state"][i] == message.system_state_binary + 1
+        assert columns["vas_connected"][i] == message.vas_connected
+        assert bool(columns["stop_pressed"][i]) == message.stop_pressed
+
+
+@pytest.mark.unittest
+def test_button_time_column_handles_zero_divisor():
+    packets = _random_packets(0x91, 10, 50)
+    packets[0].insert_byte(5, 0)
+
+    columns = BatchDecoder(ButtonMessage).decode_columns(packets)
+
+    assert columns["time"][0] == 0
+    assert columns["time"].tolist() == [ButtonMessage(p).time for p in packets]
+
+
+@pytest.mark.unittest
+def test_decoder_rejects_mismatched_payloads():
+    decoder = BatchDecoder(SignalMessage)
+
+    with pytest.raises(ValueError):
+        decoder.decode(bytes(20))
+    with pytest.raises(ValueError):
+        decoder.decode([Packet(0x91, 21)])
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("zero_copy", [False, True])
+def test_collector_buffers_packets_from_a_recording(zero_copy):
+    packets = _random_packets(0x90, 21, 20)
+    recording = b"".join(Frame.encode(p.to_bytes()) for p in packets)
+    recording += Frame.encode(Packet(0x80, 7).to_bytes())
+    recording += Frame.encode(Packet(0x90, 3).to_bytes())
+
+    collector = BatchCollector(SignalMessage)
+    receiver = PacketReceiver(zero_copy=zero_copy)
+    receiver.on_packet(collector)
+    receiver.add_bytes(recording)
+
+    assert len(collector) == 20
+    assert collector.rejected == 1
+
+    records = collector.drain()
+    assert len(collector) == 0
+    assert records["signal"].tolist() == [p.get_uint16(3) for p in packets]
@@ -0,0 +1,672 @@
+import asyncio
+import logging
+
+import pytest
+
+from labbench_comm.protocols.bus_central import BusCentral
+from labbench_comm.protocols.destuffer import Destuffer
+from labbench_comm.protocols.device import Device
+from labbench_comm.protocols.device_function import DeviceFunction
+from labbench_comm.protocols.exceptions import (
+    FunctionNotAcknowledgedError,
+    PeripheralNotRespondingError,
+)
+from labbench_comm.protocols.frame import Frame
+from labbench_comm.protocols.functions.ping import Ping
+from labbench_comm.protocols.packet import Packet
+from labbench_comm.protocols.scheduler import Priority
+from labbench_comm.protocols.timeouts import TimeoutPolicy
+
+
+class LoopbackConnection:
+    """
+    Fake connection that answers requests through a responder callback.
+
+    The responder gets each request packet and returns the response
+    packets (or None to stay silent).
+    """
+
+    def __init__(self, responder=None) -> None:
+        self.destuffer = None
+        self.responder = responder
+        self.writes: list[bytes] = []
+        self._open = False
+        self._requests = Destuffer()
+        self._requests.on_receive(self._on_request)
+
+    def attach_destuffer(self, destuffer) -> None:
+        self.destuffer = destuffer
+
+    @property
+    def is_open(self) -> bool:
+        return self._open
+
+    async def open(self) -> None:
+        self._open = True
+
+    async def close(self) -> None:
+        self._open = False
+
+    async def write_bytes(self, data) -> None:
+        self.writes.append(bytes(data))
+        self._requests.add_bytes(bytes(data))
+
+    def _on_request(self, _, frame) -> None:
+        if self.responder is None:
+            return
+        responses = self.responder(Packet.from_frame(frame))
+        loop = asyncio.get_running_loop()
+        for response in responses or []:
+            loop.call_soon(self.destuffer.add_bytes, Frame.encode(response.to_bytes()))
+
+
+def ping_responder(request: Packet):
+    response = Packet(request.code, 4)
+    response.insert_uint32(0, 42)
+    return [response]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_execute_round_trip():
+    connection = LoopbackConnection(ping_responder)
+    central = BusCentral(connection)
+    await central.open()
+
+    ping = Ping()
+    await central.execute(ping)
+
+    assert ping.count == 42
+    assert connection.writes == [Frame.encode(ping.request.to_bytes())]
+
+
+class RecordingListener:
+    def __init__(self) -> None:
+        self.messages = []
+
+    def on_event_message(self, message) -> None:
+        self.messages.append(message)
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("exclusive", [False, True])
+def test_packet_listeners_run_before_message_dispatch(exclusive):
+    from labbench_comm.devices.lio.messages import EventMessage
+
+    central = BusCentral(LoopbackConnection())
+    central.add_message(EventMessage())
+    listener = RecordingListener()
+    central.message_listener = listener
+
+    seen = []
+    central.add_packet_listener(0x81, lambda p: seen.append(p.get_byte(0)), exclusive)
+    central._destuffer.add_bytes(Frame.encode(bytes([0x81, 1, 0x02])))
+
+    assert seen == [0x02]
+    assert len(listener.messages) == (0 if exclusive else 1)
+
+
+@pytest.mark.unittest
+def test_messages_without_a_handler_are_not_built(monkeypatch):
+    from labbench_comm.devices.lio.messages import EventMessage, StatusMessage
+
+    central = BusCentral(LoopbackConnection())
+    central.add_message(EventMessage())
+    central.add_message(StatusMessage())
+    central.message_listener = RecordingListener()
+
+    built = []
+    original = StatusMessage.__init__
+    monkeypatch.setattr(
+        StatusMessage, "__init__",
+        lambda self, packet=None: built.append(packet) or original(self, packet),
+    )
+    central._destuffer.add_bytes(Frame.encode(bytes([0x80, 7]) + bytes(7)))
+    assert built == []
+
+    # Handlers are resolved again for a new listener
+    class StatusListener:
+        def __init__(self) -> None:
+            self.statuses = []
+
+        def on_status_message(self, message) -> None:
+            self.statuses.append(message)
+
+    listener = StatusListener()
+    central.message_listener = listener
+    central._destuffer.add_bytes(Frame.encode(bytes([0x80, 7]) + bytes(7)))
+    assert len(built) == 1
+    assert listener.statuses[0].code == 0x80
+
+
+class ManualConnection(LoopbackConnection):
+    """
+    Loopback connection that records requests and replies on demand.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(self._record)
+        self.requests: list[Packet] = []
+
+    def _record(self, request: Packet):
+        self.requests.append(request)
+        return None
+
+    def reply(self, packet: Packet) -> None:
+        self.destuffer.add_bytes(Frame.encode(packet.to_bytes()))
+
+
+class Echo(DeviceFunction):
+    def __init__(self, code: int) -> None:
+        self._code = code
+        super().__init__(request_length=0, response_length=1)
+
+    @property
+    def code(self) -> int:
+        return self._code
+
+    def create_dispatcher(self):
+        raise NotImplementedError
+
+    def dispatch(self, listener):
+        raise NotImplementedError
+
+    @property
+    def value(self) -> int:
+        return self.response.get_byte(0)
+
+
+def _reply(code: int, value: int) -> Packet:
+    packet = Packet(code, 1)
+    packet.insert_byte(0, value)
+    return packet
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_pipelined_requests_are_matched_in_order():
+    connection = ManualConnection()
+    central = BusCentral(connection, max_in_flight=3)
+    await central.open()
+
+    functions = [Echo(0x10) for _ in range(4)]
+    futures = [await central.submit(f) for f in functions[:3]]
+    fourth = asyncio.create_task(central.submit(functions[3]))
+    await asyncio.sleep(0)
+
+    assert len(connection.requests) == 3
+    assert central.in_flight == 3
+    assert not fourth.done()
+
+    connection.reply(_reply(0x10, 1))
+    futures.append(await fourth)
+    connection.reply(_reply(0x10, 2))
+    connection.reply(_reply(0x10, 3))
+    connection.reply(_reply(0x10, 4))
+
+    assert await asyncio.gather(*futures) == functions
+    assert [f.value for f in functions] == [1, 2, 3, 4]
+    assert central.in_flight == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_error_packets_and_timeouts_are_attributed():
+    connection = ManualConnection()
+    central = BusCentral(connection, max_in_flight=3)
+    await central.open()
+
+    nacked = await central.submit(Echo(0x10))
+    lost = await central.submit(Echo(0x11), timeout_ms=10)
+    answered = Echo(0x12)
+    pending = await central.submit(answered)
+
+    connection.reply(Packet(0x00, 1))
+    with pytest.raises(FunctionNotAcknowledgedError):
+        await nacked
+    with pytest.raises(PeripheralNotRespondingError):
+        await lost
+
+    # A late answer to the timed-out request is consumed by it rather
+    # than given to the next pending request
+    connection.reply(_reply(0x11, 9))
+    connection.reply(_reply(0x12, 7))
+    await pending
+    assert answered.value == 7
+    assert central.in_flight == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_match_by_code_accepts_out_of_order_responses():
+    connection = ManualConnection()
+    central = BusCentral(connection, max_in_flight=2, match_by_code=True)
+    await central.open()
+
+    first, second = Echo(0x10), Echo(0x11)
+    futures = [await central.submit(first), await central.submit(second)]
+
+    connection.reply(_reply(0x11, 2))
+    connection.reply(_reply(0x10, 1))
+    await asyncio.gather(*futures)
+
+    assert (first.value, second.value) == (1, 2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_lock_step_is_the_default():
+    connection = ManualConnection()
+    central = BusCentral(connection)
+    await central.open()
+
+    first = asyncio.create_task(central.execute(Echo(0x10)))
+    second = asyncio.create_task(central.execute(Echo(0x10)))
+    await asyncio.sleep(0)
+    assert len(connection.requests) == 1
+
+    connection.reply(_reply(0x10, 1))
+    await first
+    await asyncio.sleep(0)
+    assert len(connection.requests) == 2
+
+    connection.reply(_reply(0x10, 2))
+    await second
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_execute_many_writes_once_and_reports_per_function():
+    connection = ManualConnection()
+    central = BusCentral(connection)
+    await central.open()
+
+    functions = [Echo(0x10), Echo(0x11), Echo(0x12)]
+    batch = asyncio.create_task(central.execute_many(functions))
+    await asyncio.sleep(0)
+
+    assert len(connection.writes) == 1
+    assert [r.code for r in connection.requests] == [0x10, 0x11, 0x12]
+
+    # Other requests wait for the batch, even in lock-step mode
+    other = asyncio.create_task(central.execute(Echo(0x13)))
+    await asyncio.sleep(0)
+    assert len(connection.requests) == 3
+
+    connection.reply(_reply(0x10, 1))
+    connection.reply(Packet(0x00, 1))
+    connection.reply(_reply(0x12, 3))
+    results = await batch
+
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], FunctionNotAcknowledgedError)
+    assert (functions[0].value, functions[2].value) == (1, 3)
+
+    await asyncio.sleep(0)
+    assert connection.requests[-1].code == 0x13
+    connection.reply(_reply(0x13, 4))
+    await other
+    assert central.in_flight == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_execute_many_times_out_unanswered_requests():
+    connection = ManualConnection()
+    central = BusCentral(connection, max_in_flight=2)
+    await central.open()
+
+    answered, lost = Echo(0x10), Echo(0x11)
+    batch = asyncio.create_task(central.execute_many([answered, lost], timeout_ms=10))
+    await asyncio.sleep(0)
+    connection.reply(_reply(0x10, 5))
+
+    results = await batch
+    assert results[0] is None
+    assert isinstance(results[1], PeripheralNotRespondingError)
+    assert central.in_flight == 0
+
+    # The window is free again
+    future = await central.submit(Echo(0x12))
+    connection.reply(_reply(0x12, 6))
+    await future
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_timeout_policy_scales_with_frame_length_and_learns():
+    connection = ManualConnection()
+    connection.baudrate = 9600
+    central = BusCentral(connection, timeout_policy=TimeoutPolicy(min_samples=1))
+    central.timeout_ms = 20
+    await central.open()
+
+    class Upload(Echo):
+        def __init__(self) -> None:
+            DeviceFunction.__init__(self, request_length=960, response_length=0)
+
+        @property
+        def code(self) -> int:
+            return 0x20
+
+    # About a second on the wire: the default 20 ms would expire long before
+    upload = await central.submit(Upload())
+    await asyncio.sleep(0.05)
+    assert not upload.done()
+    connection.reply(Packet(0x20, 0))
+    await upload
+
+    # A small function that has been answered quickly before gets a
+    # timeout close to its wire time
+    answered = await central.submit(Echo(0x10))
+    connection.reply(_reply(0x10, 1))
+    await answered
+    lost = await central.submit(Echo(0x10))
+    start = asyncio.get_running_loop().time()
+    with pytest.raises(PeripheralNotRespondingError):
+        await lost
+    assert asyncio.get_running_loop().time() - start < 0.5
+
+
+class StationDevice(Device):
+    def __init__(self, central: BusCentral, address: int) -> None:
+        super().__init__(central)
+        self.current_address = address
+        self.messages = []
+
+    def is_compatible(self, function) -> bool:
+        return True
+
+    def get_peripheral_error_string(self, error_code: int) -> str:
+        return f"station {self.current_address} error {error_code}"
+
+    def on_printf_message(self, message) -> None:
+        self.messages.append(message)
+
+
+def _addressed(packet: Packet, address: int) -> Packet:
+    packet.address = address
+    return packet
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_shared_bus_routes_by_address_and_schedules_fairly():
+    connection = ManualConnection()
+    central = BusCentral(connection)
+    first, second = StationDevice(central, 1), StationDevice(central, 2)
+    assert central.shared
+    await central.open()
+
+    busy = [asyncio.create_task(central.execute(Echo(0x10), 1)) for _ in range(3)]
+    await asyncio.sleep(0)
+    other = asyncio.create_task(central.execute(Echo(0x11), 2))
+    await asyncio.sleep(0)
+
+    # The second station is served before the first one's backlog
+    for value in (1, 2):
+        connection.reply(_addressed(_reply(0x10, value), 1))
+        await asyncio.sleep(0)
+    assert [(r.address, r.code) for r in connection.requests] == [
+        (1, 0x10), (1, 0x10), (2, 0x11),
+    ]
+
+    connection.reply(_addressed(_reply(0x00, 0x80), 2))
+    with pytest.raises(FunctionNotAcknowledgedError, match="station 2"):
+        await other
+
+    await asyncio.sleep(0)
+    connection.reply(_addressed(_reply(0x10, 3), 1))
+    await asyncio.gather(*busy)
+
+    printf = Packet(0xFF, 0)
+    connection.reply(_addressed(printf, 2))
+    assert (len(first.messages), len(second.messages)) == (0, 1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_shared_bus_closes_when_the_last_device_closes():
+    connection = LoopbackConnection(ping_responder)
+    central = BusCentral(connection)
+    first, second = StationDevice(central, 1), StationDevice(central, 2)
+    await first.open()
+    await second.open()
+
+    await first.close()
+    assert central.is_open
+    assert central.devices == (second,)
+    assert not central.shared
+
+    await second.close()
+    assert not connection.is_open
+    assert central.devices == ()
+
+    # Reopening attaches the device again
+    await first.open()
+    assert central.devices == (first,)
+    assert await first.ping() == 42
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_critical_functions_skip_the_queue():
+    connection = ManualConnection()
+    central = BusCentral(connection)
+    await central.open()
+
+    class Stop(Echo):
+        PRIORITY = Priority.CRITICAL
+
+    upload = asyncio.create_task(central.execute(Echo(0x10)))
+    await asyncio.sleep(0)
+    queued = [
+        asyncio.create_task(central.execute(Echo(0x11), priority=Priority.BACKGROUND)),
+        asyncio.create_task(central.execute(Echo(0x12))),
+        asyncio.create_task(central.execute(Stop(0x13))),
+    ]
+    await asyncio.sleep(0)
+
+    for code in (0x10, 0x13, 0x12, 0x11):
+        assert connection.requests[-1].code == code
+        connection.reply(_reply(code, 0))
+        await asyncio.sleep(0)
+    await asyncio.gather(upload, *queued)
+
+    assert central.queue_wait[Priority.CRITICAL].count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_critical_functions_do_not_wait_for_a_batch():
+    connection = ManualConnection()
+    central = BusCentral(connection)
+    central.timeout_ms = 100
+    await central.open()
+
+    class Stop(Echo):
+        PRIORITY = Priority.CRITICAL
+
+    def answer(request: Packet) -> None:
+        connection.reply(_reply(request.code, 0))
+
+    functions = [Echo(0x10) for _ in range(200)]
+    batch = asyncio.create_task(central.execute_many(functions))
+    await asyncio.sleep(0)
+    assert len(connection.requests) == central.batch_window
+    normal = asyncio.create_task(central.execute(Echo(0x40)))
+    stop = asyncio.create_task(central.execute(Stop(0x30)))
+    await asyncio.sleep(0)
+
+    # The stop is written after the first batch response, behind at most
+    # batch_window - 1 batch requests, however large the batch
+    answer(connection.requests[0])
+    await asyncio.sleep(0)
+    codes = [r.code for r in connection.requests]
+    assert codes.index(0x30) == central.batch_window
+
+    # Its timeout only starts once the batch requests ahead of it have
+    # been answered, each within its own timeout
+    for request in connection.requests[1 : central.batch_window]:
+        await asyncio.sleep(0.03)
+        answer(request)
+    answer(connection.requests[central.batch_window])
+    await stop
+
+    # The rest of the batch follows, written as responses come in
+    answered = central.batch_window + 1
+    while answered < len(connection.requests):
+        answer(connection.requests[answered])
+        answered += 1
+        await asyncio.sleep(0)
+    assert await batch == [None] * 200
+    assert len(connection.writes) < 200
+
+    # Normal requests still wait for the whole batch
+    await asyncio.sleep(0)
+    assert connection.requests[-1].code == 0x40
+    answer(connection.requests[-1])
+    await normal
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_bus_metrics_count_latency_errors_and_bytes():
+    connection = ManualConnection()
+    central = BusCentral(connection, max_in_flight=3)
+    assert central.metrics is None
+    metrics = central.enable_metrics()
+    await central.open()
+
+    answered = await central.submit(Echo(0x10))
+    nacked = await central.submit(Echo(0x11))
+    lost = await central.submit(Echo(0x12), timeout_ms=10)
+
+    connection.reply(_reply(0x10, 0xFF))
+    await answered
+    connection.reply(Packet(0x00, 1))
+    with pytest.raises(FunctionNotAcknowledgedError):
+        await nacked
+    with pytest.raises(PeripheralNotRespondingError):
+        await lost
+
+    snapshot = metrics.snapshot()
+    functions = snapshot["functions"]
+    assert functions[0x10]["completed"] == 1
+    assert 0 < functions[0x10]["latency_ns"]["p99"] < 10**9
+    assert functions[0x11]["nacks"] == {"Error code 0x00": 1}
+    assert functions[0x12]["timeouts"] == 1
+
+    link = snapshot["link"]
+    assert link["frames_sent"] == {0x10: 1, 0x11: 1, 0x12: 1}
+    assert link["frames_received"] == {0x00: 1, 0x10: 1}
+    assert link["bytes_sent"] == 6
+    assert link["wire_bytes_sent"] == 6 + 3 * 4
+    # The 0xFF payload byte is stuffed on the wire
+    assert link["bytes_received"] == 6
+    assert link["wire_bytes_received"] == 6 + 2 * 4 + 1
+
+    metrics.reset()
+    assert metrics.snapshot()["link"]["wire_bytes_received"] == 0
+
+    central.disable_metrics()
+    assert central.metrics is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_device_retries_are_counted():
+    connection = ManualConnection()
+    central = BusCentral(connection)
+    central.timeout_ms = 10
+    device = StationDevice(central, 0)
+    device.retries = 3
+    metrics = central.enable_metrics()
+    await central.open()
+
+    with pytest.raises(PeripheralNotRespondingError):
+        await device.execute(Echo(0x10))
+
+    assert metrics.function(0x10).retries == 2
+    assert metrics.function(0x10).timeouts == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_device_retries_a_response_slower_than_the_learned_allowance():
+    connection = ManualConnection()
+    central = BusCentral(
+        connection, timeout_policy=TimeoutPolicy(minimum_fraction=0.25)
+    )
+    device = StationDevice(central, 0)
+    device.retries = 2
+    await device.open()
+    loop = asyncio.get_running_loop()
+
+    def answer(delay: float) -> None:
+        loop.call_later(delay, connection.reply, _reply(0x10, len(connection.requests)))
+
+    # Fast answers teach the policy a small allowance for the code
+    for _ in range(3):
+        task = asyncio.create_task(device.execute(Echo(0x10)))
+        await asyncio.sleep(0)
+        answer(0.0)
+        await task
+    assert central.timeout_policy.allowance_ms(0x10, central.timeout_ms) < 200
+
+    # One slow answer times out the first attempt; the second, with a
+    # longer timeout, receives it
+    task = asyncio.create_task(device.execute(Echo(0x10)))
+    await asyncio.sleep(0)
+    answer(0.2)
+    await task
+
+    assert len(connection.requests) == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_device_does_not_retry_nacked_functions():
+    connection = LoopbackConnection(lambda request: [Packet(0x00, 1)])
+    central = BusCentral(connection)
+    device = StationDevice(central, 0)
+    device.retries = 3
+    assert central.timeout_policy is None
+    await device.open()
+
+    with pytest.raises(FunctionNotAcknowledgedError):
+        await device.execute(Echo(0x10))
+    results = await device.execute_many([Echo(0x11)])
+
+    assert isinstance(results[0], FunctionNotAcknowledgedError)
+    assert len(connection.writes) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_metrics_summary_is_logged_periodically():
+    class Records(logging.Handler):
+        def __init__(self) -> None:
+            super().__init__(logging.INFO)
+            self.lines = []
+
+        def emit(self, record) -> None:
+            self.lines.append(record.getMessage())
+
+    logger = logging.getLogger("labbench_comm.protocols.bus_central")
+    handler = Records()
+    logger.addHandler(handler)
+    level = logger.level
+    logger.setLevel(logging.INFO)
+    try:
+        central = BusCentral(ManualConnection())
+        central.enable_metrics(log_interval_s=0.01)
+        await central.open()
+        await asyncio.sleep(0.05)
+        await central.close()
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(level)
+
+    assert handler.lines[0].startswith("Bus metrics: 0 requests")
+    assert central._metrics_task is None
@@ -80,3 +80,89 @@ def test_invalid_sequence_is_discarded():
     destuffer.add_bytes(valid)
 
     assert received == [b"\xAA"]
+
+@pytest.mark.unittest
+def test_add_bytes_matches_byte_wise_state_machine():
+    import random
+
+    rng = random.Random(1234)
+    alphabet = [0x00, 0x01, 0x7F, Frame.DLE, Frame.STX, Frame.ETX]
+
+    # Valid frames interleaved with noise biased towards framing bytes
+    stream = bytearray()
+    for _ in range(200):
+        payload = bytes(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        stream += payload.replace(bytes([Frame.DLE]), bytes([Frame.DLE, Frame.DLE]))
+        stream += bytes([Frame.DLE, Frame.STX]) + payload.replace(
+            bytes([Frame.DLE]), bytes([Frame.DLE, Frame.DLE])
+        ) + bytes([Frame.DLE, Frame.ETX])
+        stream += bytes(rng.choice(alphabet) for _ in range(rng.randint(0, 4)))
+
+    expected = []
+    reference = Destuffer()
+    reference.on_receive(lambda _, p: expected.append(p))
+    for b in stream:
+        reference.add_byte(b)
+
+    for _ in range(20):
+        received = []
+        destuffer = Destuffer()
+        destuffer.on_receive(lambda _, p: received.append(p))
+
+        pos = 0
+        while pos < len(stream):
+            size = rng.randint(1, 64)
+            destuffer.add_bytes(bytes(stream[pos : pos + size]))
+            pos += size
+
+        assert received == expected
+
+    assert len(expected) >= 200
+
+
+def _framed(payload: bytes) -> bytes:
+    return (
+        bytes([Frame.DLE, Frame.STX])
+        + payload.replace(bytes([Frame.DLE]), bytes([Frame.DLE, Frame.DLE]))
+        + bytes([Frame.DLE, Frame.ETX])
+    )
+
+
+@pytest.mark.unittest
+def test_zero_copy_delivers_views_and_reuses_arena():
+    destuffer = Destuffer(zero_copy=True)
+    seen = []
+
+    def on_receive(_, frame):
+        assert isinstance(frame, memoryview)
+        seen.append((bytes(frame), id(frame.obj)))
+
+    destuffer.on_receive(on_receive)
+    destuffer.add_bytes(_framed(b"\x01\x02\x03") + _framed(b"\x04\xFF\x05"))
+
+    assert [payload for payload, _ in seen] == [b"\x01\x02\x03", b"\x04\xFF\x05"]
+    # Nobody kept the first frame, so the same arena backs the second one
+    assert seen[0][1] == seen[1][1]
+
+
+@pytest.mark.unittest
+def test_zero_copy_frame_kept_by_consumer_stays_valid():
+    destuffer = Destuffer(zero_copy=True)
+    kept = []
+
+    destuffer.on_receive(lambda _, frame: kept.append(frame[0:]))
+    destuffer.add_bytes(_framed(b"\xAA\xBB") + _framed(b"\xCC\xDD"))
+
+    assert [bytes(frame) for frame in kept] == [b"\xAA\xBB", b"\xCC\xDD"]
+
+
+@pytest.mark.unittest
+def test_zero_copy_frame_object_kept_by_consumer_stays_valid():
+    destuffer = Destuffer(zero_copy=True)
+    kept = []
+
+    destuffer.on_receive(lambda _, frame: kept.append(frame))
+    destuffer.add_bytes(_framed(b"\xAA\xBB") + _framed(b"\xCC\xDD"))
+
+    assert [bytes(frame) for frame in kept] == [b"\xAA\xBB", b"\xCC\xDD"]
+    assert kept[0].obj is not kept[1].obj
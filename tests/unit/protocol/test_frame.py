@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from labbench_comm.protocols.frame import Frame, FrameEncoder
+from labbench_comm.protocols.packet import ChecksumAlgorithmType, Packet
+
+
+def _random_packet(rng: random.Random) -> Packet:
+    length = rng.choice([0, 1, 5, 22, 127, 128, 255, 300, 2006])
+    checksum = rng.choice(list(ChecksumAlgorithmType))
+    pkt = Packet(rng.choice([0x01, 0x15, 0x80, 0xFF]), length, checksum)
+    pkt.address = rng.choice([0, 0, 1, 0xFF])
+    for i in range(length):
+        pkt.insert_byte(i, rng.choice([0x00, 0x42, Frame.DLE, Frame.STX, Frame.ETX]))
+    return pkt
+
+
+@pytest.mark.unittest
+def test_frame_encode_stuffs_dle():
+    assert Frame.encode(b"\x01\xFF\x02") == bytes(
+        [Frame.DLE, Frame.STX, 0x01, Frame.DLE, Frame.DLE, 0x02, Frame.DLE, Frame.ETX]
+    )
+
+
+@pytest.mark.unittest
+def test_frame_encoder_matches_two_pass_encoding():
+    rng = random.Random(3)
+    encoder = FrameEncoder(capacity=16)
+
+    for _ in range(300):
+        pkt = _random_packet(rng)
+
+        frame = encoder.encode(pkt)
+        encoded = bytes(frame)
+        frame.release()
+        checksum = pkt.checksum
+
+        assert encoded == Frame.encode(pkt.to_bytes())
+        assert checksum == pkt.checksum
+
+
+@pytest.mark.unittest
+def test_frame_encoder_does_not_overwrite_exported_frame():
+    encoder = FrameEncoder()
+    first = Packet(0x02, 1)
+    first.insert_byte(0, 0xAA)
+    second = Packet(0x02, 1)
+    second.insert_byte(0, 0xBB)
+
+    kept = encoder.encode(first)
+    encoder.encode(second)
+
+    assert bytes(kept) == Frame.encode(first.to_bytes())
+
+
+@pytest.mark.unittest
+def test_frame_encoder_does_not_grow_for_kept_frames():
+    encoder = FrameEncoder(capacity=16)
+    packet = Packet(0x02, 1)
+    packet.insert_byte(0, 0xAA)
+
+    kept = [encoder.encode(packet) for _ in range(10)]
+
+    assert len(encoder._buffer) == 16
+    assert all(bytes(frame) == Frame.encode(packet.to_bytes()) for frame in kept)
+
+
+@pytest.mark.unittest
+def test_frame_encoder_encode_many_concatenates_frames():
+    rng = random.Random(5)
+    encoder = FrameEncoder(capacity=16)
+    packets = [_random_packet(rng) for _ in range(20)]
+
+    frames = encoder.encode_many(packets)
+
+    assert bytes(frames) == b"".join(Frame.encode(p.to_bytes()) for p in packets)
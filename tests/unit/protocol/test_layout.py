@@ -0,0 +1,123 @@
+import random
+
+import pytest
+
+from labbench_comm.devices.cpar.codec import CPARplusCodec
+from labbench_comm.devices.cpar.definitions import (
+    DeviceChannelID,
+    DeviceState,
+    StopCondition,
+    StopCriterion,
+)
+from labbench_comm.devices.cpar.functions import StartStimulation
+from labbench_comm.devices.cpar.messages import StatusMessage
+from labbench_comm.devices.lio.definitions import ResponsePort
+from labbench_comm.devices.lio.messages import ButtonMessage, SignalMessage
+from labbench_comm.protocols.layout import Field, Layout
+from labbench_comm.protocols.packet import Packet
+
+
+def _status_packet(rng: random.Random) -> Packet:
+    packet = Packet(0x80, 22)
+    for i in range(22):
+        packet.insert_byte(i, rng.randrange(256))
+    packet.insert_byte(0, rng.randrange(4))
+    packet.insert_byte(4, 0)
+    return packet
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("reverse", [False, True])
+def test_cpar_status_record_matches_field_reads(reverse):
+    rng = random.Random(7)
+    for _ in range(50):
+        packet = _status_packet(rng)
+        packet.reverse_endianity = reverse
+
+        decoded = StatusMessage(packet)
+        decoded.on_received()
+        lazy = StatusMessage(packet)
+
+        assert decoded.record is not None
+        assert lazy._record is None
+        for name in StatusMessage.LAYOUT.names:
+            assert getattr(decoded, name) == getattr(lazy, name)
+        assert lazy._record == decoded.record
+
+        assert decoded.actual_pressure_01 == CPARplusCodec.binary_to_pressure(
+            packet.get_uint16(9)
+        )
+        assert decoded.supply_pressure == CPARplusCodec.binary_to_pressure(
+            packet.get_uint16(7), CPARplusCodec.PressureType.SUPPLY_PRESSURE
+        )
+        assert decoded.vas_score == CPARplusCodec.binary_to_score(packet.get_byte(5))
+        assert decoded.system_state is DeviceState(packet.get_byte(0) + 1)
+        assert decoded.vas_connected == bool(packet.get_byte(1) & 0x01)
+
+
+@pytest.mark.unittest
+def test_setters_write_packet_and_invalidate_record():
+    message = StatusMessage()
+    message.on_received()
+    assert message.target_pressure_02_binary == 0
+
+    message.target_pressure_02_binary = 4095
+    message.stop_condition = StopCondition(0)
+    message.stop_pressed = True
+
+    assert message.packet.get_uint16(15) == 4095
+    assert message.target_pressure_02 == 100.0
+    assert message.packet.get_byte(21) == 1
+    assert message.record.stop_pressed is True
+
+
+@pytest.mark.unittest
+def test_enum_errors_only_affect_the_property_read():
+    packet = Packet(0x90, 21)
+    packet.insert_byte(0, 0xEE)
+    packet.insert_uint16(3, 7)
+    message = SignalMessage(packet)
+    message.on_received()
+
+    assert message.signal == 7
+    with pytest.raises(ValueError):
+        message.port
+
+
+@pytest.mark.unittest
+def test_hidden_fields_feed_derived_properties():
+    packet = Packet(0x91, 10)
+    packet.insert_byte(0, ResponsePort.RESPONSE_PORT01)
+    packet.insert_byte(5, 4)
+    packet.insert_uint32(6, 1000)
+    message = ButtonMessage(packet)
+    message.on_received()
+
+    assert message.record._time_divisor == 4
+    assert message.time == 250
+    assert "ButtonMessageRecord(" in repr(message.record)
+
+
+@pytest.mark.unittest
+def test_function_request_layout_reads_current_packet():
+    function = StartStimulation()
+    assert function.criterion is StopCriterion.STOP_CRITERION_ON_BUTTON_VAS
+
+    function.outlet01 = DeviceChannelID.CH01
+    function.external_trigger = True
+
+    assert function.request.get_byte(1) == int(DeviceChannelID.CH01)
+    assert function.request.get_byte(4) == 1
+    assert function.outlet01 is DeviceChannelID.CH01
+
+
+@pytest.mark.unittest
+def test_layout_compiles_gaps_and_rejects_overlaps():
+    layout = Layout(Field("a", 1), Field("b", 4, "int16"), size=8)
+    assert layout.format == "1xB2xh2x"
+    assert layout.size == 8
+
+    with pytest.raises(ValueError):
+        Layout(Field("a", 0, "uint16"), Field("b", 1))
+    with pytest.raises(ValueError):
+        Field("a", 0, divisor=2.0, settable=True)
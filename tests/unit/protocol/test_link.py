@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from labbench_comm.devices.cpar.functions.set_waveform_program import SetWaveformProgram
+from labbench_comm.devices.cpar.waveform import WaveformInstruction
+from labbench_comm.devices.lio.functions.set_voltage import SetVoltage
+from labbench_comm.protocols.bus_central import BusCentral
+from labbench_comm.protocols.functions.ping import Ping
+from labbench_comm.protocols.link import (
+    LinkBudget,
+    LinkDirection,
+    LinkMonitor,
+    frame_length,
+)
+from labbench_comm.protocols.packet import Packet
+from labbench_comm.protocols.scheduler import Priority
+
+
+@pytest.mark.unittest
+def test_monitor_rates_cover_the_sliding_window():
+    monitor = LinkMonitor(window_s=1.0, buckets=10)
+    monitor.add_sent(100, now=10.05)
+    monitor.add_received(300, now=10.55)
+
+    assert monitor.rates(now=10.95) == (100.0, 300.0)
+    # The first slice has left the window, the second has not
+    assert monitor.rates(now=11.05) == (0.0, 300.0)
+    assert monitor.rates(now=12.0) == (0.0, 0.0)
+    assert (monitor.bytes_sent, monitor.bytes_received) == (100, 300)
+
+
+@pytest.mark.unittest
+def test_frame_length_counts_framing_and_stuffing():
+    packet = Packet(0x10, 4)
+    packet.insert_uint32(0, 0xFF00FF00)
+
+    # DLE STX, code, length, 4 payload bytes with two stuffed, DLE ETX
+    assert frame_length(packet) == 2 + 2 + 4 + 2 + 2
+    # Unknown received payloads are assumed random
+    assert frame_length(packet, LinkDirection.RECEIVED) == 2 + 2 + 4 + 2 + 4 / 256
+
+
+@pytest.mark.unittest
+def test_budget_sums_loads_per_direction():
+    budget = LinkBudget(baudrate=38400, threshold=0.5)
+    assert budget.capacity_bytes_per_s == 3840.0
+
+    status = Packet(0x81, 22)
+
+    class Status:
+        packet = status
+
+    budget.add_message("status", Status(), period_s=0.05)
+    budget.add_requests("ping", Ping(), interval_s=1.0)
+
+    sent, received = budget.utilization()
+    assert sent == pytest.approx(6 / 3840)
+    assert received == pytest.approx((20 * (28 + 22 / 256) + 10 + 4 / 256) / 3840)
+    assert budget.fits()
+
+    budget.add("upload", sent_bytes_per_s=2000)
+    assert not budget.fits()
+    assert "does not fit" in budget.report()
+
+
+@pytest.mark.unittest
+def test_budget_leaves_functions_unchanged():
+    class Counter(SetVoltage):
+        def on_send(self) -> None:
+            self.sent = getattr(self, "sent", 0) + 1
+            self.request.insert_uint32(0, 0xFFFFFFFF)
+
+    program = SetWaveformProgram()
+    program.instructions.append(WaveformInstruction.step(10.0, 1.0))
+    request = program.request
+    counter = Counter()
+
+    budget = LinkBudget(baudrate=38400)
+    budget.add_transfer("program", [program], within_s=1.0)
+    budget.add_requests("counter", counter, interval_s=1.0)
+
+    # The program's request is only built in on_send()
+    assert budget.items[0].sent_bytes_per_s > frame_length(request)
+    assert program.request is request and request.length == 0
+    assert not hasattr(counter, "sent")
+    assert counter.request.get_uint32(0) == 0
+
+
+class MeasuredConnection:
+    def __init__(self) -> None:
+        self.link = LinkMonitor()
+        self.baudrate = 10000
+        self.writes = []
+
+    def attach_destuffer(self, destuffer) -> None:
+        pass
+
+    @property
+    def is_open(self) -> bool:
+        return True
+
+    async def write_bytes(self, data) -> None:
+        self.writes.append(bytes(data))
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_admission_control_defers_background_requests():
+    connection = MeasuredConnection()
+    central = BusCentral(connection)
+    central.admission_threshold = 0.5
+    central.admission_max_defer_s = 0.05
+    central.ADMISSION_POLL_S = 0.01
+
+    # 900 of 1000 bytes/s
+    connection.link.add_received(900)
+    assert central.link_utilization.received == pytest.approx(0.9)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await central.submit(Ping(), timeout_ms=1000)
+    assert loop.time() - start < 0.01
+    central._fail_pending(RuntimeError())
+
+    start = loop.time()
+    await central.submit(Ping(), timeout_ms=1000, priority=Priority.BACKGROUND)
+    assert loop.time() - start >= 0.05
+    assert central.admission_wait.count == 1
+    assert central.admission_wait.max_ms >= 50.0
+    central._fail_pending(RuntimeError())
@@ -0,0 +1,37 @@
+import pytest
+
+from labbench_comm.protocols.metrics import LatencyHistogram, packet_length
+from labbench_comm.protocols.packet import ChecksumAlgorithmType, Packet
+
+
+@pytest.mark.unittest
+def test_histogram_percentiles_are_within_bucket_resolution():
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(value * 1000)
+
+    assert histogram.count == 1000
+    assert (histogram.min_ns, histogram.max_ns) == (1000, 1_000_000)
+    for fraction in (0.5, 0.95, 0.99):
+        exact = fraction * 1_000_000
+        assert exact <= histogram.percentile(fraction) <= exact * 1.07
+    assert histogram.percentile(1.0) == 1_000_000
+
+    small = LatencyHistogram()
+    for value in (3, 7, 7, 30):
+        small.record(value)
+    assert [small.percentile(f) for f in (0.25, 0.5, 1.0)] == [3, 7, 30]
+
+    small.merge(histogram)
+    assert small.count == 1004
+    assert small.min_ns == 3
+
+
+@pytest.mark.unittest
+def test_packet_length_counts_the_unstuffed_encoding():
+    plain = Packet(0x10, 3)
+    checked = Packet(0x10, 300, ChecksumAlgorithmType.CRC8CCITT)
+    checked.address = 2
+
+    for packet in (plain, checked):
+        assert packet_length(packet) == len(packet.to_bytes())
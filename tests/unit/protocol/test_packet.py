@@ -61,6 +61,18 @@ def test_insert_and_get_string():
     assert pkt.get_string(0, 16) == "A" * 16
 
 
+@pytest.mark.unittest
+def test_insert_and_get_bytes():
+    pkt = Packet(code=0x01, length=8)
+
+    pkt.insert_bytes(2, b"\x01\x02\x03")
+    assert pkt.get_bytes(0, 8) == b"\x00\x00\x01\x02\x03\x00\x00\x00"
+
+    with pytest.raises(IndexError):
+        pkt.insert_bytes(6, b"\x01\x02\x03")
+    assert pkt.length == 8
+
+
 # ----------------------------------------------------------------------
 # Endian reversal
 # ----------------------------------------------------------------------
@@ -74,6 +86,23 @@ def test_reverse_endianity():
     assert pkt.get_uint32(0) == 0x11223344
 
 
+@pytest.mark.unittest
+def test_reverse_endianity_byte_order():
+    pkt = Packet(code=0x01, length=8)
+    pkt.reverse_endianity = True
+
+    pkt.insert_uint32(0, 0x11223344)
+    pkt.insert_int16(4, -2)
+    pkt.insert_uint16(6, 0xA1B2)
+
+    assert pkt.to_bytes()[2:] == b"\x11\x22\x33\x44\xFF\xFE\xA1\xB2"
+    assert pkt.get_int16(4) == -2
+
+    pkt.reverse_endianity = False
+    assert pkt.get_uint32(0) == 0x44332211
+    assert pkt.get_uint16(6) == 0xB2A1
+
+
 # ----------------------------------------------------------------------
 # Standard frame round-trip
 # ----------------------------------------------------------------------
@@ -200,3 +229,26 @@ def test_packet_format_error_on_short_frame():
 def test_packet_format_error_on_none():
     with pytest.raises(PacketFormatError):
         Packet.from_frame(None)
+
+
+# ----------------------------------------------------------------------
+# Zero-copy frames
+# ----------------------------------------------------------------------
+@pytest.mark.unittest
+def test_from_frame_wraps_memoryview_without_copy():
+    pkt = Packet(code=0x90, length=4, checksum=ChecksumAlgorithmType.CRC8CCITT)
+    pkt.insert_uint32(0, 0x01020304)
+
+    arena = bytearray(pkt.to_bytes())
+    parsed = Packet.from_frame(memoryview(arena))
+
+    assert parsed.is_view
+    assert parsed.get_uint32(0) == 0x01020304
+
+    arena[3] = 0xFF  # payload byte 0 lives in the arena
+    assert parsed.get_byte(0) == 0xFF
+
+    parsed.detach()
+    arena[3] = 0x00
+    assert not parsed.is_view
+    assert parsed.get_byte(0) == 0xFF
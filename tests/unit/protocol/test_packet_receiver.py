@@ -0,0 +1,76 @@
+import pytest
+
+from labbench_comm.protocols.frame import Frame
+from labbench_comm.protocols.packet import ChecksumAlgorithmType, Packet
+from labbench_comm.protocols.packet_receiver import PacketReceiver
+
+
+def _receiver(zero_copy: bool = False):
+    receiver = PacketReceiver(zero_copy=zero_copy)
+    packets = []
+    receiver.on_packet(packets.append)
+    return receiver, packets
+
+
+def _crc_packet() -> Packet:
+    pkt = Packet(0x90, 6, ChecksumAlgorithmType.CRC8CCITT)
+    pkt.address = 3
+    pkt.insert_uint32(0, 0xFFEEDDCC)
+    pkt.insert_uint16(4, 0x1234)
+    return pkt
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("zero_copy", [False, True])
+def test_valid_packets_are_delivered(zero_copy):
+    receiver, packets = _receiver(zero_copy)
+    kept = []
+    receiver.on_packet(lambda p: kept.append(p.get_byte(0)))
+
+    standard = Packet(0x02, 2)
+    standard.insert_uint16(0, 0xBEEF)
+
+    receiver.add_bytes(Frame.encode(standard.to_bytes()) + Frame.encode(_crc_packet().to_bytes()))
+
+    assert [p.code for p in packets] == [0x02, 0x90]
+    assert packets[1].address == 3
+    assert packets[1].checksum_algorithm == ChecksumAlgorithmType.CRC8CCITT
+    assert packets[1].is_view is zero_copy
+    assert kept == [0xEF, 0xCC]
+    # Packets stay valid after the receiver moved on
+    assert packets[0].get_uint16(0) == 0xBEEF
+    assert packets[1].get_uint16(4) == 0x1234
+    assert receiver.packets_received == 2
+
+
+@pytest.mark.unittest
+def test_checksum_failure_is_counted_not_raised():
+    receiver, packets = _receiver()
+
+    raw = bytearray(_crc_packet().to_bytes())
+    raw[-1] ^= 0x01
+    receiver.add_bytes(Frame.encode(bytes(raw)))
+
+    assert packets == []
+    assert receiver.checksum_errors == 1
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize(
+    "frame",
+    [
+        b"\x01",                        # too short
+        b"\x01\x04\xAA",                # truncated payload
+        b"\x01\x01\xAA\xBB",            # trailing bytes
+        b"\x01\x8C\x01\xAA\x00",        # invalid checksum algorithm
+        b"\x01\x83\x01\xAA",            # invalid length encoding
+        b"\x01\x80",                    # missing length
+    ],
+)
+def test_malformed_frames_are_counted_not_raised(frame):
+    receiver, packets = _receiver()
+
+    receiver.add_bytes(Frame.encode(frame))
+
+    assert packets == []
+    assert receiver.malformed_frames == 1
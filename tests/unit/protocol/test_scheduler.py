@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from labbench_comm.protocols.scheduler import Priority, RequestScheduler
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_slots_are_granted_round_robin_across_keys():
+    scheduler = RequestScheduler(1)
+    await scheduler.acquire(1)
+    order = []
+
+    async def request(key, tag):
+        await scheduler.acquire(key)
+        order.append(tag)
+        scheduler.release()
+
+    tasks = [asyncio.create_task(request(1, f"a{i}")) for i in range(3)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(request(2, "b0")))
+    await asyncio.sleep(0)
+    assert scheduler.waiting == 4
+
+    scheduler.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["a0", "b0", "a1", "a2"]
+    assert scheduler.free == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_cancelled_waiters_do_not_hold_slots():
+    scheduler = RequestScheduler(1)
+    await scheduler.acquire(1)
+
+    waiter = asyncio.create_task(scheduler.acquire(2))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    scheduler.release()
+    assert scheduler.free == 1
+    await asyncio.wait_for(scheduler.acquire(3), 1.0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_higher_priority_lanes_are_served_first():
+    scheduler = RequestScheduler(1)
+    await scheduler.acquire()
+    order = []
+
+    async def request(priority, tag):
+        await scheduler.acquire(priority=priority)
+        order.append(tag)
+        scheduler.release()
+
+    tasks = [
+        asyncio.create_task(request(Priority.BACKGROUND, "ping")),
+        asyncio.create_task(request(Priority.NORMAL, "upload")),
+        asyncio.create_task(request(Priority.CRITICAL, "stop")),
+    ]
+    await asyncio.sleep(0.01)
+    scheduler.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["stop", "upload", "ping"]
+    statistics = scheduler.wait_statistics
+    assert statistics[Priority.CRITICAL].count == 1
+    assert statistics[Priority.NORMAL].count == 2
+    assert statistics[Priority.BACKGROUND].max_ms >= 10.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_grant_hands_a_held_slot_to_critical_waiters_only():
+    scheduler = RequestScheduler(1)
+    await scheduler.acquire()
+
+    normal = asyncio.create_task(scheduler.acquire(priority=Priority.NORMAL))
+    await asyncio.sleep(0)
+    assert not scheduler.grant(Priority.CRITICAL)
+
+    stop = asyncio.create_task(scheduler.acquire(priority=Priority.CRITICAL))
+    await asyncio.sleep(0)
+    assert scheduler.grant(Priority.CRITICAL)
+    await stop
+    assert not normal.done()
+
+    scheduler.release()
+    await normal
+    assert scheduler.free == 0
@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from labbench_comm.protocols.bus_central import BusCentral
+from labbench_comm.protocols.exceptions import SubscriptionClosedError
+from labbench_comm.protocols.frame import Frame
+from labbench_comm.protocols.messages.printf_message import PrintfMessage
+from labbench_comm.protocols.packet import Packet
+from labbench_comm.protocols.subscription import DropPolicy
+
+
+class FlowControlledConnection:
+    def __init__(self) -> None:
+        self.destuffer = None
+        self.paused = False
+        self.pauses = 0
+
+    def attach_destuffer(self, destuffer) -> None:
+        self.destuffer = destuffer
+
+    @property
+    def is_open(self) -> bool:
+        return True
+
+    async def open(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    def pause_reading(self) -> None:
+        self.paused = True
+        self.pauses += 1
+
+    def resume_reading(self) -> None:
+        self.paused = False
+
+    def receive(self, text: str, address: int = 0) -> None:
+        packet = Packet(PrintfMessage.CODE, len(text))
+        packet.insert_string(0, len(text), text)
+        packet.address = address
+        self.destuffer.add_bytes(Frame.encode(packet.to_bytes()))
+
+
+def _central():
+    connection = FlowControlledConnection()
+    return BusCentral(connection), connection
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_drop_oldest_keeps_the_newest_messages():
+    central, connection = _central()
+    subscription = central.subscribe(PrintfMessage, maxsize=2, policy=DropPolicy.DROP_OLDEST)
+
+    for text in ("a", "b", "c"):
+        connection.receive(text)
+
+    assert (subscription.lag, subscription.dropped, subscription.received) == (2, 1, 3)
+    assert (await subscription.get()).debug_message == "b"
+    assert subscription.get_nowait().debug_message == "c"
+    assert not connection.paused
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_latest_conflates_to_one_message():
+    central, connection = _central()
+    subscription = central.subscribe(PrintfMessage, maxsize=8, policy=DropPolicy.LATEST)
+
+    for text in ("a", "b", "c"):
+        connection.receive(text)
+
+    assert subscription.lag == 1
+    assert subscription.dropped == 2
+    assert subscription.get_nowait().debug_message == "c"
+    with pytest.raises(asyncio.QueueEmpty):
+        subscription.get_nowait()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_lossless_pauses_reading_until_drained():
+    central, connection = _central()
+    subscription = central.subscribe(PrintfMessage, maxsize=4)
+
+    for text in "abcde":
+        connection.receive(text)
+
+    assert connection.paused
+    assert subscription.dropped == 0
+    assert subscription.max_lag == 5
+
+    received = [subscription.get_nowait().debug_message for _ in range(2)]
+    assert connection.paused
+    received.append(subscription.get_nowait().debug_message)
+    assert not connection.paused
+    assert connection.pauses == 1
+
+    async with subscription:
+        pass
+    received += [message.debug_message async for message in subscription]
+    assert received == list("abcde")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_closing_the_bus_ends_iteration_and_filters_by_address():
+    central, connection = _central()
+    subscription = central.subscribe(PrintfMessage, address=2)
+
+    async def consume():
+        return [message.debug_message async for message in subscription]
+
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+    connection.receive("x", address=1)
+    connection.receive("y", address=2)
+    await central.close()
+
+    assert await consumer == ["y"]
+    with pytest.raises(SubscriptionClosedError):
+        await subscription.get()
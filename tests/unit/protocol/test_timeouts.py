@@ -0,0 +1,63 @@
+import pytest
+
+from labbench_comm.protocols.timeouts import TimeoutPolicy
+
+
+@pytest.mark.unittest
+def test_wire_time_uses_ten_bits_per_byte():
+    policy = TimeoutPolicy()
+    assert policy.wire_time_ms(5760, 57600) == pytest.approx(1000.0)
+    assert policy.wire_time_ms(5760, None) == 0.0
+
+
+@pytest.mark.unittest
+def test_fallback_is_used_until_enough_samples():
+    policy = TimeoutPolicy(min_samples=3)
+    policy.observe(0x02, 5.0)
+    policy.observe(0x02, 5.0)
+    assert policy.timeout_ms(0x02, 10.0, 500.0) == 510.0
+
+    policy.observe(0x02, 5.0)
+    # Learned allowance is clamped to the minimum
+    assert policy.timeout_ms(0x02, 10.0, 500.0) == 60.0
+    # Other codes are unaffected
+    assert policy.allowance_ms(0x03, 500.0) == 500.0
+
+
+@pytest.mark.unittest
+def test_minimum_fraction_keeps_a_share_of_the_fallback():
+    policy = TimeoutPolicy(min_samples=1, minimum_fraction=0.25)
+    policy.observe(0x02, 5.0)
+    assert policy.allowance_ms(0x02, 500.0) == 125.0
+
+    with pytest.raises(ValueError):
+        TimeoutPolicy(minimum_fraction=1.5)
+
+
+@pytest.mark.unittest
+def test_allowance_covers_high_percentile_and_deviation():
+    policy = TimeoutPolicy(minimum_allowance_ms=1.0, percentile=0.95)
+    samples = [10.0] * 19 + [200.0]
+    for sample in samples:
+        policy.observe(0x10, sample + 30.0, wire_ms=30.0)
+
+    allowance = policy.allowance_ms(0x10, 500.0)
+    assert allowance >= 10.0
+    assert allowance < 500.0
+
+    for sample in [100.0] * 20:
+        policy.observe(0x10, sample)
+    assert policy.allowance_ms(0x10, 500.0) >= 100.0
+
+
+@pytest.mark.unittest
+def test_timeouts_back_off_until_a_response():
+    policy = TimeoutPolicy(max_backoff=2, maximum_allowance_ms=1500.0)
+    policy.timed_out(0x02)
+    assert policy.allowance_ms(0x02, 500.0) == 1000.0
+    policy.timed_out(0x02)
+    policy.timed_out(0x02)
+    assert policy.allowance_ms(0x02, 500.0) == 1500.0
+
+    policy.observe(0x02, 20.0)
+    assert policy.allowance_ms(0x02, 500.0) == 500.0
@@ -0,0 +1,107 @@
+import asyncio
+import io
+
+import pytest
+
+from labbench_comm.protocols.bus_central import BusCentral
+from labbench_comm.protocols.frame import Frame
+from labbench_comm.protocols.functions.ping import Ping
+from labbench_comm.protocols.packet import Packet
+from labbench_comm.protocols.tracing import (
+    BinaryFileSink,
+    RingBufferSink,
+    TraceEvent,
+    TraceRecord,
+    read_trace,
+)
+
+
+@pytest.mark.unittest
+def test_ring_buffer_keeps_the_most_recent_records():
+    sink = RingBufferSink(capacity=3)
+    for i in range(5):
+        sink.emit(1000 + i, TraceEvent.PACKET_DECODED, i, 0, 10 * i)
+
+    assert sink.emitted == 5
+    assert [r.code for r in sink.records()] == [2, 3, 4]
+    assert sink.records()[0] == TraceRecord(
+        1002, TraceEvent.PACKET_DECODED, 2, 0, 20
+    )
+
+    sink.clear()
+    assert sink.records() == []
+
+
+@pytest.mark.unittest
+def test_binary_file_round_trip(tmp_path):
+    path = tmp_path / "session.trace"
+    with BinaryFileSink(path, buffer_records=2) as sink:
+        for i in range(5):
+            sink.emit(2**40 + i, TraceEvent.REQUEST_WRITTEN, 0x10, 3, 70000)
+
+    records = list(read_trace(path))
+    assert len(records) == 5
+    assert records[-1] == TraceRecord(
+        2**40 + 4, TraceEvent.REQUEST_WRITTEN, 0x10, 3, 70000
+    )
+
+    with pytest.raises(ValueError):
+        list(read_trace(io.BytesIO(b"not a trace")))
+
+
+class TracedConnection:
+    def __init__(self) -> None:
+        self.destuffer = None
+        self.tracer = None
+
+    def attach_destuffer(self, destuffer) -> None:
+        self.destuffer = destuffer
+
+    @property
+    def is_open(self) -> bool:
+        return True
+
+    async def write_bytes(self, data) -> None:
+        response = Packet(data[2], 4)
+        asyncio.get_running_loop().call_soon(
+            self.destuffer.add_bytes, Frame.encode(response.to_bytes())
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_bus_traces_a_request_from_write_to_dispatch():
+    connection = TracedConnection()
+    central = BusCentral(connection)
+    sink = RingBufferSink()
+    central.set_tracer(sink)
+    assert connection.tracer is sink
+
+    await central.execute(Ping())
+
+    class Listener:
+        def on_printf_message(self, message) -> None:
+            pass
+
+    from labbench_comm.protocols.messages.printf_message import PrintfMessage
+
+    central.add_message(PrintfMessage())
+    central.message_listener = Listener()
+    connection.destuffer.add_bytes(Frame.encode(bytes([0xFF, 0])))
+
+    records = sink.records()
+    assert [(r.event, r.code) for r in records] == [
+        (TraceEvent.REQUEST_WRITTEN, 0x02),
+        (TraceEvent.FRAME_COMPLETE, 0x02),
+        (TraceEvent.PACKET_DECODED, 0x02),
+        (TraceEvent.RESPONSE_MATCHED, 0x02),
+        (TraceEvent.FRAME_COMPLETE, 0xFF),
+        (TraceEvent.PACKET_DECODED, 0xFF),
+        (TraceEvent.MESSAGE_DISPATCHED, 0xFF),
+    ]
+    timestamps = [r.timestamp_ns for r in records]
+    assert timestamps == sorted(timestamps)
+
+    central.set_tracer(None)
+    connection.destuffer.add_bytes(Frame.encode(bytes([0xFF, 0])))
+    assert sink.emitted == len(records)
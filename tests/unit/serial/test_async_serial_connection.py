@@ -1,9 +1,15 @@
 import pytest
 import asyncio
+import os
+import sys
 
 from labbench_comm.protocols.destuffer import Destuffer
+from labbench_comm.protocols.exceptions import SerialConnectionError
 from labbench_comm.protocols.frame import Frame
-from labbench_comm.serial.async_serial_connection import AsyncSerialConnection
+from labbench_comm.serial.async_serial_connection import (
+    AsyncSerialConnection,
+    ReaderMode,
+)
 from labbench_comm.serial.base import SerialIO
 
 
@@ -76,3 +82,292 @@ async def test_reader_cancellation():
     await conn.close()
 
     assert not conn.is_open
+
+
+class PipeSerialIO(FakeSerialIO):
+    """
+    SerialIO backed by OS pipes, so it has a fileno() and write_fileno().
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._r, self._w = os.pipe()
+        os.set_blocking(self._r, False)
+        self._tx_r, self._tx_w = os.pipe()
+        os.set_blocking(self._tx_r, False)
+        os.set_blocking(self._tx_w, False)
+
+    def fileno(self):
+        return self._r if self._open else None
+
+    def write_fileno(self):
+        return self._tx_w if self._open else None
+
+    def read_tx(self) -> bytes:
+        data = bytearray()
+        while True:
+            try:
+                chunk = os.read(self._tx_r, 65536)
+            except BlockingIOError:
+                return bytes(data)
+            if not chunk:
+                return bytes(data)
+            data += chunk
+
+    def read_nonblocking(self, max_bytes: int):
+        try:
+            data = os.read(self._r, max_bytes)
+        except BlockingIOError:
+            return 0, b""
+        return len(data), data
+
+    def inject_rx(self, data: bytes):
+        os.write(self._w, data)
+
+    def dispose(self):
+        for fd in (self._r, self._w, self._tx_r, self._tx_w):
+            os.close(fd)
+
+
+def _connection(serial, mode=ReaderMode.AUTO, native_writes=False):
+    conn = AsyncSerialConnection(
+        serial, reader_mode=mode, native_writes=native_writes
+    )
+    received = []
+    destuffer = Destuffer()
+    destuffer.on_receive(lambda _, frame: received.append(frame))
+    conn.attach_destuffer(destuffer)
+    return conn, received
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+@pytest.mark.skipif(sys.platform == "win32", reason="add_reader needs a selector loop")
+async def test_event_reader_drains_descriptor():
+    serial = PipeSerialIO()
+    conn, received = _connection(serial)
+    try:
+        await conn.open()
+        assert conn.reader_mode is ReaderMode.EVENT
+
+        frames = [bytes([i]) * 3000 for i in range(1, 4)]
+        serial.inject_rx(b"".join(Frame.encode(f) for f in frames))
+        await asyncio.sleep(0.01)
+
+        assert received == frames
+
+        await conn.close()
+        assert conn.reader_mode is None
+    finally:
+        serial.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+@pytest.mark.skipif(sys.platform == "win32", reason="add_reader needs a selector loop")
+async def test_event_reader_falls_back_to_polling_on_empty_wakeups():
+    serial = PipeSerialIO()
+    conn, received = _connection(serial)
+    try:
+        await conn.open()
+        for _ in range(AsyncSerialConnection.MAX_EMPTY_WAKEUPS):
+            conn._on_readable()
+
+        assert conn.reader_mode is ReaderMode.POLL
+
+        serial.inject_rx(Frame.encode(b"\x01\x02"))
+        await asyncio.sleep(0.01)
+        assert received == [b"\x01\x02"]
+
+        await conn.close()
+    finally:
+        serial.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_reader_mode_without_fileno():
+    conn, _ = _connection(FakeSerialIO())
+    await conn.open()
+    assert conn.reader_mode is ReaderMode.POLL
+    await conn.close()
+
+    serial = FakeSerialIO()
+    conn, _ = _connection(serial, ReaderMode.EVENT)
+    with pytest.raises(RuntimeError):
+        await conn.open()
+    assert not serial.is_open
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+@pytest.mark.skipif(sys.platform == "win32", reason="add_writer needs a selector loop")
+async def test_native_writes_coalesce_frames(monkeypatch):
+    from labbench_comm.serial import async_serial_connection as module
+
+    serial = PipeSerialIO()
+    conn, _ = _connection(serial, native_writes=True)
+    writes = []
+    real_write = os.write
+
+    def counting_write(fd, data):
+        writes.append(len(data))
+        return real_write(fd, data)
+
+    monkeypatch.setattr(module.os, "write", counting_write)
+    try:
+        await conn.open()
+        assert conn.native_writes_active
+
+        frames = [Frame.encode(bytes([i, i])) for i in range(5)]
+        for frame in frames:
+            await conn.write_bytes(memoryview(frame))
+        assert conn.queued_bytes == sum(len(f) for f in frames)
+
+        await conn.drain()
+
+        assert conn.queued_bytes == 0
+        assert writes == [sum(len(f) for f in frames)]
+        assert serial.read_tx() == b"".join(frames)
+
+        await conn.close()
+    finally:
+        serial.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+@pytest.mark.skipif(sys.platform == "win32", reason="add_writer needs a selector loop")
+async def test_native_writes_apply_backpressure():
+    serial = PipeSerialIO()
+    conn, _ = _connection(serial, native_writes=True)
+    try:
+        await conn.open()
+        conn.write_high_water = 1024
+        conn.write_low_water = 0
+
+        # More than the pipe can take, so the writer has to wait for EAGAIN
+        payload = bytes(range(256)) * 1024
+        writer = asyncio.create_task(conn.write_bytes(payload))
+        await asyncio.sleep(0.01)
+
+        assert not writer.done()
+        assert conn.queued_bytes > 0
+
+        received = bytearray()
+        while not writer.done():
+            received += serial.read_tx()
+            await asyncio.sleep(0)
+        received += serial.read_tx()
+
+        await writer
+        assert bytes(received) == payload
+
+        await conn.close()
+    finally:
+        serial.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+@pytest.mark.skipif(sys.platform == "win32", reason="add_reader needs a selector loop")
+@pytest.mark.parametrize("mode", [ReaderMode.EVENT, ReaderMode.POLL])
+async def test_read_error_fails_pending_writes(mode):
+    serial = PipeSerialIO()
+    conn, _ = _connection(serial, mode, native_writes=True)
+    try:
+        await conn.open()
+        conn.write_high_water = 1024
+
+        # More than the pipe can take, and nobody reads it
+        writer = asyncio.create_task(conn.write_bytes(bytes(1 << 20)))
+        await asyncio.sleep(0.01)
+        assert not writer.done()
+
+        def broken_read(max_bytes):
+            raise OSError("device disconnected")
+
+        serial.read_nonblocking = broken_read
+        serial.inject_rx(b"\x01")
+
+        with pytest.raises(SerialConnectionError):
+            await asyncio.wait_for(writer, 1.0)
+        assert not conn.is_open
+        assert not conn.native_writes_active
+        assert conn.queued_bytes == 0
+
+        if mode is ReaderMode.POLL:
+            with pytest.raises(OSError):
+                await conn._reader_task
+        await conn.close()
+    finally:
+        serial.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_threaded_writes_without_write_fileno():
+    serial = FakeSerialIO()
+    conn, _ = _connection(serial)
+    await conn.open()
+
+    assert not conn.native_writes_active
+    await conn.write_bytes(b"\x01\x02", drain=True)
+
+    assert bytes(serial._tx) == b"\x01\x02"
+    assert conn.queued_bytes == 0
+    await conn.close()
+
+    # Native writes are opt-in, even where a write_fileno() is available
+    serial = PipeSerialIO()
+    conn, _ = _connection(serial)
+    try:
+        await conn.open()
+        assert not conn.native_writes_active
+        await conn.close()
+    finally:
+        serial.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+@pytest.mark.skipif(sys.platform == "win32", reason="add_reader needs a selector loop")
+@pytest.mark.parametrize("mode", [ReaderMode.EVENT, ReaderMode.POLL])
+async def test_pause_reading_holds_data_until_resumed(mode):
+    serial = PipeSerialIO()
+    conn, received = _connection(serial, mode)
+    try:
+        await conn.open()
+        conn.pause_reading()
+        assert conn.reading_paused
+
+        serial.inject_rx(Frame.encode(b"\x01\x02"))
+        await asyncio.sleep(0.01)
+        assert received == []
+
+        conn.resume_reading()
+        await asyncio.sleep(0.01)
+        assert received == [b"\x01\x02"]
+
+        await conn.close()
+    finally:
+        serial.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unittest
+async def test_link_counts_wire_bytes_in_both_directions():
+    serial = FakeSerialIO()
+    conn, received = _connection(serial)
+    await conn.open()
+
+    frame = Frame.encode(b"\xff\x01")
+    await conn.write_bytes(frame)
+    serial.inject_rx(frame)
+    await asyncio.sleep(0.01)
+
+    assert received == [b"\xff\x01"]
+    assert conn.link.bytes_sent == conn.link.bytes_received == len(frame) == 7
+    sent, rx = conn.link.rates()
+    assert sent == rx == 7.0
+    await conn.close()
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from labbench_comm.utils.additive_checksum import AdditiveChecksum, additive_checksum
+from labbench_comm.utils.crc8_ccitt import Crc8, _update_crc8_ccitt, crc8_ccitt
+
+
+def _reference_crc8(data: bytes) -> int:
+    crc = 0x00
+    for value in data:
+        crc = _update_crc8_ccitt(crc, value)
+    return crc
+
+
+def _random_blocks(count: int = 50):
+    rng = random.Random(7)
+    return [bytes(rng.randrange(256) for _ in range(rng.randint(0, 300))) for _ in range(count)]
+
+
+@pytest.mark.unittest
+def test_crc8_ccitt_check_value():
+    assert crc8_ccitt(b"123456789") == 0xF4
+
+
+@pytest.mark.unittest
+def test_crc8_table_matches_bitwise_reference():
+    for block in _random_blocks():
+        assert crc8_ccitt(block) == _reference_crc8(block)
+
+
+@pytest.mark.unittest
+def test_crc8_length_and_buffer_types():
+    data = bytes(range(200))
+
+    assert crc8_ccitt(data, 10) == crc8_ccitt(data[:10])
+    assert crc8_ccitt(bytearray(data)) == crc8_ccitt(data)
+    assert crc8_ccitt(memoryview(data)[5:50]) == crc8_ccitt(data[5:50])
+    assert crc8_ccitt(None) == 0
+
+
+@pytest.mark.unittest
+def test_incremental_crc8_matches_one_shot():
+    for block in _random_blocks():
+        crc = Crc8()
+        split = len(block) // 3
+        crc.update(block[:split]).update(memoryview(block)[split:-1])
+        if block:
+            crc.update_byte(block[-1])
+        assert crc.digest() == crc8_ccitt(block)
+
+
+@pytest.mark.unittest
+def test_additive_checksum_matches_bytewise_sum():
+    for block in _random_blocks():
+        expected = 0
+        for value in block:
+            expected = (expected + value) & 0xFF
+
+        assert additive_checksum(block) == expected
+        assert additive_checksum(block, len(block) // 2) == additive_checksum(block[: len(block) // 2])
+
+        checksum = AdditiveChecksum()
+        checksum.update(block[:7]).update(block[7:])
+        assert checksum.digest() == expected
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""
+Benchmark of columnar batch decoding against per-message objects.
+
+Extracts value and voltage columns from a run of LIO SignalMessage
+payloads, once by building a SignalMessage per payload and once with
+BatchDecoder (one np.frombuffer plus vectorized derived columns).
+Requires NumPy.
+
+To run:
+python tools/benchmarks/batch_decode.py
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from labbench_comm.devices.lio.messages import SignalMessage
+from labbench_comm.protocols.batch import BatchDecoder
+from labbench_comm.protocols.packet import Packet
+
+
+def make_packets(count: int) -> list[Packet]:
+    rng = random.Random(1)
+    packets = []
+    for _ in range(count):
+        packet = Packet(0x90, 21)
+        packet.insert_uint16(3, rng.randrange(1024))
+        packet.insert_int32(5, 4096)
+        packet.insert_uint16(13, 1023)
+        packets.append(packet)
+    return packets
+
+
+def per_message(packets: list[Packet]) -> None:
+    values = []
+    voltages = []
+    for packet in packets:
+        message = SignalMessage(packet)
+        message.on_received()
+        values.append(message.value)
+        voltages.append(message.voltage)
+
+
+def batched(decoder: BatchDecoder, payloads: bytes) -> None:
+    columns = decoder.decode_columns(payloads)
+    columns["value"]
+    columns["voltage"]
+
+
+def best_of(fn, *args, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    decoder = BatchDecoder(SignalMessage)
+
+    for count in (100, 1_000, 10_000):
+        packets = make_packets(count)
+        payloads = b"".join(p.payload for p in packets)
+
+        objects = best_of(per_message, packets)
+        columns = best_of(batched, decoder, payloads)
+
+        print(
+            f"{count:6d} messages: "
+            f"per-message {objects * 1e3:8.2f} ms, "
+            f"batch {columns * 1e3:6.2f} ms "
+            f"({objects / columns:6.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""
+Benchmark of BusCentral.execute_many against one execute per function.
+
+A pty pair stands in for the serial port, with a responder on the master
+side answering Ping requests (see serial_reader.py). The same number of
+Pings is executed one at a time and in batches written as a single
+transmission, with threaded and native (queued os.write) writes. POSIX only.
+
+To run:
+python tools/benchmarks/batch_execute.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+
+from labbench_comm.protocols.bus_central import BusCentral
+from labbench_comm.protocols.functions.ping import Ping
+from labbench_comm.serial.async_serial_connection import AsyncSerialConnection
+from labbench_comm.serial.connection import PySerialIO
+
+from serial_reader import PingResponder
+
+FUNCTIONS = 2000
+BATCH_SIZES = (1, 8, 32)
+
+
+async def run(native_writes: bool, batch_size: int) -> float:
+    master, slave = os.openpty()
+    loop = asyncio.get_running_loop()
+    responder = PingResponder(master)
+    responder.start(loop)
+
+    serial_io = PySerialIO(os.ttyname(slave), baudrate=115200, dtr=False)
+    connection = AsyncSerialConnection(serial_io, native_writes=native_writes)
+    central = BusCentral(connection)
+
+    try:
+        await central.open()
+
+        start = time.perf_counter()
+        for _ in range(FUNCTIONS // batch_size):
+            if batch_size == 1:
+                await central.execute(Ping())
+            else:
+                results = await central.execute_many(
+                    [Ping() for _ in range(batch_size)]
+                )
+                assert not any(results), results
+        return (time.perf_counter() - start) / FUNCTIONS
+
+    finally:
+        await central.close()
+        responder.stop(loop)
+        os.close(master)
+        os.close(slave)
+
+
+async def main() -> None:
+    for native_writes in (False, True):
+        writes = "native" if native_writes else "thread"
+        baseline = None
+        for batch_size in BATCH_SIZES:
+            per_function = await run(native_writes, batch_size)
+            baseline = baseline or per_function
+            label = "execute" if batch_size == 1 else f"execute_many({batch_size})"
+            print(
+                f"{writes:6s} writes, {label:16s}: "
+                f"{per_function * 1e6:7.1f} us/function "
+                f"({baseline / per_function:4.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of the packet checksum implementations.
+
+Compares the table-driven CRC-8-CCITT and the sum()-based additive
+checksum with the previous byte-at-a-time implementations, on payload
+sizes ranging from a status message to a full SetWaveform upload.
+
+To run:
+python tools/benchmarks/checksums.py
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+
+from labbench_comm.utils.additive_checksum import additive_checksum
+from labbench_comm.utils.crc8_ccitt import Crc8, _update_crc8_ccitt, crc8_ccitt
+
+
+def legacy_crc8_ccitt(data: bytes) -> int:
+    crc = 0x00
+    for i in range(len(data)):
+        crc = _update_crc8_ccitt(crc, data[i])
+    return crc & 0xFF
+
+
+def legacy_additive_checksum(data: bytes) -> int:
+    checksum = 0x00
+    for i in range(len(data)):
+        checksum = (checksum + data[i]) & 0xFF
+    return checksum
+
+
+def incremental_crc8(data: bytes) -> int:
+    crc = Crc8()
+    view = memoryview(data)
+    for pos in range(0, len(data), 64):
+        crc.update(view[pos : pos + 64])
+    return crc.digest()
+
+
+def measure(fn, data: bytes) -> float:
+    timer = timeit.Timer(lambda: fn(data))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main() -> None:
+    rng = random.Random(1)
+
+    candidates = (
+        ("crc8 legacy", legacy_crc8_ccitt),
+        ("crc8 table", crc8_ccitt),
+        ("crc8 incremental", incremental_crc8),
+        ("additive legacy", legacy_additive_checksum),
+        ("additive sum()", additive_checksum),
+    )
+
+    for size in (22, 256, 2006):
+        data = bytes(rng.randrange(256) for _ in range(size))
+        print(f"\nPayload {size} bytes")
+
+        baseline = {}
+        for name, fn in candidates:
+            elapsed = measure(fn, data)
+            family = name.split()[0]
+            baseline.setdefault(family, elapsed)
+            speedup = baseline[family] / elapsed
+            print(f"  {name:>18}: {elapsed * 1e6:9.2f} us  ({speedup:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+Benchmark Destuffer throughput on mixed device traffic.
+
+The stream mixes CPAR+ status messages (22 byte payloads at 20 Hz) with
+LIO SetWaveform uploads (CRC protected, up to 2 KB) and is fed to the
+destuffer in 1024-byte chunks, the same size the serial reader delivers.
+
+Two paths are compared:
+- byte-wise: every byte through Destuffer.add_byte()
+- chunked:   each chunk through Destuffer.add_bytes()
+
+To run:
+python tools/benchmarks/destuffer_throughput.py
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from labbench_comm.protocols.destuffer import Destuffer
+from labbench_comm.protocols.frame import Frame
+from labbench_comm.protocols.packet import ChecksumAlgorithmType, Packet
+
+
+CHUNK_SIZE = 1024
+
+
+def build_stream(seed: int = 42) -> bytes:
+    rng = random.Random(seed)
+    stream = bytearray()
+
+    for n in range(400):
+        status = Packet(0x80, 22)
+        for i in range(22):
+            status.insert_byte(i, rng.randrange(256))
+        stream += Frame.encode(status.to_bytes())
+
+        if n % 20 == 0:
+            samples = rng.randint(100, 1000)
+            waveform = Packet(0x15, samples * 2, ChecksumAlgorithmType.CRC8CCITT)
+            for i in range(samples):
+                waveform.insert_int16(2 * i, rng.randint(-4095, 4095))
+            stream += Frame.encode(waveform.to_bytes())
+
+    return bytes(stream)
+
+
+def chunks(stream: bytes) -> list[bytes]:
+    return [stream[i : i + CHUNK_SIZE] for i in range(0, len(stream), CHUNK_SIZE)]
+
+
+def run_bytewise(data: list[bytes]) -> int:
+    frames = 0
+
+    def count(_, __) -> None:
+        nonlocal frames
+        frames += 1
+
+    destuffer = Destuffer()
+    destuffer.on_receive(count)
+    for chunk in data:
+        for b in chunk:
+            destuffer.add_byte(b)
+    return frames
+
+
+def run_chunked(data: list[bytes]) -> int:
+    frames = 0
+
+    def count(_, __) -> None:
+        nonlocal frames
+        frames += 1
+
+    destuffer = Destuffer()
+    destuffer.on_receive(count)
+    for chunk in data:
+        destuffer.add_bytes(chunk)
+    return frames
+
+
+def measure(fn, data: list[bytes], repeat: int = 5) -> tuple[float, int]:
+    best = float("inf")
+    frames = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        frames = fn(data)
+        best = min(best, time.perf_counter() - start)
+    return best, frames
+
+
+def main() -> None:
+    stream = build_stream()
+    data = chunks(stream)
+
+    print(f"Stream: {len(stream)} bytes in {len(data)} chunks of {CHUNK_SIZE} bytes")
+
+    results = {}
+    for name, fn in (("byte-wise", run_bytewise), ("chunked", run_chunked)):
+        elapsed, frames = measure(fn, data)
+        results[name] = elapsed
+        rate = len(stream) / elapsed / 1e6
+        print(f"{name:>10}: {frames} frames, {elapsed * 1000:8.2f} ms, {rate:8.2f} MB/s")
+
+    print(f"   speedup: {results['byte-wise'] / results['chunked']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
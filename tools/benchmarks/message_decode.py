@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of status message decoding.
+
+Reads every field CPARplusCentral.on_status_message uses from a CPAR
+StatusMessage, comparing the LAYOUT-generated properties (one
+``unpack_from`` per message) and the decoded CPARplusStatus record
+(``message.status``, what the central reads) with the previous
+handwritten properties, which issued one ``packet.get_*`` call per field
+access.
+
+To run:
+python tools/benchmarks/message_decode.py
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from labbench_comm.devices.cpar.codec import CPARplusCodec
+from labbench_comm.devices.cpar.definitions import DeviceState
+from labbench_comm.devices.cpar.messages import StatusMessage
+from labbench_comm.protocols.packet import Packet
+
+
+class LegacyStatusMessage:
+    """
+    The per-field accessors StatusMessage used before LAYOUT.
+    """
+
+    def __init__(self, packet: Packet) -> None:
+        self.packet = packet
+
+    def _pressure(self, pos: int) -> float:
+        return CPARplusCodec.binary_to_pressure(
+            self.packet.get_uint16(pos),
+            CPARplusCodec.PressureType.STIMULATING_PRESSURE,
+        )
+
+    @property
+    def system_state(self) -> DeviceState:
+        return DeviceState(self.packet.get_byte(0) + 1)
+
+    @property
+    def vas_connected(self) -> bool:
+        return (self.packet.get_byte(1) & 0x01) != 0
+
+    @property
+    def vas_is_low(self) -> bool:
+        return (self.packet.get_byte(1) & 0x02) != 0
+
+    @property
+    def vas_score(self) -> float:
+        return CPARplusCodec.binary_to_score(self.packet.get_byte(5))
+
+    @property
+    def final_vas_score(self) -> float:
+        return CPARplusCodec.binary_to_score(self.packet.get_byte(6))
+
+    actual_pressure_01 = property(lambda self: self._pressure(9))
+    actual_pressure_02 = property(lambda self: self._pressure(11))
+    target_pressure_01 = property(lambda self: self._pressure(13))
+    target_pressure_02 = property(lambda self: self._pressure(15))
+    final_pressure_01 = property(lambda self: self._pressure(17))
+    final_pressure_02 = property(lambda self: self._pressure(19))
+
+
+def read_all(message) -> None:
+    message.actual_pressure_01
+    message.target_pressure_01
+    message.final_pressure_01
+    message.actual_pressure_02
+    message.target_pressure_02
+    message.final_pressure_02
+    message.vas_connected
+    message.vas_is_low
+    message.vas_score
+    message.final_vas_score
+    message.system_state
+
+
+def legacy(packet: Packet) -> None:
+    read_all(LegacyStatusMessage(packet))
+
+
+def layout(packet: Packet) -> None:
+    read_all(StatusMessage(packet))
+
+
+def status(packet: Packet) -> None:
+    read_all(StatusMessage(packet).status)
+
+
+def measure(fn, packet: Packet) -> float:
+    timer = timeit.Timer(lambda: fn(packet))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=9, number=number)) / number
+
+
+def main() -> None:
+    packet = Packet(0x80, 22)
+    for i in range(1, 22):
+        packet.insert_byte(i, (i * 37) & 0xFF)
+    packet.insert_byte(0, 1)
+    packet.insert_byte(4, 0)
+
+    baseline = measure(legacy, packet)
+    compiled = measure(layout, packet)
+    record = measure(status, packet)
+
+    print(f"per-field reads : {baseline * 1e6:8.2f} us/message")
+    print(f"one-shot decode : {compiled * 1e6:8.2f} us/message")
+    print(f"status record   : {record * 1e6:8.2f} us/message")
+    print(f"speedup         : {baseline / compiled:8.2f}x (properties), "
+          f"{baseline / record:.2f}x (status record)")
+
+
+if __name__ == "__main__":
+    main()
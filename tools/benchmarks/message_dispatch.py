@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of unsolicited message dispatch.
+
+Measures the cost per message of BusCentral dispatching a received LIO or
+CPAR message to a listener, with the precomputed dispatch table, against
+the previous path: a lambda creating the message, on_received, and (for
+LIO) a regex on the class name plus hasattr/getattr on every message.
+Handlers are empty, so only dispatch is measured. Codes the listener has
+no handler for are measured too; the table skips them without building
+a message.
+
+To run:
+python tools/benchmarks/message_dispatch.py
+"""
+
+from __future__ import annotations
+
+import re
+import timeit
+
+from labbench_comm.devices.cpar import messages as cpar
+from labbench_comm.devices.lio import messages as lio
+from labbench_comm.protocols.bus_central import BusCentral
+from labbench_comm.protocols.message_dispatcher import MessageDispatcher
+from labbench_comm.protocols.packet import Packet
+
+NUMBER = 100_000
+
+
+class NullConnection:
+    def attach_destuffer(self, destuffer) -> None:
+        pass
+
+
+class Listener:
+    def on_signal_message(self, message) -> None:
+        pass
+
+    def on_status_message(self, message) -> None:
+        pass
+
+
+def _legacy_handler_name(message_name: str) -> str:
+    stem = message_name.removesuffix("Message")
+    snake = re.sub(r"(?<!^)(?=[A-Z])", "_", stem).lower()
+    return f"on_{snake}_message"
+
+
+def _legacy_lio_dispatch(msg, listener) -> None:
+    handler_name = _legacy_handler_name(msg.__class__.__name__)
+    if hasattr(listener, handler_name):
+        getattr(listener, handler_name)(msg)
+
+
+def _legacy_cpar_dispatch(msg, listener) -> None:
+    if hasattr(listener, msg.HANDLER_NAME):
+        getattr(listener, msg.HANDLER_NAME)(msg)
+
+
+class LegacyBusCentral(BusCentral):
+    """
+    BusCentral with the previous per-message dispatch path.
+    """
+
+    def add_legacy_message(self, message_type, dispatch) -> None:
+        self._dispatchers[message_type().code] = (
+            MessageDispatcher(message_type().code, lambda p: message_type(p)),
+            dispatch,
+        )
+
+    def _dispatch_message(self, packet: Packet) -> None:
+        listeners = self._packet_listeners.get(packet.code)
+        if listeners:
+            for callback in listeners:
+                callback(packet)
+            if packet.code in self._exclusive_codes:
+                return
+
+        entry = self._dispatchers.get(packet.code)
+        if entry is None or self.message_listener is None:
+            return
+
+        dispatcher, dispatch = entry
+        msg = dispatcher.create(packet)
+        dispatch(msg, self.message_listener)
+
+
+def _time(function) -> float:
+    return min(timeit.repeat(function, number=NUMBER, repeat=5)) / NUMBER
+
+
+def main() -> None:
+    listener = Listener()
+    central = BusCentral(NullConnection())
+    central.message_listener = listener
+    legacy = LegacyBusCentral(NullConnection())
+    legacy.message_listener = listener
+
+    cases = (
+        ("LIO SignalMessage", lio.SignalMessage, _legacy_lio_dispatch),
+        ("LIO ThresholdMessage (no handler)", lio.ThresholdMessage, _legacy_lio_dispatch),
+        ("CPAR StatusMessage", cpar.StatusMessage, _legacy_cpar_dispatch),
+        ("CPAR EventMessage (no handler)", cpar.EventMessage, _legacy_cpar_dispatch),
+    )
+    for _, message_type, dispatch in cases:
+        central.add_message(message_type())
+        legacy.add_legacy_message(message_type, dispatch)
+
+    for name, message_type, _ in cases:
+        packet = message_type().packet
+        legacy_time = _time(lambda: legacy._dispatch_message(packet))
+        table_time = _time(lambda: central._dispatch_message(packet))
+        print(
+            f"{name:36s}: legacy {legacy_time * 1e6:6.2f} us, "
+            f"table {table_time * 1e6:6.2f} us "
+            f"({legacy_time / table_time:5.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""
+Benchmark of the CPAR pressure-profile compiler.
+
+Compiles a protocol library of twelve 5 minute profiles (one hour of
+stimulation at 100 Hz: ramps, plateaus, sinusoids and step series) and
+reports the time per profile and per hour of profile, the program
+lengths and the achieved errors.
+
+To run:
+python tools/benchmarks/profile_compile.py
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from labbench_comm.devices.cpar.profile_compiler import ProfileCompiler
+
+RATE = 100.0
+SECONDS = 300.0
+
+
+def library() -> list:
+    t = np.arange(int(SECONDS * RATE)) / RATE
+    profiles = []
+    for i in range(12):
+        period = 20.0 + 5.0 * i
+        ramp = np.minimum(t * (0.5 + i / 10.0), 60.0)
+        if i % 3 == 0:
+            curve = ramp
+        elif i % 3 == 1:
+            curve = 40.0 + 15.0 * np.sin(2 * np.pi * t / period)
+        else:
+            curve = 10.0 * (1 + np.floor(t / period) % 6)
+        profiles.append(curve)
+    return profiles
+
+
+def main() -> None:
+    profiles = library()
+
+    for tolerance in (0.1, 0.5, 1.0):
+        compiler = ProfileCompiler(tolerance=tolerance)
+        best = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            compiled = [compiler.compile(p) for p in profiles]
+            best = min(best, time.perf_counter() - start)
+
+        lengths = [len(c) for c in compiled]
+        worst = max(c.max_error for c in compiled)
+        print(
+            f"tolerance {tolerance:4.2f} kPa: {best * 1e3:7.1f} ms per hour "
+            f"({best / len(profiles) * 1e3:5.2f} ms/profile), "
+            f"{min(lengths)}-{max(lengths)} instructions, "
+            f"max error {worst:.3f} kPa"
+        )
+
+
+if __name__ == "__main__":
+    main()
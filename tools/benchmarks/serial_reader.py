@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+Benchmark of the AsyncSerialConnection reader modes over a pseudo-terminal.
+
+A pty pair stands in for the serial port: PySerialIO opens the slave side
+and a responder on the master side answers Ping requests. For each reader
+mode (POLL and EVENT), and for threaded and native (queued os.write)
+writes, the benchmark reports the CPU time used while the connection sits
+idle and the BusCentral.execute round-trip latency. POSIX only.
+
+To run:
+python tools/benchmarks/serial_reader.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import statistics
+import time
+
+from labbench_comm.protocols.bus_central import BusCentral
+from labbench_comm.protocols.destuffer import Destuffer
+from labbench_comm.protocols.frame import Frame
+from labbench_comm.protocols.functions.ping import Ping
+from labbench_comm.protocols.packet import Packet
+from labbench_comm.serial.async_serial_connection import (
+    AsyncSerialConnection,
+    ReaderMode,
+)
+from labbench_comm.serial.connection import PySerialIO
+
+IDLE_SECONDS = 2.0
+ROUND_TRIPS = 500
+
+
+class PingResponder:
+    """
+    Answers every request frame written to the slave side of the pty.
+    """
+
+    def __init__(self, master_fd: int) -> None:
+        self._fd = master_fd
+        self._requests = Destuffer()
+        self._requests.on_receive(self._on_request)
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        loop.add_reader(self._fd, self._on_readable)
+
+    def stop(self, loop: asyncio.AbstractEventLoop) -> None:
+        loop.remove_reader(self._fd)
+
+    def _on_readable(self) -> None:
+        self._requests.add_bytes(os.read(self._fd, 4096))
+
+    def _on_request(self, _, frame) -> None:
+        request = Packet.from_frame(frame)
+        response = Packet(request.code, 4)
+        response.insert_uint32(0, 1)
+        os.write(self._fd, Frame.encode(response.to_bytes()))
+
+
+async def run(mode: ReaderMode, native_writes: bool) -> tuple[float, list[float]]:
+    master, slave = os.openpty()
+    loop = asyncio.get_running_loop()
+    responder = PingResponder(master)
+    responder.start(loop)
+
+    serial_io = PySerialIO(os.ttyname(slave), baudrate=115200, dtr=False)
+    connection = AsyncSerialConnection(
+        serial_io, reader_mode=mode, native_writes=native_writes
+    )
+    central = BusCentral(connection)
+
+    try:
+        await central.open()
+
+        cpu = time.process_time()
+        await asyncio.sleep(IDLE_SECONDS)
+        idle_cpu = (time.process_time() - cpu) / IDLE_SECONDS
+
+        latencies = []
+        for _ in range(ROUND_TRIPS):
+            start = time.perf_counter()
+            await central.execute(Ping())
+            latencies.append(time.perf_counter() - start)
+
+        return idle_cpu, latencies
+
+    finally:
+        await central.close()
+        responder.stop(loop)
+        os.close(master)
+        os.close(slave)
+
+
+async def main() -> None:
+    configurations = (
+        (ReaderMode.POLL, False),
+        (ReaderMode.EVENT, False),
+        (ReaderMode.EVENT, True),
+    )
+    for mode, native_writes in configurations:
+        idle_cpu, latencies = await run(mode, native_writes)
+        latencies.sort()
+        p50 = statistics.median(latencies)
+        p99 = latencies[int(len(latencies) * 0.99) - 1]
+        writes = "native" if native_writes else "thread"
+        print(
+            f"{mode.name:5s} reader, {writes:6s} writes: "
+            f"idle CPU {idle_cpu * 100:5.1f}%, "
+            f"round trip p50 {p50 * 1e6:7.1f} us, p99 {p99 * 1e6:7.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of CPAR waveform program encoding and decoding.
+
+Compares a full 256-instruction SetWaveformProgram (serialize, on_send
+and on_slave_received) using InstructionCodec.encode_many/decode_many and
+Packet.insert_bytes against the previous per-instruction codec calls and
+per-byte packet access.
+
+To run:
+python tools/benchmarks/waveform_codec.py
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+
+from labbench_comm.devices.cpar.functions import SetWaveformProgram
+from labbench_comm.devices.cpar.instruction_codec import InstructionCodec
+from labbench_comm.devices.cpar.waveform import WaveformInstruction
+from labbench_comm.protocols.packet import Packet
+
+
+class LegacySetWaveformProgram(SetWaveformProgram):
+    def serialize_instructions(self) -> bytes:
+        encoded = bytearray()
+        for instr in self.instructions[: self.number_of_instructions]:
+            encoded.extend(InstructionCodec.encode(instr))
+        return bytes(encoded)
+
+    def on_send(self) -> None:
+        encoded = self.serialize_instructions()
+        self.set_request(Packet(self.code, length=len(encoded) + 2))
+        self.request.insert_byte(0, self.channel)
+        self.request.insert_byte(1, self.repeat)
+        for i, b in enumerate(encoded):
+            self.request.insert_byte(i + 2, b)
+
+    def on_slave_received(self) -> None:
+        self.instructions.clear()
+        offset = 2
+        count = (self.request.length - 2) // InstructionCodec.INSTRUCTIONS_LENGTH
+        for _ in range(count):
+            chunk = bytes(
+                self.request.get_byte(offset + i)
+                for i in range(InstructionCodec.INSTRUCTIONS_LENGTH)
+            )
+            self.instructions.append(InstructionCodec.decode(chunk))
+            offset += InstructionCodec.INSTRUCTIONS_LENGTH
+
+
+def program() -> list:
+    rng = random.Random(1)
+    instructions = []
+    for i in range(SetWaveformProgram.MAX_NO_OF_INSTRUCTIONS):
+        if i % 3 == 0:
+            instructions.append(WaveformInstruction.step(rng.uniform(0, 100), rng.uniform(0, 10)))
+        elif i % 3 == 1:
+            instructions.append(WaveformInstruction.increment(rng.uniform(0, 50), rng.uniform(0, 10)))
+        else:
+            instructions.append(WaveformInstruction.decrement(rng.uniform(0, 50), rng.uniform(0, 10)))
+    return instructions
+
+
+def measure(fn) -> float:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=7, number=number)) / number
+
+
+def main() -> None:
+    for name, cls in (("per-instruction", LegacySetWaveformProgram), ("batch", SetWaveformProgram)):
+        function = cls()
+        function.instructions = program()
+        function.on_send()
+        received = cls()
+        received.set_request(function.request)
+
+        print(
+            f"{name:16s}: serialize {measure(function.serialize_instructions) * 1e6:7.1f} us, "
+            f"on_send {measure(function.on_send) * 1e6:7.1f} us, "
+            f"on_slave_received {measure(received.on_slave_received) * 1e6:7.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
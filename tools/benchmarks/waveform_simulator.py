@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Benchmark of the CPAR waveform simulator.
+
+Simulates a batch of 2000 random candidate programs (64 instructions,
+about 30 s each) with WaveformSimulator.simulate_many, from instruction
+lists and from encoded buffers, and a tick-by-tick Python loop over the
+same programs for comparison.
+
+To run:
+python tools/benchmarks/waveform_simulator.py
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from labbench_comm.devices.cpar.definitions import WaveformInstructionType
+from labbench_comm.devices.cpar.instruction_codec import InstructionCodec
+from labbench_comm.devices.cpar.waveform import WaveformInstruction
+from labbench_comm.devices.cpar.waveform_simulator import WaveformSimulator
+
+PROGRAMS = 2000
+INSTRUCTIONS = 64
+
+
+def candidates() -> list:
+    rng = random.Random(1)
+    programs = []
+    for _ in range(PROGRAMS):
+        program = []
+        for i in range(INSTRUCTIONS):
+            if i % 4 == 0:
+                program.append(WaveformInstruction.step(rng.uniform(0, 80), rng.uniform(0, 1)))
+            elif i % 2:
+                program.append(WaveformInstruction.increment(rng.uniform(0, 20), rng.uniform(0, 1)))
+            else:
+                program.append(WaveformInstruction.decrement(rng.uniform(0, 20), rng.uniform(0, 1)))
+        programs.append(program)
+    return programs
+
+
+def step_by_step(program) -> list:
+    pressure = 0.0
+    ticks = []
+    for instruction in program:
+        count = int(instruction.time * InstructionCodec.UPDATE_RATE)
+        step = instruction.argument / InstructionCodec.UPDATE_RATE
+        for _ in range(count):
+            if instruction.operand is WaveformInstructionType.STEP:
+                pressure = instruction.argument
+            elif instruction.operand is WaveformInstructionType.INC:
+                pressure = min(pressure + step, InstructionCodec.MAX_PRESSURE)
+            else:
+                pressure = max(pressure - step, 0.0)
+            ticks.append(pressure)
+    return ticks
+
+
+def best(fn, repeat: int = 3) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    programs = candidates()
+    encoded = [InstructionCodec.encode_many(p) for p in programs]
+    simulator = WaveformSimulator()
+
+    batch = simulator.simulate_many(encoded)
+    ticks = int(batch.lengths.sum())
+
+    from_instructions = best(lambda: simulator.simulate_many(programs))
+    from_buffers = best(lambda: simulator.simulate_many(encoded))
+    loop = best(lambda: [step_by_step(p) for p in programs[:100]], 1) * PROGRAMS / 100
+
+    print(f"{PROGRAMS} programs, {ticks / 1e6:.1f} M ticks "
+          f"({ticks / PROGRAMS / InstructionCodec.UPDATE_RATE:.0f} s each)")
+    print(f"simulate_many (instructions): {from_instructions * 1e3:8.1f} ms")
+    print(f"simulate_many (encoded)     : {from_buffers * 1e3:8.1f} ms")
+    print(f"tick-by-tick Python loop    : {loop * 1e3:8.1f} ms (extrapolated)")
+
+
+if __name__ == "__main__":
+    main()